@@ -7,21 +7,20 @@
 '''
 This file defines the central game state using a dataclass called GameState. 
 It stores everything needed to describe the current game at any moment: 
-ship placement info, both players’ boards, shot tracking, ship coordinate lists, hit tracking, and turn management.
+ship placement info, the grid size, both players’ boards, shot tracking, ship coordinate lists, hit tracking, and turn management.
 There is no UI code and no rules logic here, by design — this makes the state reusable and easy to reason about. 
 The reset_for_new_game() method cleanly reinitializes all fields so a fresh game can start without restarting the app.
 '''
 
 from dataclasses import dataclass, field
-from typing import Optional, List, Tuple, Set
+from typing import Optional, Set
 
-# Constants used to track shot results on boards
-UNKNOWN = 0 # cell has not been shot yet
-MISS = 1 # shot missed
-HIT = 2 # shot hit the ship 
-
-# Coordinate type for board positions (row, column)
-Coord = Tuple[int, int]
+# Constants used to track shot results on boards + coordinate type (row, column)
+from game.bitboard import UNKNOWN, MISS, HIT, Coord, BitBoard, ShotBoard
+from game.board import GRID_SIZE, new_ship_board, new_shot_board
+from game.fleet import Fleet
+from game.record import GameRecord
+from game.stats import PlayerStats
 
 @dataclass
 class GameState:
@@ -33,33 +32,45 @@ class GameState:
     placing_ship_len: int = 1
     # Orientation of ship placement: "H" = horizontal, "V" = vertical
     placing_orientation: str = "H"
+    # Player number controlled by the computer (None = two human players)
+    ai_player: Optional[int] = None
+
+    # Board width/height for this game (boards are rebuilt at this size on reset)
+    grid_size: int = GRID_SIZE
 
-    # Player boards (10x10)
+    # Player boards (bitboards, or sparse boards on big grids; indexable as board[r][c])
     # boards: 0 empty, 1 ship
-    p1_board: List[List[int]] = field(default_factory=lambda: [[0] * 10 for _ in range(10)])
-    p2_board: List[List[int]] = field(default_factory=lambda: [[0] * 10 for _ in range(10)])
+    p1_board: BitBoard = field(default_factory=new_ship_board)
+    p2_board: BitBoard = field(default_factory=new_ship_board)
 
     # Which players turn it is in the battle
     current_turn: int = 1
 
     # outgoing shots (what I shot at opponent)
-    p1_shots: List[List[int]] = field(default_factory=lambda: [[0] * 10 for _ in range(10)])
-    p2_shots: List[List[int]] = field(default_factory=lambda: [[0] * 10 for _ in range(10)])
+    p1_shots: ShotBoard = field(default_factory=new_shot_board)
+    p2_shots: ShotBoard = field(default_factory=new_shot_board)
 
     # incoming shots (what opponent shot at me)
-    p1_incoming: List[List[int]] = field(default_factory=lambda: [[0] * 10 for _ in range(10)])
-    p2_incoming: List[List[int]] = field(default_factory=lambda: [[0] * 10 for _ in range(10)])
+    p1_incoming: ShotBoard = field(default_factory=new_shot_board)
+    p2_incoming: ShotBoard = field(default_factory=new_shot_board)
 
     # ships as coordinate lists (set later during placement)
-    # Ships stored as lists of coordinates
-    # Example: [(2,3), (2,4), (2,5)]
-    p1_ships: List[List[Coord]] = field(default_factory=list)
-    p2_ships: List[List[Coord]] = field(default_factory=list)
+    # Each ship is a list of coordinates, e.g. [(2,3), (2,4), (2,5)],
+    # held in a Fleet so shots can find the ship under a cell in O(1)
+    p1_ships: Fleet = field(default_factory=Fleet)
+    p2_ships: Fleet = field(default_factory=Fleet)
 
     # hit coords on each player’s ships
     p1_hits: Set[Coord] = field(default_factory=set)
     p2_hits: Set[Coord] = field(default_factory=set)
 
+    # running scoreboard per player (shots/hits/misses + own ships afloat), updated by fire_shot
+    p1_stats: PlayerStats = field(default_factory=PlayerStats)
+    p2_stats: PlayerStats = field(default_factory=PlayerStats)
+
+    # move history of the battle (placements + every shot), started when the battle begins
+    record: Optional[GameRecord] = None
+
     def reset_for_new_game(self) -> None:
         """
         Reset all game state back to defaults.
@@ -71,21 +82,28 @@ class GameState:
         self.placing_ship_len = 1
         self.placing_orientation = "H"
 
-        # Clear both players' boards
-        self.p1_board = [[0] * 10 for _ in range(10)]
-        self.p2_board = [[0] * 10 for _ in range(10)]
+        # Clear both players' boards (sized for this game's grid)
+        self.p1_board = new_ship_board(self.grid_size)
+        self.p2_board = new_ship_board(self.grid_size)
 
         # Reset battle turn to Player 1
         self.current_turn = 1
 
         # Clear shot tracking boards
-        self.p1_shots = [[0] * 10 for _ in range(10)]
-        self.p2_shots = [[0] * 10 for _ in range(10)]
-        self.p1_incoming = [[0] * 10 for _ in range(10)]
-        self.p2_incoming = [[0] * 10 for _ in range(10)]
+        self.p1_shots = new_shot_board(self.grid_size)
+        self.p2_shots = new_shot_board(self.grid_size)
+        self.p1_incoming = new_shot_board(self.grid_size)
+        self.p2_incoming = new_shot_board(self.grid_size)
 
          # Remove all ships and hit records
-        self.p1_ships = []
-        self.p2_ships = []
+        self.p1_ships = Fleet()
+        self.p2_ships = Fleet()
         self.p1_hits = set()
-        self.p2_hits = set()
\ No newline at end of file
+        self.p2_hits = set()
+
+        # Scoreboards start empty (rebuilt from the fleets when battle begins)
+        self.p1_stats = PlayerStats()
+        self.p2_stats = PlayerStats()
+
+        # No battle yet, so nothing recorded
+        self.record = None
\ No newline at end of file
@@ -0,0 +1,85 @@
+# net_client.py
+# Battleship Project - Online play connection for the Tk app
+# Created: 2026-10-17
+
+'''
+This file connects the Tk app to a game server (game/server.py) for online play.
+A daemon thread blocks on the socket and puts each received protocol line (as a list of words) on a queue;
+App drains that queue from an `after` poll on the Tk thread, the same hand-off the wallpaper worker uses,
+because Tk is not thread-safe. Sending is a single small sendall() from the Tk thread.
+When the connection drops, the reader thread queues ["CLOSED"] so the app can tell the player.
+'''
+
+import queue
+import socket
+import threading
+from typing import List, Optional
+
+from game.protocol import MAX_LINE, decode, encode
+
+CONNECT_TIMEOUT = 5.0  # Seconds to wait for the server when connecting
+
+
+class NetClient:
+    """One connection to a game server."""
+
+    def __init__(self, host: str, port: int):
+        self.host = host
+        self.port = port
+        self.number = 0  # Our player number on the server (1 or 2), known once matched
+        self._sock = socket.create_connection((host, port), timeout=CONNECT_TIMEOUT)  # Raises OSError
+        self._sock.settimeout(None)
+        self._sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)  # Moves are tiny: send them right away
+        self._messages: "queue.Queue" = queue.Queue()
+        self._closed = False
+        threading.Thread(target=self._read, name="net-client", daemon=True).start()
+
+    def send(self, *words) -> None:
+        if self._closed:
+            return
+        try:
+            self._sock.sendall(encode(*words))
+        except OSError:
+            self.close()
+            self._messages.put(["CLOSED"])
+
+    def poll(self) -> List[List[str]]:
+        """Messages received so far, without blocking (call from the Tk thread)."""
+        done = []
+        while True:
+            try:
+                done.append(self._messages.get_nowait())
+            except queue.Empty:
+                return done
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            self._sock.sendall(encode("QUIT"))
+        except OSError:
+            pass
+        try:
+            self._sock.close()
+        except OSError:
+            pass
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def _read(self) -> None:
+        stream = self._sock.makefile("rb")
+        try:
+            while True:
+                line: Optional[bytes] = stream.readline(MAX_LINE)
+                if not line:
+                    break
+                words = decode(line)
+                if words:
+                    self._messages.put(words)
+        except (OSError, ValueError):
+            pass
+        if not self._closed:
+            self._messages.put(["CLOSED"])
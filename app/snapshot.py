@@ -0,0 +1,240 @@
+# snapshot.py
+# Battleship Project - GameState save/resume
+# Created: 2026-10-17
+
+'''
+This file turns a GameState (app_models.py) into a small versioned binary snapshot and back, so a game in
+progress can be saved from the app menu and resumed later, and batch runs can checkpoint cheaply every turn.
+Only what cannot be derived is stored:
+
+    header   <4sBHBBBBBBB  magic b"BSGS", version, grid size, ship count (0 = not chosen), placing player,
+                           placing ship length, orientation (0 = H, 1 = V), AI player (0 = none),
+                           current turn, history (0 = no battle yet, else 1 + winner)
+    fleets   per player: ship count, then (start cell, length << 1 | vertical) per ship, like game/record.py
+    shots    per player: the outgoing shot board as two packed bitmasks (hits, misses), little-endian,
+             (size * size + 7) // 8 bytes each; sparse grids store sorted cell lists instead
+    history  if a battle has started: shot count + every shot code of the game record
+
+Ship boards, incoming boards, hit sets, per-ship damage and the scoreboards are rebuilt on load from the
+fleets and shot boards (an incoming board is exactly the opponent's outgoing one), so a 10x10 game in progress
+is a couple of hundred bytes and saving is a handful of struct calls.
+
+Loading checks everything before the state is touched: ships lie on the board, do not overlap and are ships
+of the chosen fleet (all of them once the battle has started); shots lie on the board, no cell is both a hit
+and a miss, and hits are exactly the shots on the opponent's ships.
+'''
+
+import struct
+from collections import Counter
+from typing import List, Optional
+
+from app.app_models import GameState
+from game.bitboard import HIT, MISS
+from game.board import DENSE_MAX_SIZE, MAX_GRID_SIZE, MIN_GRID_SIZE, new_ship_board, new_shot_board
+from game.fleet import Fleet
+from game.fleetgen import ship_cells
+from game.record import GameRecord, cell_code, cell_width, ship_spec
+from game.ships import build_ship_set
+from game.stats import PlayerStats
+
+SNAPSHOT_MAGIC = b"BSGS"
+SNAPSHOT_VERSION = 1
+
+_HEADER = struct.Struct("<4sBHBBBBBBB")
+_COUNT = struct.Struct("<I")
+
+
+def dump_state(state: GameState) -> bytes:
+    """Serialize a GameState into a snapshot blob."""
+    size = state.grid_size
+    record = state.record
+    history = 0 if record is None else 1 + record.winner
+
+    parts = [_HEADER.pack(
+        SNAPSHOT_MAGIC, SNAPSHOT_VERSION, size, state.num_ships or 0,
+        state.placing_player, state.placing_ship_len, int(state.placing_orientation == "V"),
+        state.ai_player or 0, state.current_turn, history,
+    )]
+
+    code = cell_code(size)
+    for fleet in (state.p1_ships, state.p2_ships):
+        packed: List[int] = []
+        for cells in fleet:
+            row, col, length, vertical = ship_spec(cells)
+            if length > 127:
+                raise ValueError(f"Ship length {length} cannot be saved")
+            packed += (row * size + col, length << 1 | vertical)
+        parts.append(struct.pack("<B" + (code + "B") * len(fleet), len(fleet), *packed))
+
+    for shots in (state.p1_shots, state.p2_shots):
+        parts.append(_pack_shots(shots))
+
+    if record is not None:
+        parts.append(_COUNT.pack(len(record.shots)))
+        parts.append(struct.pack(f"<{len(record.shots)}{code}", *record.shots))
+    return b"".join(parts)
+
+
+def load_state(data: bytes, state: Optional[GameState] = None) -> GameState:
+    """
+    Rebuild a GameState from a snapshot blob.
+    Pass an existing state to restore into it in place (the app's screens all share one GameState).
+    Raises ValueError for anything that is not a valid snapshot.
+    """
+    try:
+        return _load(data, state if state is not None else GameState())
+    except (struct.error, IndexError) as e:
+        raise ValueError(f"Truncated or corrupt snapshot ({e})") from None
+
+
+def _load(data: bytes, state: GameState) -> GameState:
+    (magic, version, size, num_ships, placing_player, placing_len, vertical,
+     ai_player, turn, history) = _HEADER.unpack_from(data, 0)
+    if magic != SNAPSHOT_MAGIC:
+        raise ValueError("Not a game snapshot")
+    if version != SNAPSHOT_VERSION:
+        raise ValueError(f"Unsupported snapshot version {version}")
+    if not MIN_GRID_SIZE <= size <= MAX_GRID_SIZE:
+        raise ValueError(f"Grid size {size} is out of range")
+    if placing_player not in (1, 2) or turn not in (1, 2) or ai_player not in (0, 1, 2):
+        raise ValueError("Corrupt snapshot header")
+    offset = _HEADER.size
+
+    code = cell_code(size)
+    width = cell_width(size)
+    required = Counter(ship.length for ship in build_ship_set(num_ships))
+    fleets = []
+    for player in (1, 2):
+        count = data[offset]
+        packed = struct.unpack_from("<" + (code + "B") * count, data, offset + 1)
+        offset += 1 + count * (width + 1)
+        ships = [_ship(packed[i], packed[i + 1], size) for i in range(0, len(packed), 2)]
+        _check_fleet(player, ships, required, complete=bool(history))
+        fleets.append(Fleet(ships))
+
+    shots = []
+    for player, target in ((1, fleets[1]), (2, fleets[0])):
+        board, offset = _unpack_shots(data, offset, size)
+        _check_shots(player, board, target)
+        shots.append(board)
+
+    record = None
+    if history:
+        (n,) = _COUNT.unpack_from(data, offset)
+        offset += _COUNT.size
+        codes = list(struct.unpack_from(f"<{n}{code}", data, offset))
+        offset += n * width
+        if any(c >> 1 >= size * size for c in codes):
+            raise ValueError("Move history has a shot off the board")
+        record = GameRecord.from_fleets(size, fleets[0], fleets[1])
+        record.shots = codes
+        record.winner = history - 1
+        turn = (n & 1) + 1  # Play strictly alternates: whoever has fired fewer shots is next
+    if offset != len(data):
+        raise ValueError(f"{len(data) - offset} trailing bytes after snapshot")
+
+    state.grid_size = size
+    state.num_ships = num_ships or None
+    state.placing_player = placing_player
+    state.placing_ship_len = placing_len
+    state.placing_orientation = "V" if vertical else "H"
+    state.ai_player = ai_player or None
+    state.current_turn = turn
+    state.record = record
+
+    state.p1_ships, state.p2_ships = fleets
+    state.p1_shots, state.p2_shots = shots
+    state.p1_incoming = state.p2_shots.copy()  # What P2 fired at P1 is what P1 received
+    state.p2_incoming = state.p1_shots.copy()
+
+    # Ship boards, hit sets and per-ship damage all follow from the fleets and incoming shots
+    state.p1_board = _ship_board(size, state.p1_ships)
+    state.p2_board = _ship_board(size, state.p2_ships)
+    state.p1_hits = _apply_hits(state.p1_ships, state.p1_incoming)
+    state.p2_hits = _apply_hits(state.p2_ships, state.p2_incoming)
+
+    state.p1_stats = PlayerStats.for_fleet(state.p1_ships, state.p1_shots, state.p2_ships)
+    state.p2_stats = PlayerStats.for_fleet(state.p2_ships, state.p2_shots, state.p1_ships)
+    return state
+
+
+def _ship(start: int, packed: int, size: int):
+    """Coordinates of a saved ship, checked to lie on the board."""
+    row, col = divmod(start, size)
+    length, vertical = packed >> 1, packed & 1
+    if row >= size or length < 1 or (row if vertical else col) + length > size:
+        raise ValueError(f"Ship at cell {start} (length {length}) is off the board")
+    return ship_cells(row, col, length, vertical)
+
+
+def _check_fleet(player: int, ships, required: Counter, complete: bool) -> None:
+    # Ships must not overlap and must come from the chosen fleet (every one of them once the battle is on)
+    cells = [cell for ship in ships for cell in ship]
+    if len(set(cells)) != len(cells):
+        raise ValueError(f"Player {player}'s ships overlap")
+    lengths = Counter(len(ship) for ship in ships)
+    if lengths - required or (complete and lengths != required):
+        raise ValueError(f"Player {player}'s ships do not match the chosen fleet")
+
+
+def _check_shots(player: int, board, target: Fleet) -> None:
+    # Shot marks must be consistent with the fleet they were fired at
+    hits, misses = set(board.hit_cells()), set(board.miss_cells())
+    if hits & misses:
+        raise ValueError(f"Player {player}'s shot board marks a cell as both hit and miss")
+    if any(target.ship_at(cell) is None for cell in hits) or any(target.ship_at(cell) is not None for cell in misses):
+        raise ValueError(f"Player {player}'s hits and misses do not match the opponent's ships")
+
+
+def _pack_shots(board) -> bytes:
+    if board.size <= DENSE_MAX_SIZE:  # ShotBoard: the two masks as fixed-width bytes
+        width = (board.size * board.size + 7) // 8
+        return board.hits.to_bytes(width, "little") + board.misses.to_bytes(width, "little")
+
+    # Sparse board: a bitmask would cost the whole area, so store the shot cells themselves
+    size = board.size
+    hits = [r * size + c for r, c in board.hit_cells()]
+    misses = [r * size + c for r, c in board.miss_cells()]
+    return struct.pack(f"<II{len(hits)}I{len(misses)}I", len(hits), len(misses), *hits, *misses)
+
+
+def _unpack_shots(data: bytes, offset: int, size: int):
+    board = new_shot_board(size)
+    if size <= DENSE_MAX_SIZE:
+        width = (size * size + 7) // 8
+        if offset + 2 * width > len(data):
+            raise ValueError("Truncated snapshot")
+        board.hits = int.from_bytes(data[offset:offset + width], "little")
+        board.misses = int.from_bytes(data[offset + width:offset + 2 * width], "little")
+        if (board.hits | board.misses) >> (size * size):  # Padding bits past the last cell
+            raise ValueError("Shot board has marks off the board")
+        return board, offset + 2 * width
+
+    n_hits, n_misses = struct.unpack_from("<II", data, offset)
+    offset += 8
+    cells = struct.unpack_from(f"<{n_hits + n_misses}I", data, offset)
+    offset += 4 * (n_hits + n_misses)
+    if len(set(cells)) != len(cells) or any(cell >= size * size for cell in cells):
+        raise ValueError("Shot board has repeated or off-board cells")
+    for i, cell in enumerate(cells):
+        row, col = divmod(cell, size)
+        board.put(row, col, HIT if i < n_hits else MISS)  # Hit cells come first, then misses
+    return board, offset
+
+
+def _ship_board(size: int, fleet: Fleet):
+    board = new_ship_board(size)
+    for cells in fleet:
+        for r, c in cells:
+            board.put(r, c, 1)
+    return board
+
+
+def _apply_hits(fleet: Fleet, incoming) -> set:
+    """Register every incoming hit on the fleet (so sunk ships and afloat counts are right); returns the hit set."""
+    hits = set(incoming.hit_cells())
+    for cell in hits:
+        ship_id = fleet.ship_at(cell)
+        if ship_id is not None:
+            fleet.register_hit(ship_id)
+    return hits
@@ -0,0 +1,208 @@
+# timing.py
+# Battleship Project - Opt-in UI timing instrumentation
+# Created: 2026-10-17
+
+'''
+This file measures how long UI handlers take, to find interactions that miss the 16 ms frame budget on slow
+hardware. It is off by default and costs nothing until installed (View → Record UI Timings, or
+main.py --ui-timings). Installing wraps the chosen handler methods at class level (so screens built later are
+covered too) and wraps every callback passed to Tk's after() / after_idle(); uninstalling restores the originals.
+
+Each handler keeps its last RING_SIZE durations in a preallocated array (a ring buffer: one float store and an
+index bump per call) plus lifetime call and over-budget counts. Percentiles and histograms are computed only
+when someone looks: the TimingsWindow overlay, or export() to a JSON file.
+'''
+
+import json
+import time
+import tkinter as tk
+from array import array
+from functools import wraps
+from typing import Dict, Iterable, List, Optional, Tuple
+
+FRAME_BUDGET_MS = 16.0  # One frame at 60 Hz
+RING_SIZE = 1024        # Recent durations kept per handler
+HISTOGRAM_EDGES_MS = (1, 2, 4, 8, 16, 33, 66, 133)  # Bucket upper bounds; a last bucket holds anything slower
+WINDOW_REFRESH_MS = 500
+
+_tk_after = tk.Misc.after  # The real after(), captured before any patching (the overlay uses it untimed)
+
+
+class Ring:
+    """Fixed-size ring buffer of durations in milliseconds, with lifetime counters."""
+
+    __slots__ = ("values", "next", "filled", "calls", "over_budget", "worst")
+
+    def __init__(self, size: int = RING_SIZE):
+        self.values = array("d", [0.0]) * size
+        self.next = 0        # Slot the next sample goes into
+        self.filled = 0      # Samples held (up to size)
+        self.calls = 0       # Every sample ever added
+        self.over_budget = 0  # Samples above FRAME_BUDGET_MS, ever
+        self.worst = 0.0
+
+    def add(self, ms: float) -> None:
+        i = self.next
+        self.values[i] = ms
+        i += 1
+        self.next = 0 if i == len(self.values) else i
+        if self.filled < len(self.values):
+            self.filled += 1
+        self.calls += 1
+        if ms > FRAME_BUDGET_MS:
+            self.over_budget += 1
+        if ms > self.worst:
+            self.worst = ms
+
+    def recent(self) -> List[float]:
+        """Held samples, oldest first."""
+        if self.filled < len(self.values):
+            return list(self.values[:self.filled])
+        return list(self.values[self.next:]) + list(self.values[:self.next])
+
+    def percentile(self, p: float, ordered: Optional[List[float]] = None) -> float:
+        ordered = ordered if ordered is not None else sorted(self.recent())
+        if not ordered:
+            return 0.0
+        return ordered[min(len(ordered) - 1, int(p / 100 * len(ordered)))]
+
+    def histogram(self) -> List[int]:
+        """Counts of held samples per HISTOGRAM_EDGES_MS bucket (the last entry counts the slowest bucket)."""
+        counts = [0] * (len(HISTOGRAM_EDGES_MS) + 1)
+        for ms in self.recent():
+            for i, edge in enumerate(HISTOGRAM_EDGES_MS):
+                if ms <= edge:
+                    counts[i] += 1
+                    break
+            else:
+                counts[-1] += 1
+        return counts
+
+    def summary(self) -> dict:
+        ordered = sorted(self.recent())
+        return {
+            "calls": self.calls,
+            "over_budget": self.over_budget,
+            "p50_ms": round(self.percentile(50, ordered), 3),
+            "p90_ms": round(self.percentile(90, ordered), 3),
+            "p99_ms": round(self.percentile(99, ordered), 3),
+            "max_ms": round(self.worst, 3),
+        }
+
+
+class UITimings:
+    """Registry of rings by handler name, plus the install/uninstall of the timing wrappers."""
+
+    def __init__(self):
+        self.rings: Dict[str, Ring] = {}
+        self.installed = False
+        self._patched: List[Tuple[type, str, object]] = []  # (class, attribute, original) to restore
+
+    def record(self, name: str, ms: float) -> None:
+        ring = self.rings.get(name)
+        if ring is None:
+            ring = self.rings[name] = Ring()
+        ring.add(ms)
+
+    def clear(self) -> None:
+        self.rings.clear()
+
+    # --- installing the wrappers ---
+
+    def install(self, handlers: Iterable[Tuple[type, str]]) -> None:
+        """Time the given (class, method name) handlers and every after()/after_idle() callback."""
+        if self.installed:
+            return
+        for cls, attr in handlers:
+            original = cls.__dict__[attr]
+            self._patch(cls, attr, self._timed(original, f"{cls.__name__}.{attr}"))
+        self._patch(tk.Misc, "after", self._timed_after(tk.Misc.__dict__["after"]))
+        self.installed = True
+
+    def uninstall(self) -> None:
+        for cls, attr, original in reversed(self._patched):
+            setattr(cls, attr, original)
+        self._patched.clear()
+        self.installed = False
+
+    def _patch(self, cls: type, attr: str, replacement) -> None:
+        self._patched.append((cls, attr, cls.__dict__[attr]))
+        setattr(cls, attr, replacement)
+
+    def _timed(self, func, name: str):
+        record, clock = self.record, time.perf_counter
+
+        @wraps(func)
+        def timed(*args, **kwargs):
+            start = clock()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                record(name, (clock() - start) * 1000)
+        return timed
+
+    def _timed_after(self, original_after):
+        timed = self._timed
+
+        @wraps(original_after)
+        def after(widget, ms, func=None, *args):
+            if func is None:  # after(ms) with no callback just sleeps
+                return original_after(widget, ms)
+            name = "after: " + getattr(func, "__qualname__", type(func).__name__)
+            return original_after(widget, ms, timed(func, name), *args)
+        return after
+
+    # --- reading ---
+
+    def rows(self) -> List[Tuple[str, dict]]:
+        """(name, summary) per handler, slowest p99 first."""
+        rows = [(name, ring.summary()) for name, ring in self.rings.items()]
+        rows.sort(key=lambda row: row[1]["p99_ms"], reverse=True)
+        return rows
+
+    def report(self) -> str:
+        """Plain-text table for the overlay window."""
+        lines = [f"{'handler':<44} {'calls':>7} {'p50 ms':>8} {'p99 ms':>8} {'max ms':>8} {'>16ms':>6}"]
+        for name, s in self.rows():
+            lines.append(f"{name[:44]:<44} {s['calls']:>7} {s['p50_ms']:>8.2f} {s['p99_ms']:>8.2f} "
+                         f"{s['max_ms']:>8.2f} {s['over_budget']:>6}")
+        if len(lines) == 1:
+            lines.append("(nothing recorded yet)" if self.installed else "(recording is off: View → Record UI Timings)")
+        return "\n".join(lines)
+
+    def export(self, path: str) -> None:
+        """Write summaries, histograms and the recent samples of every handler as JSON."""
+        data = {
+            "frame_budget_ms": FRAME_BUDGET_MS,
+            "histogram_edges_ms": list(HISTOGRAM_EDGES_MS),
+            "handlers": {
+                name: {**ring.summary(), "histogram": ring.histogram(),
+                       "recent_ms": [round(ms, 4) for ms in ring.recent()]}
+                for name, ring in self.rings.items()
+            },
+        }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+
+
+class TimingsWindow(tk.Toplevel):
+    """Small always-on-top overlay showing p50/p99 per handler, refreshed twice a second."""
+
+    def __init__(self, app, timings: UITimings):
+        super().__init__(app)
+        self.title("UI Timings")
+        self.attributes("-topmost", True)
+        self.timings = timings
+        self.text = tk.Label(self, font=("Courier", 12), justify="left", anchor="nw")
+        self.text.pack(fill="both", expand=True, padx=8, pady=8)
+        buttons = tk.Frame(self)
+        buttons.pack(pady=(0, 8))
+        tk.Button(buttons, text="Reset", command=timings.clear).pack(side="left", padx=4)
+        tk.Button(buttons, text="Export…", command=app.export_ui_timings).pack(side="left", padx=4)
+        self._refresh()
+
+    def _refresh(self):
+        if not self.winfo_exists():
+            return
+        self.text.config(text=self.timings.report())
+        _tk_after(self, WINDOW_REFRESH_MS, self._refresh)  # Untimed, so the overlay does not measure itself
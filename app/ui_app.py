@@ -2,12 +2,28 @@
 # Battleship Project - Tkinter app + screen manager
 # Created: 2026-02-06
 
+import sys  # Startup report output
+import time  # Startup timing
 import tkinter as tk  # Tkinter GUI framework
 from tkinter import filedialog, messagebox, ttk  # File picker + simple alerts
 from app.app_models import GameState  # Shared game state object
 from app.ui_screen import WelcomeScreen, PlacementScreen, BattleScreen, WinScreen  # All screen classes
-from PIL import Image, ImageTk  # Pillow library for image handling (if needed for UI)
+from app.snapshot import dump_state, load_state  # Save / resume a game in progress (View > Save/Load Game)
+from game.record import RecordWriter  # Binary game records (View > Save Game Record)
+from app.timing import TimingsWindow, UITimings  # Opt-in handler timing (View > Record UI Timings)
 from pathlib import Path  # For file path handling
+from collections import OrderedDict  # LRU cache of scaled wallpapers
+from typing import Optional
+# Pillow (PIL) and the wallpaper worker are imported only when a wallpaper is actually loaded
+
+RESIZE_SETTLE_MS = 200   # High-quality wallpaper pass runs once the window size has been stable this long
+PREVIEW_MS = 40          # During a drag, fast previews are redrawn at most this often
+WALLPAPER_CACHE_SIZE = 4 # Scaled PhotoImages kept, keyed by (image, width, height)
+WALLPAPER_POLL_MS = 30   # How often the Tk thread checks for finished wallpaper work
+NET_POLL_MS = 20         # How often the Tk thread checks for server messages while playing online
+
+SCREENS = (WelcomeScreen, PlacementScreen, BattleScreen, WinScreen)  # Built on first use or pre-warmed when idle
+DEFAULT_WALLPAPER = "assets/HD-wallpaper-battleship-oceans-clouds-sea.jpg"
 
 
 '''
@@ -15,13 +31,31 @@ This file defines the main Tkinter application class, App, which acts as the scr
 It creates the root window, initializes the shared GameState, and loads all screens (WelcomeScreen, PlacementScreen, and BattleScreen) 
 into a single container frame. The app controls which screen is visible using tkraise(), allowing smooth screen transitions without destroying widgets. 
 It also configures fullscreen behavior and provides a single place for screens to access shared state.
+Only the welcome screen is built before the first frame: the other screens are pre-warmed one per idle callback afterwards
+(or built on demand if needed sooner), and the default wallpaper starts loading after the first paint.
+Pass started=<time.perf_counter() at launch> to get a startup timing report on stdout (see main.py --startup-report).
 '''
 
 class App(tk.Tk):  # Main application window inherits from Tk
-    def __init__(self):
+    def __init__(self, started: Optional[float] = None, timings: bool = False):
+        # Startup timing: `started` is the perf_counter() value at launch (None = no report)
+        # timings=True records UI handler durations from the start (see app/timing.py)
+        self._started = started
+        self._timings = []  # (label, ms since launch)
+        self._reported = 0  # How many timings have been printed
+        self._mark("imports done")
+
         super().__init__()  # Initialize Tk base class
         self.title("Battleship")  # Set window title
         self.state = GameState()  # Create shared game state object
+        self.canvas_boards = False  # Draw every board on a single Canvas (boards above 15x15 always are)
+        self.net = None  # NetClient while playing online (app/net_client.py), else None
+        self.online_game = False  # State belongs to an online game (until the next new or loaded game): not saveable
+        self._net_poll_job = None
+        self.ui_timings = UITimings()  # Rolling handler timings, recorded only while installed
+        self._timings_window = None
+        if timings:
+            self.ui_timings.install(self._timed_handlers())
 
         # Make text larger across the app by default.
         self.option_add("*Font", ("Arial", 16))
@@ -31,6 +65,15 @@ class App(tk.Tk):  # Main application window inherits from Tk
         # --- Wallpaper / background setup ---
         self._bg_original = None      # PIL.Image (original)
         self._bg_photo = None         # ImageTk.PhotoImage (resized)
+        self._bg_key = None           # Identifies the current image in the cache (its load token)
+        self._bg_proxy = None         # Small copy of the original, used for fast previews
+        self._bg_cache = OrderedDict()  # (key, w, h) -> PhotoImage, most recently used last
+        self._bg_size = None          # (w, h) the wallpaper on screen was rendered for
+        self._settle_job = None       # Pending high-quality render (debounce)
+        self._preview_job = None      # Pending fast preview (throttle)
+        self._bg_worker = None        # Background decode/resize thread (created with the first wallpaper)
+        self._bg_token = 0            # Bumped per set/clear so late results for an old image are ignored
+        self._bg_poll_job = None      # Pending poll of the worker's results
         self._bg_label = tk.Label(self, bd=0)
         self._bg_label.place(x=0, y=0, relwidth=1, relheight=1)
         self.bind("<Configure>", self._on_resize)  # auto-resize wallpaper when window changes
@@ -43,13 +86,9 @@ class App(tk.Tk):  # Main application window inherits from Tk
         self._container.grid_rowconfigure(0, weight=1)  # Allow vertical expansion
         self._container.grid_columnconfigure(0, weight=1)  # Allow horizontal expansion
 
-        self.screens = {}  # Dictionary to store screen instances
-
-        # Create and register each screen
-        for Screen in (WelcomeScreen, PlacementScreen, BattleScreen, WinScreen):
-            self._add_screen(Screen)
+        self.screens = {}  # Dictionary to store screen instances (filled lazily, see screen())
 
-        self.show_screen("WelcomeScreen")  # Show welcome screen first
+        self.show_screen("WelcomeScreen")  # Show welcome screen first (the only screen built up front)
 
         self.attributes("-fullscreen", True)  # Start in fullscreen mode
         self.bind("<Escape>", lambda e: self.attributes("-fullscreen", False))  # ESC exits fullscreen
@@ -63,25 +102,82 @@ class App(tk.Tk):  # Main application window inherits from Tk
         view_menu = tk.Menu(menubar, tearoff=0)
         view_menu.add_command(label="Choose Wallpaper…", command=self.choose_wallpaper)
         view_menu.add_command(label="Clear Wallpaper", command=self.clear_wallpaper)
+        view_menu.add_separator()
+        view_menu.add_command(label="Save Game…", command=self.save_game)
+        view_menu.add_command(label="Load Game…", command=self.load_game)
+        view_menu.add_command(label="Save Game Record…", command=self.save_game_record)
+        view_menu.add_separator()
+        self._canvas_var = tk.BooleanVar(value=self.canvas_boards)
+        view_menu.add_checkbutton(label="Canvas Boards", variable=self._canvas_var, command=self._toggle_canvas_boards)
+        view_menu.add_separator()
+        self._timings_var = tk.BooleanVar(value=timings)
+        view_menu.add_checkbutton(label="Record UI Timings", variable=self._timings_var, command=self._toggle_ui_timings)
+        view_menu.add_command(label="Show UI Timings…", command=self.show_ui_timings)
+        view_menu.add_command(label="Export UI Timings…", command=self.export_ui_timings)
         menubar.add_cascade(label="View", menu=view_menu)
+        self._view_menu = view_menu
         self.config(menu=menubar)
 
-        # Try to load a default wallpaper if it exists in the project root
-        default_wallpaper = "assets/HD-wallpaper-battleship-oceans-clouds-sea.jpg"
+        self._mark("app built")
+        self.after_idle(self._after_first_paint)  # Runs once the welcome screen has been drawn
+
+    def _after_first_paint(self):
+        self.update_idletasks()  # Flush any pending redraw so the mark reflects a painted window
+        self._mark("first paint")
+
+        # Try to load a default wallpaper if it exists in the project root (decoded off the Tk thread)
         try:
-            self.set_wallpaper(default_wallpaper)
+            self.set_wallpaper(DEFAULT_WALLPAPER)
         except Exception:
             pass
 
+        self.after_idle(self._prewarm_screens)
+
+    def _prewarm_screens(self):
+        """Build the next not-yet-built screen, one per idle callback so the UI stays responsive."""
+        for ScreenClass in SCREENS:
+            if ScreenClass.__name__ not in self.screens:
+                self.screen(ScreenClass.__name__)
+                self.after_idle(self._prewarm_screens)
+                return
+        self._mark("screens pre-warmed")
+        self._report_startup()
+
     def _add_screen(self, ScreenClass):
         screen = ScreenClass(parent=self._container, app=self)  # Create screen instance
         self.screens[ScreenClass.__name__] = screen  # Store by class name
         screen.grid(row=0, column=0, sticky="nsew")  # Stack screens on top of each other
+        return screen
+
+    def screen(self, name: str):
+        """Screen instance by class name, built on first use."""
+        screen = self.screens.get(name)
+        if screen is None:
+            ScreenClass = next(cls for cls in SCREENS if cls.__name__ == name)
+            screen = self._add_screen(ScreenClass)
+        return screen
 
     def show_screen(self, name: str):
-        self.screens[name].tkraise()  # Bring selected screen to the front
+        self.screen(name).tkraise()  # Bring selected screen to the front
+
+    def _mark(self, label: str):
+        if self._started is not None:
+            self._timings.append((label, (time.perf_counter() - self._started) * 1000))
+
+    def _report_startup(self):
+        """Print timings not printed yet (the wallpaper may finish after the screens are pre-warmed)."""
+        if self._started is None:
+            return
+        if self._reported == 0:
+            print("Startup timing (ms since launch):")
+        for label, ms in self._timings[self._reported:]:
+            print(f"  {label:<20} {ms:8.1f}")
+        self._reported = len(self._timings)
+        sys.stdout.flush()
 
     def new_game(self):
+        self.stop_online()  # Leaving a finished or abandoned online game
+        self._set_saving(True)
         n = self.state.num_ships  # Remember selected ship count
 
         self.state.reset_for_new_game()  # Reset all boards, hits, shots, turns
@@ -95,6 +191,204 @@ class App(tk.Tk):  # Main application window inherits from Tk
 
         self.show_screen("WelcomeScreen")  # Return to welcome screen
 
+    def _toggle_canvas_boards(self):
+        # Screens rebuild their boards in the new style the next time they are shown
+        self.canvas_boards = bool(self._canvas_var.get())
+
+    # --- UI timing instrumentation (app/timing.py) ---
+
+    def _timed_handlers(self):
+        # The handlers worth watching on slow hardware; after()/after_idle() callbacks are always timed too
+        return (
+            (BattleScreen, "refresh_ui"),
+            (BattleScreen, "on_fire_pressed"),
+            (PlacementScreen, "refresh_ui"),
+            (type(self), "_render_wallpaper"),
+        )
+
+    def _toggle_ui_timings(self):
+        if self._timings_var.get():
+            self.ui_timings.install(self._timed_handlers())
+        else:
+            self.ui_timings.uninstall()
+
+    def show_ui_timings(self):
+        """Open (or raise) the overlay listing p50/p99 per handler."""
+        if self._timings_window is not None and self._timings_window.winfo_exists():
+            self._timings_window.lift()
+            return
+        self._timings_window = TimingsWindow(self, self.ui_timings)
+
+    def export_ui_timings(self):
+        """Write the recorded timings (summaries, histograms, recent samples) to a JSON file."""
+        path = filedialog.asksaveasfilename(
+            title="Export UI timings",
+            defaultextension=".json",
+            filetypes=[("JSON files", "*.json"), ("All files", "*.*")],
+        )
+        if not path:
+            return
+        try:
+            self.ui_timings.export(path)
+        except OSError as e:
+            messagebox.showerror("Export UI Timings", f"Could not export the timings:\n{e}")
+
+    def _set_saving(self, enabled: bool):
+        # Online games hold no opponent fleet and no real shot order, so neither save would resume or replay
+        self.online_game = not enabled
+        for label in ("Save Game…", "Save Game Record…"):
+            self._view_menu.entryconfig(label, state="normal" if enabled else "disabled")
+
+    def _refuse_online_save(self, title: str) -> bool:
+        if self.online_game:
+            messagebox.showinfo(title, "Online games cannot be saved.")
+        return self.online_game
+
+    def save_game(self):
+        """Save the whole game in progress as a binary snapshot (see app/snapshot.py)."""
+        if self._refuse_online_save("Save Game"):
+            return
+        path = filedialog.asksaveasfilename(
+            title="Save game",
+            defaultextension=".bsgs",
+            filetypes=[("Battleship saved games", "*.bsgs"), ("All files", "*.*")],
+        )
+        if not path:
+            return
+        try:
+            Path(path).write_bytes(dump_state(self.state))
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Save Game", f"Could not save the game:\n{e}")
+
+    def load_game(self):
+        """Resume a saved game: restore the GameState and show the screen for its phase."""
+        path = filedialog.askopenfilename(
+            title="Load game",
+            filetypes=[("Battleship saved games", "*.bsgs"), ("All files", "*.*")],
+        )
+        if not path:
+            return
+        try:
+            data = Path(path).read_bytes()
+            load_state(data, self.state)  # Checks fleets, shots and history before touching the state
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Load Game", f"Could not load that saved game.\n\n{e}")
+            return
+
+        # Transitions scheduled for the game that was on screen no longer apply
+        self.stop_online()  # A saved game is resumed locally
+        self._set_saving(True)
+        for name in ("PlacementScreen", "BattleScreen"):
+            if name in self.screens:
+                self.screens[name].cancel_pending()
+
+        s = self.state
+        if s.num_ships is None:  # Saved before a ship count was chosen
+            self.show_screen("WelcomeScreen")
+        elif s.record is None:  # Still placing ships
+            self.show_screen("PlacementScreen")
+        elif s.record.winner:  # Finished game: straight to the results
+            winner = "Computer" if s.record.winner == s.ai_player else f"Player {s.record.winner}"
+            win_screen = self.screen("WinScreen")
+            win_screen.set_winner(f"{winner.upper()} WINS!")
+            win_screen.set_stats()
+            self.show_screen("WinScreen")
+        else:
+            self.show_screen("BattleScreen")
+
+    # --- online play (server: game/server.py, protocol: game/protocol.py) ---
+
+    def start_online(self, address: str, size: int, num_ships: int):
+        """Connect to a game server, ask for a match and go to placement while the server finds an opponent."""
+        from app.net_client import NetClient
+        host, _, port = address.strip().rpartition(":")
+        try:
+            client = NetClient(host or "127.0.0.1", int(port))
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Play online", f"Could not connect to {address!r}.\n\n{e}")
+            return
+
+        self.stop_online()
+        s = self.state
+        s.grid_size = size
+        s.reset_for_new_game()
+        s.num_ships = num_ships
+        s.ai_player = 2  # The opponent never uses this screen: the local player is always slot 1
+
+        self.net = client
+        self._set_saving(False)
+        client.send("HELLO", size, num_ships)
+        self._net_poll_job = self.after(NET_POLL_MS, self._poll_net)
+        self.show_screen("PlacementScreen")
+
+    def stop_online(self):
+        if self._net_poll_job is not None:
+            self.after_cancel(self._net_poll_job)
+            self._net_poll_job = None
+        if self.net is not None:
+            self.net.close()
+            self.net = None
+
+    def _poll_net(self):
+        self._net_poll_job = None
+        for words in self.net.poll():
+            self._on_net(words)
+            if self.net is None:  # Game ended / connection dropped while handling
+                return
+        self._net_poll_job = self.after(NET_POLL_MS, self._poll_net)
+
+    def _on_net(self, words):
+        """Apply one server message. Server player numbers map to local slots: 1 = us, 2 = the opponent."""
+        kind = words[0]
+        battle = self.screen("BattleScreen")
+
+        if kind == "START":
+            self.net.number = int(words[1])
+        elif kind == "TURN":
+            if self.state.record is None:  # First turn: both fleets are in, the battle begins
+                self.show_screen("BattleScreen")
+            battle.online_turn(self._net_slot(words[1]))
+        elif kind == "SHOT":
+            battle.online_shot(self._net_slot(words[1]), int(words[2]), int(words[3]), words[4])
+        elif kind == "OVER":
+            battle.online_over(self._net_slot(words[1]))
+            self.stop_online()
+        elif kind in ("LEFT", "CLOSED"):
+            self.stop_online()
+            text = "Your opponent left the game." if kind == "LEFT" else "The connection to the server was lost."
+            messagebox.showinfo("Play online", text)
+            self.new_game()
+        elif kind == "ERROR":
+            messagebox.showerror("Play online", " ".join(words[1:]))
+            if self.state.record is None:  # Fleet rejected: let the player fix it and press Ready again
+                self.screen("PlacementScreen").tkraise()
+            else:  # Shot rejected: the server sends no TURN for it, so unlock the board again
+                battle.online_error()
+        # WAIT / READY need no action: the placement screen already says what is going on
+
+    def _net_slot(self, number) -> int:
+        return 1 if int(number) == self.net.number else 2
+
+    def save_game_record(self):
+        """Save the current battle's move history as a binary game record (see game/record.py)."""
+        if self._refuse_online_save("Save Game Record"):
+            return
+        if self.state.record is None:
+            messagebox.showinfo("Save Game Record", "There is no battle to save yet.")
+            return
+        path = filedialog.asksaveasfilename(
+            title="Save game record",
+            defaultextension=".bsgr",
+            filetypes=[("Battleship game records", "*.bsgr"), ("All files", "*.*")],
+        )
+        if not path:
+            return
+        try:
+            with RecordWriter(path) as writer:
+                writer.write(self.state.record)
+        except OSError as e:
+            messagebox.showerror("Save Game Record", f"Could not save the game record:\n{e}")
+
     def choose_wallpaper(self):
         """Open a file picker so the user can choose a wallpaper image."""
         path = filedialog.askopenfilename(
@@ -106,16 +400,14 @@ class App(tk.Tk):  # Main application window inherits from Tk
         )
         if not path:
             return
-        try:
-            self.set_wallpaper(path)
-        except Exception as e:
-            messagebox.showerror("Wallpaper Error", f"Could not load that image.\n\n{e}")
+        self.set_wallpaper(path, report_errors=True)  # Errors are shown when the worker reports back
 
-    def set_wallpaper(self, path: str):
+    def set_wallpaper(self, path: str, report_errors: bool = False):
         """Load wallpaper from a path.
 
         - Absolute paths (from the file picker) work as-is.
         - Relative paths (repo assets like 'assets/..') resolve from the project root.
+        - Decoding happens on a worker thread; the wallpaper appears once it is ready.
         """
         p = Path(path)
 
@@ -124,16 +416,31 @@ class App(tk.Tk):  # Main application window inherits from Tk
             project_root = Path(__file__).resolve().parents[1]  # .../Battleship/
             p = project_root / p
 
-        img = Image.open(p)
-        self._bg_original = img
-        self._render_wallpaper()
+        if self._bg_worker is None:
+            from app.wallpaper import WallpaperWorker  # Pulls in Pillow: only once a wallpaper is used
+            self._bg_worker = WallpaperWorker()
+
+        self._bg_token += 1
+        screen = (self.winfo_screenwidth(), self.winfo_screenheight())  # Decode no larger than this
+        self._bg_worker.open(self._bg_token, p, screen, self._window_size(), report_errors)
+        self._poll_wallpaper_soon()
 
     def clear_wallpaper(self):
         """Remove the wallpaper."""
+        self._cancel_wallpaper_jobs()
+        self._bg_token += 1  # Anything still in flight is for the old image
         self._bg_original = None
+        self._bg_proxy = None
+        self._bg_key = None
         self._bg_photo = None
+        self._bg_size = None
+        self._bg_cache.clear()
         self._bg_label.config(image="")
 
+        welcome = self.screens.get("WelcomeScreen")
+        if welcome and hasattr(welcome, "refresh_wallpaper"):
+            welcome.refresh_wallpaper()
+
     def _on_resize(self, event):
         # Avoid doing work before an image is loaded
         if self._bg_original is None:
@@ -141,23 +448,113 @@ class App(tk.Tk):  # Main application window inherits from Tk
         # Only respond to root window resize events
         if event.widget is not self:
             return
-        self._render_wallpaper()
+        if self._bg_size == (max(1, event.width), max(1, event.height)):
+            return  # Moves and child re-layouts also send <Configure>; nothing to redraw
+
+        # Coalesce the burst of events a drag produces: a throttled fast preview while it lasts,
+        # then one high-quality render after the size has stopped changing
+        if self._preview_job is None:
+            self._preview_job = self.after(PREVIEW_MS, self._render_preview)
+        if self._settle_job is not None:
+            self.after_cancel(self._settle_job)
+        self._settle_job = self.after(RESIZE_SETTLE_MS, self._render_wallpaper)
+
+    def _cancel_wallpaper_jobs(self):
+        for job in (self._preview_job, self._settle_job):
+            if job is not None:
+                self.after_cancel(job)
+        self._preview_job = None
+        self._settle_job = None
+
+    def _render_preview(self):
+        """Fast, low-quality wallpaper for the current size (scaled up from the small proxy)."""
+        self._preview_job = None
+        if self._bg_proxy is None:
+            return
+        from PIL import Image, ImageTk  # Already loaded by the wallpaper worker
+
+        w, h = self._window_size()
+        photo = self._bg_cache.get((self._bg_key, w, h))  # A size we already rendered properly
+        if photo is None:
+            photo = ImageTk.PhotoImage(self._bg_proxy.resize((w, h), Image.BILINEAR))
+        self._show_wallpaper(photo, None)  # None: not final, the settle pass still runs
 
     def _render_wallpaper(self):
         """Resize the original wallpaper to the current window size and apply it."""
+        self._settle_job = None
         if self._bg_original is None:
             return
 
-        w = max(1, self.winfo_width())
-        h = max(1, self.winfo_height())
+        w, h = self._window_size()
+        key = (self._bg_key, w, h)
+        photo = self._bg_cache.get(key)
+        if photo is not None:
+            self._bg_cache.move_to_end(key)  # Recently used
+        else:
+            # High-quality resizing runs on the worker thread; _poll_wallpaper shows it when done
+            self._bg_worker.resize(self._bg_token, self._bg_original, (w, h))
+            self._poll_wallpaper_soon()
+            return
 
-        # Use high-quality resizing
-        resized = self._bg_original.resize((w, h), Image.LANCZOS)
-        self._bg_photo = ImageTk.PhotoImage(resized)
+        self._show_wallpaper(photo, (w, h))
+
+    def _poll_wallpaper_soon(self):
+        if self._bg_poll_job is None:
+            self._bg_poll_job = self.after(WALLPAPER_POLL_MS, self._poll_wallpaper)
+
+    def _poll_wallpaper(self):
+        """Tk-thread side of the worker: turn finished PIL images into PhotoImages and show them."""
+        from PIL import ImageTk  # Already loaded by the wallpaper worker
+
+        self._bg_poll_job = None
+        for result in self._bg_worker.poll():
+            kind, token = result[0], result[1]
+            if token != self._bg_token:
+                continue  # Result for an image that was replaced or cleared meanwhile
+
+            if kind == "error":
+                if result[2]:  # The user picked this file: tell them why it failed
+                    messagebox.showerror("Wallpaper Error", f"Could not load that image.\n\n{result[3]}")
+                continue
+
+            if kind == "opened":
+                _, _, original, proxy, size, scaled = result
+                self._bg_original = original
+                self._bg_proxy = proxy
+                self._bg_key = token
+                self._bg_cache.clear()
+            else:
+                _, _, size, scaled = result
+            self._cache_wallpaper(size, ImageTk.PhotoImage(scaled))
+
+            if size == self._window_size():
+                self._render_wallpaper()  # Cache hit: shows it right away
+            elif self._settle_job is None:
+                self._settle_job = self.after(RESIZE_SETTLE_MS, self._render_wallpaper)  # Window changed meanwhile
+
+        if self._bg_worker.pending:
+            self._poll_wallpaper_soon()
+
+    def _cache_wallpaper(self, size, photo):
+        self._bg_cache[(self._bg_key,) + tuple(size)] = photo
+        while len(self._bg_cache) > WALLPAPER_CACHE_SIZE:
+            self._bg_cache.popitem(last=False)  # Drop the least recently used size
+
+    def _window_size(self):
+        return max(1, self.winfo_width()), max(1, self.winfo_height())
+
+    def _show_wallpaper(self, photo, size):
+        self._bg_photo = photo
+        self._bg_size = size
         self._bg_label.config(image=self._bg_photo)
         self._bg_label.lower()         # keep it behind
         self._container.lift()         # keep screens above
 
+        if size is not None and not any(label == "wallpaper shown" for label, _ in self._timings):
+            self._mark("wallpaper shown")
+            if self._reported:
+                self._report_startup()  # Wallpaper arrived after the first report
+
         welcome = self.screens.get("WelcomeScreen")
         if welcome and hasattr(welcome, "refresh_wallpaper"):
             welcome.refresh_wallpaper()
@@ -0,0 +1,208 @@
+# ui_render.py
+# Battleship Project - Board grid rendering
+# Created: 2026-10-17
+
+'''
+This file holds the two ways a screen can draw a board, behind one small API (paint / invalidate / set_active):
+
+CellGrid wraps a screen's 2D matrix of cell Labels. All its cells share one bind tag, so a single
+<Button-1> binding serves the whole board and enabling/disabling input is a flag flip, not a rebind per cell. Every .config() on a Tk widget is a round trip into Tcl,
+so repainting a whole board after a single shot costs one call per cell. CellGrid remembers the last
+(background, text colour, text) drawn in each cell and only calls .config() when a cell's look actually changes,
+so a refresh after a shot touches just the cells that shot changed. It still indexes like the old list of lists
+(cells[r][c] is the Label), so existing code keeps working.
+
+CanvasBoard draws a whole board (headers included) on one Canvas: one rectangle per cell, with text items
+created only for cells that show a mark. Clicks are hit-tested from the pointer position by one handler, so a
+100×100 board is a single widget instead of ten thousand Labels. It keeps the same per-cell cache as CellGrid.
+
+invalidate() forgets the remembered looks, forcing the next paint of every cell to reach Tk
+(used on turn hand-off and whenever the widgets are rebuilt).
+'''
+
+import tkinter as tk
+from typing import Callable, Dict, List, Optional, Tuple
+
+from game.coords import col_to_letter, row_to_number
+
+# Last drawn look of a cell: (bg, fg, text); None means "never drawn / unknown"
+CellLook = Tuple[Optional[str], Optional[str], Optional[str]]
+
+LABEL_GRID_MAX = 15  # Largest board drawn with one Label per cell; bigger boards always use CanvasBoard
+
+
+class CellGrid:
+    """
+    size x size matrix of cell widgets with a per-cell cache of what was last drawn.
+    The screen creates the Labels and hands each one to attach(); on_click(row, col) is called for
+    clicks on a cell while the grid is active.
+    """
+
+    def __init__(self, size: int, on_click: Optional[Callable[[int, int], None]] = None):
+        self.size = size
+        self.cells: List[List] = [[None] * size for _ in range(size)]  # Label widgets, filled in by the screen
+        self._drawn: List[List[Optional[CellLook]]] = [[None] * size for _ in range(size)]
+        self.config_calls = 0  # Number of .config() round trips made (handy when profiling)
+
+        self.on_click = on_click
+        self.active = on_click is not None
+        self._tag = f"CellGrid{id(self)}"  # Bind tag shared by this grid's cells: one binding for all of them
+        self._bound = False
+
+    def attach(self, widget, row: int, col: int) -> None:
+        """Register the Label drawn at (row, col); clickable grids route its clicks to on_click."""
+        self.cells[row][col] = widget
+        if self.on_click is None:
+            return
+        widget._cell = (row, col)
+        widget.bindtags((self._tag,) + tuple(widget.bindtags()))  # Cell events also go to the grid's tag
+        if not self._bound:
+            widget.bind_class(self._tag, "<Button-1>", self._on_press)  # Bound once, for every cell
+            self._bound = True
+
+    def _on_press(self, event) -> None:
+        if self.active:
+            self.on_click(*event.widget._cell)
+
+    def __getitem__(self, row: int) -> List:
+        return self.cells[row]
+
+    def __len__(self) -> int:
+        return self.size
+
+    def paint(self, row: int, col: int, bg: str, fg: Optional[str] = None, text: Optional[str] = None) -> None:
+        """Give cell (row, col) this look, calling into Tk only if it differs from what is on screen."""
+        look = (bg, fg, text)
+        drawn = self._drawn[row]
+        if drawn[col] == look:
+            return  # Already showing this: no Tcl round trip
+        drawn[col] = look
+
+        options = {"bg": bg}
+        if fg is not None:
+            options["fg"] = fg
+        if text is not None:
+            options["text"] = text
+        self.cells[row][col].config(**options)
+        self.config_calls += 1
+
+    def invalidate(self) -> None:
+        """Forget what was drawn so the next paint of each cell goes through to Tk (full repaint)."""
+        for row in self._drawn:
+            row[:] = [None] * self.size
+
+    def set_active(self, active: bool) -> None:
+        """Enable or disable clicks (a flag check in the shared click handler, not per-cell rebinding)."""
+        self.active = active and self.on_click is not None
+
+
+class CanvasBoard(tk.Canvas):
+    """
+    One Canvas drawing a size x size board with row/column headers.
+    on_click(row, col) is called for clicks on a cell while the board is active.
+    """
+
+    def __init__(self, parent, size: int, cell_px: int,
+                 on_click: Optional[Callable[[int, int], None]] = None, bg: str = "#ffffff", **kwargs):
+        self.board_size = size  # (not `size`: tk widgets already have a size() method)
+        self.cell_px = cell_px
+        self.origin = max(cell_px, 24)  # Room for the row numbers / column letters
+        side = self.origin + size * cell_px + 1
+        super().__init__(parent, width=side, height=side, highlightthickness=0, **kwargs)
+
+        self.on_click = on_click
+        self.active = on_click is not None
+        self.config_calls = 0  # Number of item updates sent to Tk (handy when profiling)
+
+        self._drawn: List[List[Optional[CellLook]]] = [[None] * size for _ in range(size)]
+        self._rects: List[List[int]] = []          # Canvas item id of each cell's rectangle
+        self._texts: Dict[Tuple[int, int], int] = {}  # Text items, only for cells that have shown a mark
+        self._font = ("Arial", max(6, cell_px // 2), "bold")
+
+        self._draw_headers()
+        self._draw_cells(bg)
+
+        if on_click is not None:
+            self.bind("<Button-1>", self._on_press)  # One handler for the whole board
+
+    def _draw_headers(self) -> None:
+        px, origin, size = self.cell_px, self.origin, self.board_size
+        step = 1 if px >= 18 else (5 if px >= 8 else 10)  # Thin cells: label every 5th / 10th line only
+        font = ("Arial", max(7, min(16, px // 2)), "bold")
+        for i in range(0, size, step):
+            centre = origin + i * px + px // 2
+            self.create_text(centre, origin // 2, text=col_to_letter(i), font=font)
+            self.create_text(origin // 2, centre, text=row_to_number(i), font=font)
+
+    def _draw_cells(self, bg: str) -> None:
+        px, origin = self.cell_px, self.origin
+        outline = "#000000" if px >= 6 else ""  # Tiny cells read better without borders
+        for r in range(self.board_size):
+            y = origin + r * px
+            self._rects.append([
+                self.create_rectangle(origin + c * px, y, origin + (c + 1) * px, y + px, fill=bg, outline=outline)
+                for c in range(self.board_size)
+            ])
+
+    def cell_at(self, x: int, y: int) -> Optional[Tuple[int, int]]:
+        """Hit-test: (row, col) under canvas pixel (x, y), or None outside the grid."""
+        col = (int(self.canvasx(x)) - self.origin) // self.cell_px
+        row = (int(self.canvasy(y)) - self.origin) // self.cell_px
+        if 0 <= row < self.board_size and 0 <= col < self.board_size:
+            return row, col
+        return None
+
+    def _on_press(self, event) -> None:
+        if not self.active:
+            return
+        cell = self.cell_at(event.x, event.y)
+        if cell is not None:
+            self.on_click(*cell)
+
+    def paint(self, row: int, col: int, bg: str, fg: Optional[str] = None, text: Optional[str] = None) -> None:
+        """Give cell (row, col) this look, updating canvas items only if it differs from what is drawn."""
+        look = (bg, fg, text)
+        drawn = self._drawn[row]
+        old = drawn[col]
+        if old == look:
+            return
+        drawn[col] = look
+
+        if old is None or old[0] != bg:
+            self.itemconfig(self._rects[row][col], fill=bg)
+            self.config_calls += 1
+
+        if (text is None and fg is None) or (old is not None and old[1:] == look[1:]):
+            return  # No text to show, or the text item already shows it
+        item = self._texts.get((row, col))
+        if item is None:
+            if not text:
+                return  # Nothing to show and no text item yet
+            px = self.cell_px
+            item = self.create_text(self.origin + col * px + px // 2, self.origin + row * px + px // 2,
+                                    text=text, fill=fg or "black", font=self._font)
+            self._texts[(row, col)] = item
+        else:
+            options = {}
+            if text is not None:
+                options["text"] = text
+            if fg is not None:
+                options["fill"] = fg
+            self.itemconfig(item, **options)
+        self.config_calls += 1
+
+    def invalidate(self) -> None:
+        """Forget what was drawn so the next paint of each cell goes through to Tk (full repaint)."""
+        for row in self._drawn:
+            row[:] = [None] * self.board_size
+
+    def set_active(self, active: bool) -> None:
+        """Enable or disable clicks (a flag check in the single click handler)."""
+        self.active = active and self.on_click is not None
+
+
+def canvas_cell_px(widget, size: int) -> int:
+    """Pixel size for CanvasBoard cells so two boards side by side fit on the screen."""
+    width = widget.winfo_screenwidth() // 2 - 120  # Each board gets about half the screen
+    height = widget.winfo_screenheight() - 330     # Leave room for the status bar, buttons and scoreboard
+    return max(4, min(56, min(width, height) // (size + 1)))
@@ -8,6 +8,7 @@ This is the largest and most important UI file, containing all three game screen
 WelcomeScreen lets the user choose how many ships to play with and initializes the game state accordingly.
 
 PlacementScreen handles ship placement for both players, enforcing turn order, ship sizes, orientation toggling, overlap rules, and allowing ships to be removed by clicking them again.
+An Auto place button fills in the remaining ships at random (game/fleetgen.py).
 
 BattleScreen manages the actual gameplay: selecting targets, firing shots, displaying hits/misses/sinks, switching turns with a delay, updating the scoreboard, and detecting win conditions.
 
@@ -15,15 +16,23 @@ This file focuses on UI behavior and flow, while delegating rule enforcement (hi
 
 '''
 
+import random
 import tkinter as tk
 from tkinter import ttk, messagebox
-from game.rules import fire_shot, ships_remaining, ship_hit_counters, UNKNOWN, MISS, HIT
+from game.rules import fire_shot, UNKNOWN, MISS, HIT
 from game.coords import col_to_letter, row_to_number
+from game.board import Board, GRID_SIZE
+from game.fleetgen import random_fleet
+from game.protocol import DEFAULT_PORT, fleet_words
+from game.record import GameRecord
+from game.ships import FleetProgress
+from game.stats import PlayerStats
+from app.ui_render import CellGrid, CanvasBoard, LABEL_GRID_MAX, canvas_cell_px
 
 
 MIN_SHIPS = 1
 MAX_SHIPS = 5
-GRID_SIZE = 10
+GRID_SIZES = (6, 8, 10, 12, 15, 20, 30, 50, 100)  # Board sizes offered on the welcome screen (above 15 boards are drawn on a Canvas)
 
 ACTIVE_BG = "#ffffff"
 COVER_BG = "#2b2b2b"
@@ -36,6 +45,13 @@ HIT_BG = "#c0392b"
 
 HIGHLIGHT_BG = "#f1c40f"
 TURN_DELAY_MS = 3000
+AI_DELAY_MS = 800  # Pause before the computer fires, so its turn is visible
+
+
+def _grid_key(app):
+    """(grid size, draw on Canvas?) for the current game: big boards always use a Canvas."""
+    size = app.state.grid_size
+    return size, size > LABEL_GRID_MAX or bool(getattr(app, "canvas_boards", False))
 
 
 class WelcomeScreen(tk.Frame):  # Screen 1: pick number of ships, then move to placement
@@ -68,13 +84,40 @@ class WelcomeScreen(tk.Frame):  # Screen 1: pick number of ships, then move to p
             justify="center",  # Center the selected value text
         ).pack(side="left")  # Place dropdown next to the label
 
+        self.size_var = tk.IntVar(value=GRID_SIZE)  # Board size for the next game (default 10x10)
+        tk.Label(row, text="Grid:", font=("Arial", 18)).pack(side="left", padx=(24, 8))  # Label next to dropdown
+        ttk.Combobox(  # Dropdown for board size selection
+            row,
+            textvariable=self.size_var,
+            values=list(GRID_SIZES),
+            state="readonly",
+            width=5,
+            justify="center",
+        ).pack(side="left")
+
         tk.Label(  # Small explanation text about ship sizes
             inner,
             text="Ship sizes are based on this number.\nExample: 3 ships means 1x1, 1x2, 1x3.",
             font=("Arial", 14),
             fg="#444",  # Gray text color
             justify="center",  # Center align multi-line text
-        ).pack(pady=(0, 18))  # Add spacing below text
+        ).pack(pady=(0, 12))  # Add spacing below text
+
+        self.vs_ai_var = tk.BooleanVar(value=False)  # True = Player 2 is the computer
+        tk.Checkbutton(
+            inner,
+            text="Play against the computer",
+            variable=self.vs_ai_var,
+            font=("Arial", 16),
+        ).pack(pady=(0, 6))
+
+        online_row = tk.Frame(inner)  # Online play: checkbox + server address
+        online_row.pack(pady=(0, 18))
+        self.online_var = tk.BooleanVar(value=False)  # True = play someone else through a game server
+        tk.Checkbutton(online_row, text="Play online, server:", variable=self.online_var,
+                       font=("Arial", 16)).pack(side="left")
+        self.server_var = tk.StringVar(value=f"127.0.0.1:{DEFAULT_PORT}")  # host:port of game/server.py
+        tk.Entry(online_row, textvariable=self.server_var, width=20, font=("Arial", 14)).pack(side="left", padx=6)
 
         tk.Button(inner, text="Continue →", width=18, font=("Arial", 16, "bold"), command=self.on_continue).pack()  # Button that triggers on_continue()
 
@@ -95,8 +138,22 @@ class WelcomeScreen(tk.Frame):  # Screen 1: pick number of ships, then move to p
             messagebox.showerror("Invalid", "Pick a number from 1 to 5.")  # Show error popup
             return  # Stop if invalid
 
+        if self.online_var.get():  # Online game: the server pairs us with an opponent who chose the same settings
+            self.app.start_online(self.server_var.get(), int(self.size_var.get()), n)
+            return
+
+        vs_ai = bool(self.vs_ai_var.get())
+        if vs_ai:
+            try:
+                import game.ai  # noqa: F401  (the computer opponent needs NumPy)
+            except ImportError:
+                messagebox.showerror("Computer opponent", "The computer opponent needs NumPy.\n\npip install numpy")
+                return
+
+        self.app.state.grid_size = int(self.size_var.get())  # Boards are rebuilt at this size by the reset
         self.app.state.reset_for_new_game()  # Clear old boards/ships/hits/turns (fresh start)
         self.app.state.num_ships = n  # Save ship count into shared GameState
+        self.app.state.ai_player = 2 if vs_ai else None  # Computer always plays as Player 2
         self.app.show_screen("PlacementScreen")  # Go to placement phase
 
 
@@ -132,6 +189,14 @@ class PlacementScreen(tk.Frame):  # Screen 2: both players place ships before ba
         )
         self.orient_btn.pack(side="left", padx=(20, 0))  # Place next to status label
 
+        self.auto_btn = tk.Button(  # Button that places the remaining ships at random
+            top,
+            text="Auto place",
+            command=self.on_auto_place,  # Calls auto-place handler
+            width=12,
+        )
+        self.auto_btn.pack(side="left", padx=(10, 0))  # Place next to the toggle button
+
         self.ready_btn = tk.Button(  # Button to finish current player's placement
             top,
             text="Ready",
@@ -157,21 +222,48 @@ class PlacementScreen(tk.Frame):  # Screen 2: both players place ships before ba
         self.p2_grid = tk.Frame(p2_panel)  # Grid frame for Player 2 cells
         self.p2_grid.pack()  # Pack the grid frame
 
-        self.p1_buttons = [[None] * GRID_SIZE for _ in range(GRID_SIZE)]  # Store Player 1 cell widgets
-        self.p2_buttons = [[None] * GRID_SIZE for _ in range(GRID_SIZE)]  # Store Player 2 cell widgets
-
-        self._make_grid(player=1)  # Build Player 1 grid widgets + bindings
-        self._make_grid(player=2)  # Build Player 2 grid widgets + bindings
+        self.board_size = 0  # Grid size the cell widgets are currently built for
+        self._grid_key = None  # (size, canvas?) the grids were built with
+        self._pending_after = None  # after() job id of the next scheduled transition
+        self._progress = {}  # player -> (fleet, num_ships, FleetProgress) for the fleet being placed
+        self._build_grids(self.app.state.grid_size)
 
     def tkraise(self, aboveThis=None):
+        if self._grid_key != _grid_key(self.app):  # New board size, or the board style was switched
+            self._build_grids(self.app.state.grid_size)
+
         # Re-enable buttons in case they were disabled in previous game
         self.ready_btn.config(state="normal")      # Allow pressing Ready again
         self.orient_btn.config(state="normal")     # Allow toggling orientation again
+        self.auto_btn.config(state="normal")       # Allow auto placement again
 
         self.refresh_ui()                          # Redraw board + update status text
         super().tkraise(aboveThis)                 # Bring this screen to front
 
 
+    def _build_grids(self, size: int):
+        for frame in (self.p1_grid, self.p2_grid):  # Drop widgets from a previous board size
+            for child in frame.winfo_children():
+                child.destroy()
+
+        self.board_size = size
+        self._grid_key = _grid_key(self.app)
+
+        if self._grid_key[1]:  # One Canvas per board
+            px = canvas_cell_px(self, size)
+            self.p1_buttons = CanvasBoard(self.p1_grid, size, px, lambda r, c: self.on_cell_click(1, r, c))
+            self.p2_buttons = CanvasBoard(self.p2_grid, size, px, lambda r, c: self.on_cell_click(2, r, c))
+            self.p1_buttons.pack()
+            self.p2_buttons.pack()
+            return
+
+        # One delegated click handler per board; on_cell_click checks whose turn it is
+        self.p1_buttons = CellGrid(size, lambda r, c: self.on_cell_click(1, r, c))  # Player 1 cells (+ what each shows)
+        self.p2_buttons = CellGrid(size, lambda r, c: self.on_cell_click(2, r, c))  # Player 2 cells
+
+        self._make_grid(player=1)  # Build Player 1 grid widgets + bindings
+        self._make_grid(player=2)  # Build Player 2 grid widgets + bindings
+
     def _make_grid(self, player: int):
         frame = self.p1_grid if player == 1 else self.p2_grid  # Choose correct grid frame
         cells = self.p1_buttons if player == 1 else self.p2_buttons  # Choose correct button matrix
@@ -179,7 +271,7 @@ class PlacementScreen(tk.Frame):  # Screen 2: both players place ships before ba
         tk.Label(frame, text="", width=4).grid(row=0, column=0)  # Top-left empty corner
 
         # Column headers (A–J)
-        for c in range(GRID_SIZE):
+        for c in range(self.board_size):
             tk.Label(
                 frame,
                 text=col_to_letter(c),  # Convert column index to letter
@@ -187,14 +279,14 @@ class PlacementScreen(tk.Frame):  # Screen 2: both players place ships before ba
             ).grid(row=0, column=c + 1)
 
         # Row headers + actual grid cells
-        for r in range(GRID_SIZE):
+        for r in range(self.board_size):
             tk.Label(
                 frame,
                 text=row_to_number(r),  # Convert row index to 1–10
                 font=("Arial", 16, "bold")
             ).grid(row=r + 1, column=0)
 
-            for c in range(GRID_SIZE):
+            for c in range(self.board_size):
                 cell = tk.Label(
                     frame,
                     text="",
@@ -206,14 +298,7 @@ class PlacementScreen(tk.Frame):  # Screen 2: both players place ships before ba
                 )
                 cell.grid(row=r + 1, column=c + 1, padx=1, pady=1)
 
-                # Click handler wrapper to preserve loop variables
-                def handler(event, rr=r, cc=c, pp=player):
-                    self.on_cell_click(pp, rr, cc)
-
-                cell._click_handler = handler  # Store handler reference
-                cell.bind("<Button-1>", cell._click_handler)  # Bind click event
-
-                cells[r][c] = cell  # Save widget reference in matrix
+                cells.attach(cell, r, c)  # Save widget reference; clicks go to the grid's shared handler
 
     def toggle_orientation(self):
         s = self.app.state
@@ -230,63 +315,31 @@ class PlacementScreen(tk.Frame):  # Screen 2: both players place ships before ba
         if s.num_ships is None:  # Safety check
             return
 
-        board = self._board_for_player(player)  # Get correct board array
-        ships_list = self._ships_list_for_player(player)  # Get correct ship list
+        board = self._engine(player)  # Grid + fleet of the player being edited
+        progress = self._progress_for(player)  # Required vs. placed ships
 
-        # If clicking an occupied cell → remove entire ship
-        if board[row][col] == 1:
-            for i, ship in enumerate(ships_list):
-                if (row, col) in ship:
-                    for rr, cc in ship:  # Clear all ship cells from board
-                        board[rr][cc] = 0
-                    ships_list.pop(i)  # Remove ship from list
-                    self.refresh_ui()
-                    return
+        # If clicking an occupied cell → remove entire ship (cell -> ship id lookup, no scan)
+        removed = board.remove_at(row, col)
+        if removed is not None:
+            progress.remove(len(removed))
+            self._refresh_cells(player, removed)
+            return
 
         # Otherwise place the next required ship
-        length = self._next_required_length(player)  # Determine which ship length is next
+        length = progress.next_length()  # Determine which ship length is next
 
-        if length > s.num_ships:  # All ships placed
+        if length is None:  # All ships placed
             return
 
         orient = s.placing_orientation  # Current orientation
 
-        if not self.can_place(board, row, col, length, orient):  # Validate placement
+        if not board.can_place(row, col, length, orient):  # Validate placement
             messagebox.showerror("Invalid placement", "That ship doesn't fit there or overlaps another ship.")
             return
 
-        coords = self.place_ship(board, row, col, length, orient)  # Place ship
-        ships_list.append(coords)  # Add ship coordinates to state
-
-        self.refresh_ui()
-
-
-    def can_place(self, board, row, col, length, orient) -> bool:
-        if orient == "H":
-            if col + length - 1 >= GRID_SIZE:  # Right boundary check
-                return False
-            cells = [(row, col + i) for i in range(length)]
-        else:
-            if row + length - 1 >= GRID_SIZE:  # Bottom boundary check
-                return False
-            cells = [(row + i, col) for i in range(length)]
-
-        return all(board[r][c] == 0 for r, c in cells)  # Overlap check
-
-
-    def place_ship(self, board, row, col, length, orient):
-        coords = []  # Will store ship coordinates
-
-        if orient == "H":
-            for i in range(length):
-                board[row][col + i] = 1  # Mark board
-                coords.append((row, col + i))  # Store coordinate
-        else:
-            for i in range(length):
-                board[row + i][col] = 1
-                coords.append((row + i, col))
-
-        return coords  # Return full ship coordinate list
+        coords = board.place(row, col, length, orient)  # Marks the grid and adds the ship to the fleet
+        progress.place(length)
+        self._refresh_cells(player, coords)
 
 
     def on_ready(self):
@@ -296,14 +349,24 @@ class PlacementScreen(tk.Frame):  # Screen 2: both players place ships before ba
             return
 
         ships_list = self._ships_list_for_player(s.placing_player)  # Get current player's ships
+        progress = self._progress_for(s.placing_player)
 
         # Ensure all required ships are placed
-        if len(ships_list) < s.num_ships:
-            remaining = s.num_ships - len(ships_list)
-            messagebox.showinfo("Not ready", f"Place all ships first. Remaining: {remaining}")
+        if not progress.complete():
+            messagebox.showinfo("Not ready", f"Place all ships first. Remaining: {progress.remaining}")
             return
 
-        if s.placing_player == 1:
+        if self.app.net is not None:
+            # Online: send our fleet; the battle starts when the server says both fleets are in
+            self.app.net.send("PLACE", *fleet_words(ships_list))
+            self.status_lbl.config(text="Fleet sent! Waiting for your opponent...")
+            self.ready_btn.config(state="disabled")
+            self.orient_btn.config(state="disabled")
+            self.auto_btn.config(state="disabled")
+            self._set_active(self.p1_buttons, active=False)
+            return
+
+        if s.placing_player == 1 and s.ai_player != 2:
             # Switch to Player 2 placement phase
             s.placing_player = 2
             s.placing_ship_len = 1  # Reset ship length tracker
@@ -312,11 +375,15 @@ class PlacementScreen(tk.Frame):  # Screen 2: both players place ships before ba
             self.refresh_ui()
             return
 
+        if s.ai_player == 2:
+            self._auto_place(2)  # Computer lays out its fleet at random
+
         # If Player 2 finished → short delay before battle phase
         self.status_lbl.config(text="All ships placed! Starting battle...")  # Show transition message
 
         self.ready_btn.config(state="disabled")   # Prevent double clicks during delay
         self.orient_btn.config(state="disabled")  # Prevent orientation toggling during delay
+        self.auto_btn.config(state="disabled")    # Prevent auto placement during delay
 
         # Hide both placement boards immediately so neither player can see the other's ships
         # (cover with dark background and disable interactions). This is for
@@ -330,10 +397,45 @@ class PlacementScreen(tk.Frame):  # Screen 2: both players place ships before ba
         self._set_active(self.p1_buttons, active=False)
         self._set_active(self.p2_buttons, active=False)
 
-        self.after(3000, lambda: self.app.show_screen("BattleScreen"))  # Wait 3 seconds, then switch
+        # Wait 3 seconds, then switch
+        self._pending_after = self.after(3000, lambda: self.app.show_screen("BattleScreen"))
         return  # IMPORTANT: stop function here
     
 
+    def cancel_pending(self):
+        """Drop a scheduled switch to the battle (e.g. before a saved game is loaded)."""
+        if self._pending_after is not None:
+            try:
+                self.after_cancel(self._pending_after)
+            except Exception:
+                pass
+            self._pending_after = None
+
+    def on_auto_place(self):
+        s = self.app.state
+
+        if s.num_ships is None:  # Safety check
+            return
+
+        try:
+            self._auto_place(s.placing_player)  # Fill in whatever ships are still missing
+        except ValueError:
+            messagebox.showerror("Auto place", "The remaining ships don't fit around the ones already placed.")
+            return
+
+        self.refresh_ui()
+
+    def _auto_place(self, player: int):
+        """Place every ship `player` still needs at random legal positions, around any ships already placed."""
+        s = self.app.state
+        board = self._engine(player)
+        progress = self._progress_for(player)
+
+        taken = [cell for ship in board.fleet for cell in ship]
+        for coords in random_fleet(progress.missing(), s.grid_size, random.Random(), taken):
+            board.add_ship(coords)
+            progress.place(len(coords))
+
     def refresh_ui(self):
         s = self.app.state
 
@@ -341,16 +443,7 @@ class PlacementScreen(tk.Frame):  # Screen 2: both players place ships before ba
             self.status_lbl.config(text="Placement")
             return
 
-        next_len = self._next_required_length(s.placing_player)  # Determine next ship length
-
-        if next_len <= s.num_ships:
-            self.status_lbl.config(
-                text=f"Placement — Player {s.placing_player}: place ship length {next_len}"
-            )
-        else:
-            self.status_lbl.config(
-                text=f"Placement — Player {s.placing_player}: all ships placed. Click Ready."
-            )
+        self._refresh_status()
 
         # Determine which board is active
         p1_turn = (s.placing_player == 1)
@@ -367,28 +460,46 @@ class PlacementScreen(tk.Frame):  # Screen 2: both players place ships before ba
         self._set_active(self.p1_buttons, active=p1_turn)
         self._set_active(self.p2_buttons, active=p2_turn)
 
+    def _refresh_cells(self, player: int, cells):
+        """After a single ship edit: repaint only that ship's cells (not the whole board) and the status line."""
+        self._refresh_status()
+        board = self._board_for_player(player)
+        buttons = self.p1_buttons if player == 1 else self.p2_buttons
+        color = P1_SHIP_BG if player == 1 else P2_SHIP_BG
+        for r, c in cells:
+            buttons.paint(r, c, color if board.get(r, c) == 1 else ACTIVE_BG)
+
+    def _refresh_status(self):
+        s = self.app.state
+        next_len = self._progress_for(s.placing_player).next_length()  # Determine next ship length
+
+        if next_len is not None:
+            self.status_lbl.config(
+                text=f"Placement — Player {s.placing_player}: place ship length {next_len}"
+            )
+        else:
+            self.status_lbl.config(
+                text=f"Placement — Player {s.placing_player}: all ships placed. Click Ready."
+            )
+
 
     def _render_board(self, cells, board, show_ships: bool, ship_color: str, covered: bool):
-        for r in range(GRID_SIZE):
-            for c in range(GRID_SIZE):
+        # cells.paint() only reaches Tk for cells whose colour actually changed
+        for r in range(self.board_size):
+            for c in range(self.board_size):
 
                 if covered:  # Hide entire board when not player's turn
-                    cells[r][c].config(bg=COVER_BG)
+                    cells.paint(r, c, COVER_BG)
                     continue
 
-                if board[r][c] == 1 and show_ships:
-                    cells[r][c].config(bg=ship_color)  # Show ship color
+                if board.get(r, c) == 1 and show_ships:
+                    cells.paint(r, c, ship_color)  # Show ship color
                 else:
-                    cells[r][c].config(bg=ACTIVE_BG)  # Default empty cell color
+                    cells.paint(r, c, ACTIVE_BG)  # Default empty cell color
 
 
     def _set_active(self, cells, active: bool):
-        for r in range(GRID_SIZE):
-            for c in range(GRID_SIZE):
-                if active:
-                    cells[r][c].bind("<Button-1>", cells[r][c]._click_handler)  # Enable clicks
-                else:
-                    cells[r][c].unbind("<Button-1>")  # Disable clicks
+        cells.set_active(active)  # Enable/disable clicks (Label grid or Canvas board)
 
                     
     def _ships_list_for_player(self, player: int):
@@ -400,20 +511,26 @@ class PlacementScreen(tk.Frame):  # Screen 2: both players place ships before ba
         s = self.app.state
         return s.p1_board if player == 1 else s.p2_board  # Return correct board array
 
-
-    def _next_required_length(self, player: int) -> int:
+    def _engine(self, player: int) -> Board:
+        """game.board.Board view over a player's grid and fleet in the app state (edits go straight to the state)."""
         s = self.app.state
+        return Board(s.grid_size, grid=self._board_for_player(player), fleet=self._ships_list_for_player(player))
 
-        if s.num_ships is None:
-            return 1
-
-        placed_lengths = {len(ship) for ship in self._ships_list_for_player(player)}  # Set of placed ship sizes
-
-        for L in range(1, s.num_ships + 1):  # Ships must be placed in order 1..N
-            if L not in placed_lengths:
-                return L
 
-        return s.num_ships + 1  # All ships placed
+    def _progress_for(self, player: int) -> FleetProgress:
+        """
+        Placement progress for a player's fleet, kept up to date by the edits on this screen.
+        Rebuilt (one pass over the placed ships) when the fleet object or ship count changed
+        (a new game or a loaded save), or when ships were added or removed outside this screen.
+        """
+        s = self.app.state
+        fleet = self._ships_list_for_player(player)
+        cached = self._progress.get(player)
+        if (cached is None or cached[0] is not fleet or cached[1] != s.num_ships
+                or cached[2].placed != len(fleet)):
+            progress = FleetProgress.for_ship_count(s.num_ships or 0, (len(ship) for ship in fleet))
+            cached = self._progress[player] = (fleet, s.num_ships, progress)
+        return cached[2]
 
 
 class BattleScreen(tk.Frame):
@@ -433,6 +550,7 @@ class BattleScreen(tk.Frame):
 
         self.selected = None        # Stores selected target cell as (row, col)
         self.input_locked = False   # True while waiting during turn-delay / win-delay
+        self._ai = None             # DensityAI instance when playing against the computer
 
         root = tk.Frame(self)  # Root container for this screen
         root.pack(fill="x", expand=True)  # Expand horizontally
@@ -491,11 +609,10 @@ class BattleScreen(tk.Frame):
         self.target_grid.pack()
 
         # 2D matrices holding cell widgets
-        self.own_cells = [[None] * GRID_SIZE for _ in range(GRID_SIZE)]  # Own board widgets
-        self.target_cells = [[None] * GRID_SIZE for _ in range(GRID_SIZE)]  # Target board widgets
-
-        self._make_grid(self.own_grid, self.own_cells, clickable=False)  # Build own board (no clicks)
-        self._make_grid(self.target_grid, self.target_cells, clickable=True)  # Build target board (clickable)
+        self.board_size = 0  # Grid size the cell widgets are currently built for
+        self._grid_key = None  # (size, canvas?) the grids were built with
+        self._pending_after = None  # after() job id of the next scheduled transition
+        self._build_grids(self.app.state.grid_size)
 
         # Scoreboard label (shows both players stats)
         self.score_lbl = tk.Label(
@@ -515,6 +632,9 @@ class BattleScreen(tk.Frame):
 
 
     def tkraise(self, aboveThis=None):
+        if self._grid_key != _grid_key(self.app):  # New board size, or the board style was switched
+            self._build_grids(self.app.state.grid_size)
+
         # Reset per-game / per-entry UI state when this screen is shown
         self.selected = None  # Clear any previous selection
         self.input_locked = False  # Allow input again
@@ -523,15 +643,68 @@ class BattleScreen(tk.Frame):
         self._cancel_shot_blackout()
         self._end_shot_blackout()
 
+        # Scoreboards are built once from the placed fleets; fire_shot keeps them current after that
+        s = self.app.state
+        s.p1_stats = PlayerStats.for_fleet(s.p1_ships, s.p1_shots, s.p2_ships)
+        s.p2_stats = PlayerStats.for_fleet(s.p2_ships, s.p2_shots, s.p1_ships)
+        if s.record is None:  # Start the move history once the fleets are final
+            s.record = GameRecord.from_fleets(s.grid_size, s.p1_ships, s.p2_ships)
+
+        if self.app.net is not None:  # Online: we don't know the opponent's fleet, only what the server reports
+            s.p2_stats.ships_afloat = s.num_ships or 0
+
+        if self.app.state.ai_player is not None and self.app.net is None:
+            from game.ai import DensityAI  # Imported lazily: only AI games need NumPy
+            self._ai = DensityAI()  # Fresh AI memory for every game
+        else:
+            self._ai = None
+
+        if s.current_turn == s.ai_player and self.app.net is None:  # Resumed on the computer's turn
+            self.input_locked = True
+            self.fire_btn.config(state="disabled")
+            self._pending_after = self.after(AI_DELAY_MS, self._ai_fire)
+
         self.refresh_ui()  # Re-render boards + scoreboard based on current GameState
         super().tkraise(aboveThis)  # Bring this screen to the front
 
+    def cancel_pending(self):
+        """Drop any scheduled turn switch / AI shot / win transition (e.g. before a saved game is loaded)."""
+        if self._pending_after is not None:
+            try:
+                self.after_cancel(self._pending_after)
+            except Exception:
+                pass
+            self._pending_after = None
+        self._cancel_shot_blackout()
+
+
+    def _build_grids(self, size: int):
+        for frame in (self.own_grid, self.target_grid):  # Drop widgets from a previous board size
+            for child in frame.winfo_children():
+                child.destroy()
 
-    def _make_grid(self, frame, cells, clickable: bool):
+        self.board_size = size
+        self._grid_key = _grid_key(self.app)
+
+        if self._grid_key[1]:  # One Canvas per board
+            px = canvas_cell_px(self, size)
+            self.own_cells = CanvasBoard(self.own_grid, size, px)  # Display only
+            self.target_cells = CanvasBoard(self.target_grid, size, px, self.on_select)  # Click selects a target
+            self.own_cells.pack()
+            self.target_cells.pack()
+            return
+
+        self.own_cells = CellGrid(size)  # Own board widgets (+ what each currently shows), display only
+        self.target_cells = CellGrid(size, self.on_select)  # Target board widgets; one delegated click handler
+
+        self._make_grid(self.own_grid, self.own_cells)  # Build own board (no clicks)
+        self._make_grid(self.target_grid, self.target_cells)  # Build target board (clickable)
+
+    def _make_grid(self, frame, cells):
         tk.Label(frame, text="", width=4).grid(row=0, column=0)  # Top-left empty corner (aligns headers)
 
         # Column headers A–J
-        for c in range(GRID_SIZE):
+        for c in range(self.board_size):
             tk.Label(
                 frame,
                 text=col_to_letter(c),  # Convert column index to A–J
@@ -539,14 +712,14 @@ class BattleScreen(tk.Frame):
             ).grid(row=0, column=c + 1)  # +1 because col 0 is reserved for row labels
 
         # Row headers 1–10 + create grid cells
-        for r in range(GRID_SIZE):
+        for r in range(self.board_size):
             tk.Label(
                 frame,
                 text=row_to_number(r),  # Convert row index to 1–10
                 font=("Arial", 16, "bold")
             ).grid(row=r + 1, column=0)  # +1 because row 0 is reserved for column labels
 
-            for c in range(GRID_SIZE):
+            for c in range(self.board_size):
                 cell = tk.Label(
                     frame,
                     text="",
@@ -559,22 +732,16 @@ class BattleScreen(tk.Frame):
                 )
                 cell.grid(row=r + 1, column=c + 1, padx=1, pady=1)  # Place cell widget
 
-                if clickable:  # Only target grid should be clickable
-                    def handler(event, rr=r, cc=c):
-                        self.on_select(rr, cc)  # Save selection and refresh UI
-
-                    cell._click_handler = handler  # Store handler so we can rebind later
-                    cell.bind("<Button-1>", cell._click_handler)  # Bind click event
-
-                cells[r][c] = cell  # Store the widget in the 2D matrix
+                cells.attach(cell, r, c)  # Store the widget; clicks (target grid only) go to the grid's handler
 
 
     def on_select(self, row: int, col: int):
-        if self.input_locked:  # Prevent selecting during turn switch delay / win delay
+        # The target board's single click handler: input state is checked here, when the click arrives
+        if self.input_locked or self._shot_blackout_active:  # Prevent selecting during delays / hand-off blackout
             return
 
-        self.selected = (row, col)  # Store current target selection
-        self.refresh_ui()  # Refresh to apply highlight on selected target cell
+        previous, self.selected = self.selected, (row, col)  # Store current target selection
+        self.refresh_ui(changed=(previous, self.selected))  # Only the old and new highlight change
 
     def on_fire_pressed(self):
         if self.input_locked:  # Block firing while locked (during delay)
@@ -584,22 +751,50 @@ class BattleScreen(tk.Frame):
             self.result_lbl.config(text="SELECT A CELL")
             return
 
-        s = self.app.state  # Shortcut to shared GameState
         row, col = self.selected  # Target cell
+        self._fire(row, col)
+
+    def _ai_fire(self):
+        """Let the computer pick a target from its own shot board and fire."""
+        s = self.app.state
+        if s.ai_player == 1:
+            shots_board, enemy_ships = s.p1_shots, s.p2_ships
+        else:
+            shots_board, enemy_ships = s.p2_shots, s.p1_ships
+
+        row, col = self._ai(shots_board, enemy_ships.afloat_lengths())
+        self._fire(row, col)
+
+    def _fire(self, row: int, col: int):
+        """Resolve a shot at (row, col) for the current player (human or computer)."""
+        s = self.app.state  # Shortcut to shared GameState
         turn = s.current_turn  # Whose turn (1 or 2)
 
+        if self.app.net is not None:  # Online: the server resolves the shot and reports it (online_shot)
+            if s.p1_shots.is_shot(row, col):
+                self.result_lbl.config(text="ALREADY SHOT")
+                return
+            self.app.net.send("FIRE", row, col)
+            self.input_locked = True  # Until the server's TURN arrives
+            self.fire_btn.config(state="disabled")
+            previous, self.selected = self.selected, None
+            self.refresh_ui(changed=(previous,))  # Drop the highlight; the mark arrives with online_shot
+            return
+
         # Choose attacker/defender structures based on current turn
         if turn == 1:
             attacker_shots = s.p1_shots  # What P1 has fired at P2 (public marks)
             defender_incoming = s.p2_incoming  # What P2 has received from P1 (for P2 own-board view)
             defender_ships = s.p2_ships  # P2 ship coordinate lists
             defender_hits = s.p2_hits  # P2 hit set
+            attacker_stats, defender_stats = s.p1_stats, s.p2_stats  # Running scoreboards
             winner_num = 1  # If defender loses all ships, attacker is player 1
         else:
             attacker_shots = s.p2_shots  # What P2 has fired at P1
             defender_incoming = s.p1_incoming  # What P1 has received from P2
             defender_ships = s.p1_ships  # P1 ships
             defender_hits = s.p1_hits  # P1 hits
+            attacker_stats, defender_stats = s.p2_stats, s.p1_stats  # Running scoreboards
             winner_num = 2  # If defender loses all ships, attacker is player 2
 
         # Use rules engine to resolve the shot and update boards/sets
@@ -609,7 +804,9 @@ class BattleScreen(tk.Frame):
             defender_ships,      # Defender ships (list of coord lists)
             defender_hits,       # Defender hit set (tracks all hit coords)
             row,                 # Target row
-            col                  # Target col
+            col,                 # Target col
+            attacker_stats,      # Shooter's scoreboard (shots/hits/misses)
+            defender_stats,      # Target's scoreboard (ships afloat, per-ship hits)
         )
 
         # If this cell was already fired on, do not proceed
@@ -617,27 +814,21 @@ class BattleScreen(tk.Frame):
             self.result_lbl.config(text="ALREADY SHOT")
             return
 
+        s.record.add_shot(row, col, result != "miss")  # Append to the game's move history
+
         # Show HIT/MISS/SINK immediately
         self.result_lbl.config(text=result.upper())
 
-        self.selected = None  # Clear current target selection
-        self.refresh_ui()  # Repaint boards so shot mark appears immediately
+        previous, self.selected = self.selected, None  # Clear current target selection
+        self.refresh_ui(changed=(previous, (row, col)))  # Repaint the shot cell (and old highlight) immediately
         # 1.5s after a valid shot, briefly black out the screen for hand-off
-        self._schedule_shot_blackout(1500, 1500)
+        # (not needed against the computer: nobody else shares the screen)
+        if s.ai_player is None:
+            self._schedule_shot_blackout(1500, 1500)
 
         # Check win condition: if defender has 0 ships remaining, attacker wins
-        if ships_remaining(defender_ships, defender_hits) == 0:
-            self.input_locked = True  # Prevent any more interaction
-            self.fire_btn.config(state="disabled")  # Disable FIRE button
-            self.result_lbl.config(text=f"PLAYER {winner_num} WINS!")  # Show win message on BattleScreen
-
-            def go_to_win():
-                win_screen = self.app.screens["WinScreen"]  # Get WinScreen instance
-                win_screen.set_winner(f"PLAYER {winner_num} WINS!")  # Set winner text
-                win_screen.set_stats()  # Compute + display final stats
-                self.app.show_screen("WinScreen")  # Switch to WinScreen
-
-            self._pending_after = self.after(1500, go_to_win)  # Delay 1.5 sec then go to win screen
+        if defender_stats.ships_afloat == 0:
+            self._finish(winner_num)
             return
 
         # If no win, lock input and schedule turn switch
@@ -645,6 +836,64 @@ class BattleScreen(tk.Frame):
         self.fire_btn.config(state="disabled")  # Disable FIRE button during delay
         self._pending_after = self.after(TURN_DELAY_MS, self._switch_turn)  # Schedule turn swap
 
+    def _finish(self, winner_num: int):
+        """The game is won: freeze the board, then move on to the WinScreen."""
+        self.app.state.record.winner = winner_num  # Finished game: the record can be saved from the menu
+        self.input_locked = True  # Prevent any more interaction
+        self.fire_btn.config(state="disabled")  # Disable FIRE button
+        if self.app.net is not None and winner_num == 1:
+            winner_text = "YOU WIN!"
+        else:
+            winner_text = f"{self._player_name(winner_num).upper()} WINS!"
+        self.result_lbl.config(text=winner_text)  # Show win message on BattleScreen
+
+        def go_to_win():
+            win_screen = self.app.screen("WinScreen")  # Get WinScreen instance (built if needed)
+            win_screen.set_winner(winner_text)  # Set winner text
+            win_screen.set_stats()  # Compute + display final stats
+            self.app.show_screen("WinScreen")  # Switch to WinScreen
+
+        self._pending_after = self.after(1500, go_to_win)  # Delay 1.5 sec then go to win screen
+
+    # --- online play: the App forwards server messages here (slot 1 = us, slot 2 = the opponent) ---
+
+    def online_turn(self, slot: int):
+        """The server says `slot` fires next."""
+        self.app.state.current_turn = slot
+        self.input_locked = slot != 1
+        self.fire_btn.config(state="normal" if slot == 1 else "disabled")
+        self.refresh_ui(changed=(self.selected,))  # The highlight only shows while input is open
+
+    def online_shot(self, slot: int, row: int, col: int, result: str):
+        """A shot resolved by the server: ours at the opponent, or theirs at our fleet."""
+        s = self.app.state
+        if slot == 1:
+            mark = MISS if result == "miss" else HIT
+            s.p1_shots.put(row, col, mark)
+            s.p2_incoming.put(row, col, mark)
+            s.p1_stats.record_shot(hit=result != "miss", sunk=result == "sink")
+            if result == "sink":  # The opponent's per-ship damage is unknown here; only sinks are counted
+                s.p2_stats.ships_afloat -= 1
+            self.result_lbl.config(text=result.upper())
+        else:
+            # Our own fleet is known here, so the same rules engine resolves it (and agrees with the server)
+            result = fire_shot(s.p2_shots, s.p1_incoming, s.p1_ships, s.p1_hits, row, col, s.p2_stats, s.p1_stats)
+            self.result_lbl.config(text=f"OPPONENT: {result.upper()}")
+        s.record.add_shot(row, col, result != "miss")
+        self.refresh_ui(changed=((row, col),))
+
+    def online_error(self):
+        """The server rejected our FIRE: it is still our turn, so let the player pick again."""
+        if self.app.state.current_turn != 1:
+            return
+        self.input_locked = False
+        self.fire_btn.config(state="normal")
+        self.result_lbl.config(text="SHOT REJECTED")
+        self.refresh_ui(changed=(self.selected,))
+
+    def online_over(self, slot: int):
+        self._finish(slot)
+
     def _schedule_shot_blackout(self, delay_ms: int = 1500, duration_ms: int = 1500):
         """Wait `delay_ms` after a valid shot, then cover BOTH boards for `duration_ms`."""
         self._cancel_shot_blackout()
@@ -685,15 +934,14 @@ class BattleScreen(tk.Frame):
     def _render_blackout_boards(self):
         """Render both grids as covered (no marks, no selection, no clicks)."""
         # Cover own grid
-        for r in range(GRID_SIZE):
-            for c in range(GRID_SIZE):
-                self.own_cells[r][c].config(bg=COVER_BG, fg="black", text="")
+        for r in range(self.board_size):
+            for c in range(self.board_size):
+                self.own_cells.paint(r, c, COVER_BG, "black", "")
 
-        # Cover target grid and disable selection clicks
-        for r in range(GRID_SIZE):
-            for c in range(GRID_SIZE):
-                self.target_cells[r][c].config(bg=COVER_BG, fg="black", text="")
-                self.target_cells[r][c].unbind("<Button-1>")
+        # Cover target grid (on_select ignores clicks while the blackout is up)
+        for r in range(self.board_size):
+            for c in range(self.board_size):
+                self.target_cells.paint(r, c, COVER_BG, "black", "")
 
     def _switch_turn(self):
         s = self.app.state  # Shortcut to shared GameState
@@ -709,13 +957,48 @@ class BattleScreen(tk.Frame):
 
         self.fire_btn.config(state="normal")  # Re-enable FIRE button
 
-        self.refresh_ui()  # Re-render boards + scoreboard for new player view
+        # Hand-off: the boards now show the other player's view, so repaint every cell
+        # (against the computer the human's view never changes: only the highlight can, with the input lock)
+        changed = None
+        if s.ai_player is None:
+            self.own_cells.invalidate()
+            self.target_cells.invalidate()
+        else:
+            changed = (self.selected,)
 
+        if s.current_turn == s.ai_player:
+            # Computer's turn: keep the human locked out, then fire after a short pause
+            self.input_locked = True
+            self.fire_btn.config(state="disabled")
+            self._pending_after = self.after(AI_DELAY_MS, self._ai_fire)
 
-    def refresh_ui(self):
+        self.refresh_ui(changed=changed)  # Re-render boards + scoreboard for new player view
+
+    def _player_name(self, num: int) -> str:
+        if self.app.net is not None:
+            return "You" if num == 1 else "Opponent"
+        return "Computer" if num == self.app.state.ai_player else f"Player {num}"
+
+    def _viewer(self) -> int:
+        """Whose boards are on screen: the current player, or always the human against the computer."""
+        s = self.app.state
+        if s.ai_player is not None:
+            return 2 if s.ai_player == 1 else 1
+        return s.current_turn
+
+
+    def refresh_ui(self, changed=None):
+        """
+        Redraw the turn label, both boards and the scoreboard.
+        changed: the (row, col) cells that may look different since the last refresh (None entries are skipped);
+        only those are repainted. None repaints every cell (first draw, hand-off, end of a blackout).
+        """
         s = self.app.state  # Shared GameState
-        turn = s.current_turn  # Current player turn (1 or 2)
-        self.turn_lbl.config(text=f"Player {turn}'s turn")  # Update top label
+        if self.app.net is not None and s.current_turn == 1:
+            self.turn_lbl.config(text="Your turn")  # Online: the local player is always slot 1
+        else:
+            self.turn_lbl.config(text=f"{self._player_name(s.current_turn)}'s turn")  # Update top label
+        turn = self._viewer()  # Player whose boards are shown (1 or 2)
         # If we're in the post-shot blackout window, cover both boards and stop.
         if self._shot_blackout_active:
             self._render_blackout_boards()
@@ -728,9 +1011,6 @@ class BattleScreen(tk.Frame):
             own_color = P1_SHIP_BG           # Color to show P1 ships
 
             my_shots = s.p1_shots            # What P1 has fired at P2 (unknown/miss/hit)
-
-            p1_stats = self._stats(s.p1_shots, s.p1_ships, s.p1_hits)  # P1 stats
-            p2_stats = self._stats(s.p2_shots, s.p2_ships, s.p2_hits)  # P2 stats
         else:
             own_ship_board = s.p2_board      # Player 2 ship layout
             own_incoming = s.p2_incoming     # What Player 1 has done to Player 2
@@ -738,50 +1018,37 @@ class BattleScreen(tk.Frame):
 
             my_shots = s.p2_shots            # What P2 has fired at P1
 
-            p1_stats = self._stats(s.p1_shots, s.p1_ships, s.p1_hits)  # P1 stats
-            p2_stats = self._stats(s.p2_shots, s.p2_ships, s.p2_hits)  # P2 stats
-
         # Render left board (ships visible + incoming marks)
-        self._render_own_board(self.own_cells, own_ship_board, own_incoming, own_color)
-
-        # Render right board (opponent ships hidden except your shots)
-        self._render_target_board(self.target_cells, my_shots)
-
-        # Build ship-hit counter text for scoreboard
-        p1_ship_counters = ship_hit_counters(s.p1_ships, s.p1_hits)  # List like ["1/1", "0/2", ...]
-        p2_ship_counters = ship_hit_counters(s.p2_ships, s.p2_hits)
+        # and right board (opponent ships hidden except your shots), with the selected target highlighted
+        highlight = self.selected if not self.input_locked else None
+        if changed is None:
+            self._render_own_board(self.own_cells, own_ship_board, own_incoming, own_color)
+            self._render_target_board(self.target_cells, my_shots, highlight)
+        else:
+            for cell in changed:
+                if cell is None:
+                    continue
+                r, c = cell
+                self._paint_own_cell(self.own_cells, r, c, own_ship_board, own_incoming, own_color)
+                self._paint_target_cell(self.target_cells, r, c, my_shots, highlight)
 
-        p1_ship_line = ", ".join(p1_ship_counters) if p1_ship_counters else "-"  # Join or show "-"
-        p2_ship_line = ", ".join(p2_ship_counters) if p2_ship_counters else "-"
+        # Scoreboard reads the running stats (fire_shot keeps them current, nothing is rescanned)
+        p1_stats, p2_stats = s.p1_stats, s.p2_stats
+        p1_ship_line = ", ".join(p1_stats.ship_counters()) or "-"  # Like "1/1, 0/2, ..." or "-"
+        p2_ship_line = ", ".join(p2_stats.ship_counters()) or "-"
 
         # Update scoreboard text (two lines, one per player)
         self.score_lbl.config(
             text=(
-                f"P1 → Shots: {p1_stats['shots']} | Hits: {p1_stats['hits']} | "
-                f"Misses: {p1_stats['misses']} | Ships: {p1_stats['ships']} | "
+                f"P1 → Shots: {p1_stats.shots} | Hits: {p1_stats.hits} | "
+                f"Misses: {p1_stats.misses} | Ships: {p1_stats.ships_afloat} | "
                 f"Ship hits: {p1_ship_line}\n"
-                f"P2 → Shots: {p2_stats['shots']} | Hits: {p2_stats['hits']} | "
-                f"Misses: {p2_stats['misses']} | Ships: {p2_stats['ships']} | "
+                f"P2 → Shots: {p2_stats.shots} | Hits: {p2_stats.hits} | "
+                f"Misses: {p2_stats.misses} | Ships: {p2_stats.ships_afloat} | "
                 f"Ship hits: {p2_ship_line}"
             )
         )
 
-        # Highlight selected target cell (only if it's still UNKNOWN and input isn't locked)
-        if self.selected is not None:
-            r, c = self.selected
-            if my_shots[r][c] == UNKNOWN and not self.input_locked:
-                self.target_cells[r][c].config(bg=HIGHLIGHT_BG)  # Yellow highlight
-
-        # Disable or restore click bindings on target board depending on lock state
-        if self.input_locked:
-            for r in range(GRID_SIZE):
-                for c in range(GRID_SIZE):
-                    self.target_cells[r][c].unbind("<Button-1>")  # Prevent selecting during delay
-        else:
-            for r in range(GRID_SIZE):
-                for c in range(GRID_SIZE):
-                    self.target_cells[r][c].bind("<Button-1>", self.target_cells[r][c]._click_handler)  # Re-enable selection
-
 
     def _render_own_board(self, cells, ship_board, incoming_board, ship_color: str):
         """
@@ -790,63 +1057,49 @@ class BattleScreen(tk.Frame):
         - incoming MISS -> gray 'O'
         - incoming HIT  -> red  'X'
         """
-        for r in range(GRID_SIZE):
-            for c in range(GRID_SIZE):
-
-                # Base layer: show ships (if a ship exists in ship_board)
-                if ship_board[r][c] == 1:
-                    cells[r][c].config(bg=ship_color, fg="white", text="")  # Ship cell (colored)
-                else:
-                    cells[r][c].config(bg=ACTIVE_BG, fg="black", text="")  # Empty cell (white)
-
-                # Overlay layer: show incoming marks (what opponent did to you)
-                v = incoming_board[r][c]  # Cell value: UNKNOWN / MISS / HIT
-                if v == MISS:
-                    cells[r][c].config(bg=MISS_BG, fg="black", text="O")  # Miss mark
-                elif v == HIT:
-                    cells[r][c].config(bg=HIT_BG, fg="white", text="X")  # Hit mark
+        for r in range(self.board_size):
+            for c in range(self.board_size):
+                self._paint_own_cell(cells, r, c, ship_board, incoming_board, ship_color)
+
+    def _paint_own_cell(self, cells, r: int, c: int, ship_board, incoming_board, ship_color: str):
+        # Overlay layer wins: show incoming marks (what opponent did to you)
+        v = incoming_board.get(r, c)  # Cell value: UNKNOWN / MISS / HIT
+        if v == MISS:
+            cells.paint(r, c, MISS_BG, "black", "O")  # Miss mark
+        elif v == HIT:
+            cells.paint(r, c, HIT_BG, "white", "X")  # Hit mark
+
+        # Base layer: show ships (if a ship exists in ship_board)
+        elif ship_board.get(r, c) == 1:
+            cells.paint(r, c, ship_color, "white", "")  # Ship cell (colored)
+        else:
+            cells.paint(r, c, ACTIVE_BG, "black", "")  # Empty cell (white)
 
 
-    def _render_target_board(self, cells, shots_board):
+    def _render_target_board(self, cells, shots_board, selected=None):
         """
         Target view:
         - opponent ships hidden (white)
+        - selected target (if still unknown) -> yellow highlight
         - your shots show:
           MISS -> gray 'O'
           HIT  -> red  'X'
         """
-        for r in range(GRID_SIZE):
-            for c in range(GRID_SIZE):
-                v = shots_board[r][c]  # Cell value: UNKNOWN / MISS / HIT
-
-                if v == UNKNOWN:
-                    cells[r][c].config(bg=ACTIVE_BG, fg="black", text="")  # Not shot yet
-                elif v == MISS:
-                    cells[r][c].config(bg=MISS_BG, fg="black", text="O")  # Missed shot
-                else:
-                    cells[r][c].config(bg=HIT_BG, fg="white", text="X")  # Hit shot
-
-
-    def _stats(self, shots_board, ships_list, hits_set):
-        hits = sum(  # Count all HIT values inside the shots_board
-            1
-            for r in range(GRID_SIZE)
-            for c in range(GRID_SIZE)
-            if shots_board[r][c] == HIT
-        )
-
-        misses = sum(  # Count all MISS values inside the shots_board
-            1
-            for r in range(GRID_SIZE)
-            for c in range(GRID_SIZE)
-            if shots_board[r][c] == MISS
-        )
-
-        shots = hits + misses  # Total shots fired = hits + misses
-
-        ships_left = ships_remaining(ships_list, hits_set)  # Count ships not fully sunk yet
+        for r in range(self.board_size):
+            for c in range(self.board_size):
+                self._paint_target_cell(cells, r, c, shots_board, selected)
+
+    def _paint_target_cell(self, cells, r: int, c: int, shots_board, selected=None):
+        v = shots_board.get(r, c)  # Cell value: UNKNOWN / MISS / HIT
+
+        if v == UNKNOWN:
+            bg = HIGHLIGHT_BG if (r, c) == selected else ACTIVE_BG  # Yellow highlight on the selection
+            cells.paint(r, c, bg, "black", "")  # Not shot yet
+        elif v == MISS:
+            cells.paint(r, c, MISS_BG, "black", "O")  # Missed shot
+        else:
+            cells.paint(r, c, HIT_BG, "white", "X")  # Hit shot
 
-        return {"shots": shots, "hits": hits, "misses": misses, "ships": ships_left}  # Pack into a dict
 
 
 class WinScreen(tk.Frame):  # Final screen: show winner + stats + play again / exit
@@ -896,36 +1149,18 @@ class WinScreen(tk.Frame):  # Final screen: show winner + stats + play again / e
     def set_stats(self):
         s = self.app.state  # Shortcut to shared GameState
 
-        def counts(shots_board):
-            # Count HIT and MISS values in a shots board, then compute accuracy
-            hits = sum(
-                1 for r in range(GRID_SIZE) for c in range(GRID_SIZE)
-                if shots_board[r][c] == HIT
-            )
-            misses = sum(
-                1 for r in range(GRID_SIZE) for c in range(GRID_SIZE)
-                if shots_board[r][c] == MISS
-            )
-            shots = hits + misses  # Total shots taken
-            acc = (hits / shots * 100) if shots > 0 else 0.0  # Accuracy percent
-            return shots, hits, misses, acc  # Return computed stats
-
-        p1_shots, p1_hits, p1_misses, p1_acc = counts(s.p1_shots)  # Player 1 shot stats
-        p2_shots, p2_hits, p2_misses, p2_acc = counts(s.p2_shots)  # Player 2 shot stats
-
-        p1_ships_left = ships_remaining(s.p1_ships, s.p1_hits)  # Ships still alive for Player 1
-        p2_ships_left = ships_remaining(s.p2_ships, s.p2_hits)  # Ships still alive for Player 2
+        p1, p2 = s.p1_stats, s.p2_stats  # Running scoreboards kept by fire_shot
 
-        p1_ship_line = ", ".join(ship_hit_counters(s.p1_ships, s.p1_hits)) or "-"  # Per-ship hit counts
-        p2_ship_line = ", ".join(ship_hit_counters(s.p2_ships, s.p2_hits)) or "-"
+        p1_ship_line = ", ".join(p1.ship_counters()) or "-"  # Per-ship hit counts
+        p2_ship_line = ", ".join(p2.ship_counters()) or "-"
 
         # Build multi-line stats text block
         text = (
             f"Player 1 Stats\n"
-            f"Shots: {p1_shots} | Hits: {p1_hits} | Misses: {p1_misses} | Accuracy: {p1_acc:.1f}% | Ships left: {p1_ships_left}\n"
+            f"Shots: {p1.shots} | Hits: {p1.hits} | Misses: {p1.misses} | Accuracy: {p1.accuracy:.1f}% | Ships left: {p1.ships_afloat}\n"
             f"Ship hits: {p1_ship_line}\n\n"
             f"Player 2 Stats\n"
-            f"Shots: {p2_shots} | Hits: {p2_hits} | Misses: {p2_misses} | Accuracy: {p2_acc:.1f}% | Ships left: {p2_ships_left}\n"
+            f"Shots: {p2.shots} | Hits: {p2.hits} | Misses: {p2.misses} | Accuracy: {p2.accuracy:.1f}% | Ships left: {p2.ships_afloat}\n"
             f"Ship hits: {p2_ship_line}"
         )
 
@@ -0,0 +1,113 @@
+# wallpaper.py
+# Battleship Project - Background wallpaper decoding
+# Created: 2026-10-17
+
+'''
+This file decodes and scales wallpaper images on a worker thread so the Tk event loop never waits on Pillow.
+App (ui_app.py) posts requests with open() / resize(); the worker thread does the slow work and puts finished
+PIL images on a results queue, which App drains from an `after` poll on the Tk thread (Tk itself is not
+thread-safe, so PhotoImages are only ever created there).
+JPEGs are decoded with Pillow's draft mode straight at roughly screen resolution, and other formats are shrunk
+with Image.reduce() before any resampling, so a huge photo never has to be fully decoded and then scaled down.
+Only the newest request of each kind is worked on: if the user drags the window or picks several images quickly,
+stale requests are dropped instead of queued up.
+'''
+
+import queue
+import threading
+from typing import Optional, Tuple
+
+from PIL import Image
+
+PREVIEW_MAX_SIDE = 480  # Size of the small proxy image that fast resize previews are scaled from
+
+Size = Tuple[int, int]
+
+
+def decode(path, screen: Size) -> Image.Image:
+    """Open an image at roughly screen resolution (draft for JPEG, reduce() for everything else)."""
+    img = Image.open(path)
+    img.draft("RGB", screen)  # JPEG only: the decoder itself scales by 1/2, 1/4 or 1/8 (no-op for others)
+    img = img.convert("RGB")  # Forces the (possibly drafted) decode
+
+    factor = min(img.width // max(1, screen[0]), img.height // max(1, screen[1]))
+    if factor >= 2:  # Still at least twice the screen: cheap integer box reduction first
+        img = img.reduce(factor)
+    return img
+
+
+def scale(img: Image.Image, size: Size) -> Image.Image:
+    """High-quality resize; reducing_gap lets Pillow reduce() before the LANCZOS pass on big downscales."""
+    return img.resize(size, Image.LANCZOS, reducing_gap=3.0)
+
+
+class WallpaperWorker:
+    """
+    One background thread serving wallpaper requests.
+    Results come back from poll() as tuples:
+      ("opened",  token, original, proxy, size, scaled)  - a new image, plus a proxy and a first render
+      ("resized", token, size, scaled)                     - a render of the current image at a new size
+      ("error",   token, report, exception)                - open failed (report = the user asked for it)
+    """
+
+    def __init__(self):
+        self._requests: "queue.Queue" = queue.Queue()
+        self._results: "queue.Queue" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self.pending = 0  # Requests not yet answered or dropped (App keeps polling while > 0)
+
+    def open(self, token: int, path, screen: Size, size: Size, report: bool = False) -> None:
+        self._post(("open", token, path, screen, size, report))
+
+    def resize(self, token: int, original: Image.Image, size: Size) -> None:
+        self._post(("resize", token, original, size))
+
+    def poll(self):
+        """Finished results, without blocking (call from the Tk thread)."""
+        done = []
+        while True:
+            try:
+                item = self._results.get_nowait()
+            except queue.Empty:
+                return done
+            self.pending -= 1
+            if item[0] != "dropped":
+                done.append(item)
+
+    def _post(self, request) -> None:
+        if self._thread is None:  # Started on first use
+            self._thread = threading.Thread(target=self._run, name="wallpaper", daemon=True)
+            self._thread.start()
+        self.pending += 1
+        self._requests.put(request)
+
+    def _run(self) -> None:
+        while True:
+            jobs = [self._requests.get()]
+            while True:  # Take everything queued meanwhile and keep only the newest request
+                try:
+                    jobs.append(self._requests.get_nowait())
+                except queue.Empty:
+                    break
+            opens = [job for job in jobs if job[0] == "open"]
+            job = opens[-1] if opens else jobs[-1]  # A new image makes any queued resize obsolete
+            for _ in range(len(jobs) - 1):
+                self._results.put(("dropped",))
+            self._results.put(self._work(job))
+
+    def _work(self, job):
+        if job[0] == "open":
+            _, token, path, screen, size, report = job
+            try:
+                original = decode(path, screen)
+                proxy = original.copy()
+                proxy.thumbnail((PREVIEW_MAX_SIDE, PREVIEW_MAX_SIDE))
+                return ("opened", token, original, proxy, size, scale(original, size))
+            except Exception as e:  # Bad file, unsupported format, ...
+                return ("error", token, report, e)
+
+        _, token, original, size = job
+        try:
+            return ("resized", token, size, scale(original, size))
+        except Exception as e:
+            return ("error", token, False, e)
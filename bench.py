@@ -0,0 +1,405 @@
+# bench.py
+# Battleship Project - Microbenchmark suite
+# Created: 2026-10-17
+
+'''
+This file times the hot paths of the game and the UI so optimizations can be measured and regressions caught:
+rules.fire_shot, ships_remaining and ship_hit_counters, Board.can_place / Board.place / Board.remove_at,
+placement clicks on the PlacementScreen, fleet generation, and full repaints of the battle boards (Label grid and Canvas).
+Each benchmark runs batches of operations for a fixed time budget and reports operations per second plus
+p50 / p90 / p99 of the per-operation time across batches. Setup (fresh boards, fleets, shot lists) happens
+outside the timed region.
+
+UI benchmarks need a display; on a headless machine run them under a virtual one, and they are skipped
+when Tk cannot open a window. From the project root:
+
+    python3 bench.py
+    xvfb-run -a python3 bench.py --save baseline.json
+    xvfb-run -a python3 bench.py --compare baseline.json      # exit status 1 on a regression
+    python3 bench.py --only rules board --time 0.5
+'''
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+from game.board import GRID_SIZE, Board, new_shot_board
+from game.fleet import Fleet
+from game.fleetgen import random_fleet
+from game.rules import fire_shot, ship_hit_counters, ships_remaining
+from game.ships import build_ship_set
+
+# A benchmark's prepare() returns (run, ops): run() performs `ops` operations and is the only part timed
+Prepared = Tuple[Callable[[], None], int]
+
+DEFAULT_BUDGET = 1.0   # Seconds of timed batches per benchmark
+MIN_BATCHES = 5        # Every benchmark runs at least this many batches
+THRESHOLD = 0.10       # --compare flags a slowdown larger than this fraction
+
+
+@dataclass
+class BenchResult:
+    name: str
+    ops: int = 0
+    seconds: float = 0.0
+    batch_times: List[float] = field(default_factory=list, repr=False)  # seconds per operation, one per batch
+    skipped: Optional[str] = None   # Reason, when the benchmark could not run here
+
+    @property
+    def ops_per_sec(self) -> float:
+        return self.ops / self.seconds if self.seconds > 0 else 0.0
+
+    def percentile(self, p: float) -> float:
+        """Per-operation time in microseconds at percentile p across batches."""
+        if not self.batch_times:
+            return 0.0
+        ordered = sorted(self.batch_times)
+        return ordered[min(len(ordered) - 1, int(p / 100 * len(ordered)))] * 1e6
+
+    def to_dict(self) -> dict:
+        if self.skipped:
+            return {"skipped": self.skipped}
+        return {
+            "ops": self.ops,
+            "seconds": round(self.seconds, 6),
+            "ops_per_sec": round(self.ops_per_sec, 1),
+            "p50_us": round(self.percentile(50), 3),
+            "p90_us": round(self.percentile(90), 3),
+            "p99_us": round(self.percentile(99), 3),
+        }
+
+    def line(self) -> str:
+        if self.skipped:
+            return f"{self.name:<34} skipped: {self.skipped}"
+        return (f"{self.name:<34} {self.ops_per_sec:>14,.0f} ops/s   p50 {self.percentile(50):>10.3f} us   "
+                f"p90 {self.percentile(90):>10.3f} us   p99 {self.percentile(99):>10.3f} us")
+
+
+def measure(name: str, prepare: Callable[[], Prepared], budget: float = DEFAULT_BUDGET) -> BenchResult:
+    """Run prepared batches until `budget` seconds have been timed (and at least MIN_BATCHES batches)."""
+    result = BenchResult(name)
+    run, ops = prepare()
+    run()  # Warm-up batch: caches, lazy imports, first-use allocations
+    while result.seconds < budget or len(result.batch_times) < MIN_BATCHES:
+        run, ops = prepare()
+        start = time.perf_counter()
+        run()
+        elapsed = time.perf_counter() - start
+        result.ops += ops
+        result.seconds += elapsed
+        result.batch_times.append(elapsed / ops)
+    return result
+
+
+# --- game benchmarks ---
+
+def _lengths(num_ships: int) -> List[int]:
+    return [ship.length for ship in build_ship_set(num_ships)]
+
+
+def bench_fire_shot(size: int, rng: random.Random) -> Prepared:
+    """Shoot every cell of a fresh board once, in random order (misses, hits and sinks in game proportions)."""
+    fleet_cells = random_fleet(_lengths(5), size, rng)
+    targets = [divmod(i, size) for i in range(size * size)]
+    rng.shuffle(targets)
+    shots, incoming, fleet, hits = new_shot_board(size), new_shot_board(size), Fleet(fleet_cells), set()
+
+    def run():
+        for row, col in targets:
+            fire_shot(shots, incoming, fleet, hits, row, col)
+    return run, len(targets)
+
+
+def _mid_game(size: int, rng: random.Random):
+    fleet = Fleet(random_fleet(_lengths(5), size, rng))
+    shots, incoming, hits = new_shot_board(size), new_shot_board(size), set()
+    for _ in range(size * size // 2):
+        fire_shot(shots, incoming, fleet, hits, rng.randrange(size), rng.randrange(size))
+    return fleet, hits
+
+
+def bench_ships_remaining(size: int, rng: random.Random) -> Prepared:
+    fleet, hits = _mid_game(size, rng)
+
+    def run():
+        for _ in range(1000):
+            ships_remaining(fleet, hits)
+    return run, 1000
+
+
+def bench_ship_hit_counters(size: int, rng: random.Random) -> Prepared:
+    fleet, hits = _mid_game(size, rng)
+
+    def run():
+        for _ in range(1000):
+            ship_hit_counters(fleet, hits)
+    return run, 1000
+
+
+def _probes(size: int, rng: random.Random, count: int = 1000):
+    lengths = _lengths(5)
+    return [(rng.randrange(size), rng.randrange(size), rng.choice(lengths), rng.choice("HV")) for _ in range(count)]
+
+
+def bench_board_can_place(size: int, rng: random.Random) -> Prepared:
+    """Legality checks at random spots on a board that already holds a fleet (fits, overlaps, off-board)."""
+    board = Board(size)
+    for cells in random_fleet(_lengths(5), size, rng):
+        for r, c in cells:
+            board.grid.put(r, c, 1)
+    probes = _probes(size, rng)
+
+    def run():
+        for row, col, length, orient in probes:
+            board.can_place(row, col, length, orient)
+    return run, len(probes)
+
+
+def bench_board_place(size: int, rng: random.Random) -> Prepared:
+    """Place whole fleets (five ships each) onto fresh boards."""
+    fleets = []
+    for _ in range(200):
+        placed = []
+        for cells in random_fleet(_lengths(5), size, rng):
+            vertical = len(cells) > 1 and cells[0][1] == cells[1][1]
+            placed.append((*cells[0], len(cells), "V" if vertical else "H"))
+        fleets.append((Board(size), placed))
+
+    def run():
+        for board, placed in fleets:
+            for row, col, length, orient in placed:
+                board.place(row, col, length, orient)
+    return run, sum(len(placed) for _, placed in fleets)
+
+
+def bench_board_remove_at(size: int, rng: random.Random) -> Prepared:
+    """Click-to-remove edits: take each ship off by one of its cells, then place it back."""
+    board = Board(size)
+    for cells in random_fleet(_lengths(5), size, rng):
+        board.add_ship(cells)
+    edits = []
+    for ship_id in board.fleet.ids():
+        row, col, length, orient = board.placement(ship_id)
+        edits.append((rng.choice(board.fleet.cells_of(ship_id)), (row, col, length, orient)))
+
+    def run():
+        for (r, c), placed in edits:
+            board.remove_at(r, c)
+            board.place(*placed)
+    return run, 2 * len(edits)
+
+
+def bench_random_fleet(size: int, rng: random.Random) -> Prepared:
+    lengths = _lengths(5)
+
+    def run():
+        for _ in range(200):
+            random_fleet(lengths, size, rng)
+    return run, 200
+
+
+def bench_fleet_pool(size: int, rng: random.Random) -> Prepared:
+    from game.fleetgen import FleetPool  # Needs NumPy
+    pool = FleetPool(seed=rng.randrange(1 << 30))
+    lengths = _lengths(5)
+
+    def run():
+        for _ in range(1000):
+            pool(lengths, size, rng)
+    return run, 1000
+
+
+GAME_BENCHMARKS: Dict[str, Callable[[int, random.Random], Prepared]] = {
+    "rules.fire_shot": bench_fire_shot,
+    "rules.ships_remaining": bench_ships_remaining,
+    "rules.ship_hit_counters": bench_ship_hit_counters,
+    "board.can_place": bench_board_can_place,
+    "board.place": bench_board_place,
+    "board.remove_at": bench_board_remove_at,
+    "fleetgen.random_fleet": bench_random_fleet,
+    "fleetgen.FleetPool": bench_fleet_pool,
+}
+
+
+# --- UI benchmarks (need a display, real or virtual) ---
+
+def _open_app():
+    """The real App with the wallpaper cleared, or (None, reason) when Tk cannot open a window."""
+    try:
+        from app.ui_app import App
+        app = App()
+    except Exception as e:  # ImportError without Tk, TclError without a display
+        return None, f"no display ({type(e).__name__}); run under xvfb-run"
+    app.update()
+    app.clear_wallpaper()  # Measure the boards, not wallpaper scaling
+    app.update()
+    return app, None
+
+
+def _placement(app, size: int, rng: random.Random):
+    """Show the PlacementScreen for Player 1 with every ship but the 1x5 placed; returns the screen."""
+    s = app.state
+    app.canvas_boards = False
+    s.grid_size = size
+    s.reset_for_new_game()
+    s.num_ships = 5
+    s.placing_orientation = "H"
+    app.show_screen("PlacementScreen")
+    placement = app.screen("PlacementScreen")
+    board = placement._engine(1)
+    for cells in random_fleet(_lengths(4), size, rng):
+        board.add_ship(cells)
+    placement.refresh_ui()
+    app.update()
+    return placement
+
+
+def _battle(app, size: int, canvas: bool, rng: random.Random):
+    """Show the BattleScreen mid-game on a size x size grid; returns the screen."""
+    s = app.state
+    app.canvas_boards = canvas
+    s.grid_size = size
+    s.reset_for_new_game()
+    s.num_ships = 5
+    for board, fleet in ((s.p1_board, s.p1_ships), (s.p2_board, s.p2_ships)):
+        for cells in random_fleet(_lengths(5), size, rng):
+            for r, c in cells:
+                board.put(r, c, 1)
+            fleet.append(cells)
+    for _ in range(size * size // 3):  # A third of each board shot
+        fire_shot(s.p1_shots, s.p2_incoming, s.p2_ships, s.p2_hits, rng.randrange(size), rng.randrange(size))
+        fire_shot(s.p2_shots, s.p1_incoming, s.p1_ships, s.p1_hits, rng.randrange(size), rng.randrange(size))
+    app.show_screen("BattleScreen")
+    app.update()
+    return app.screen("BattleScreen")
+
+
+def run_ui_benchmarks(size: int, budget: float, rng: random.Random, wanted: Callable[[str], bool]) -> List[BenchResult]:
+    names = ["ui.PlacementScreen.click", f"ui.render.labels.{size}", "ui.render.canvas.30"]
+    if not any(wanted(n) for n in names):
+        return []
+    app, detail = _open_app()
+    if app is None:
+        return [BenchResult(n, skipped=detail) for n in names if wanted(n)]
+
+    results = []
+    try:
+        if wanted(names[0]):
+            placement = _placement(app, size, rng)
+            board = placement._engine(1)
+            probes = [(r, c) for r, c, _, _ in _probes(size, rng) if board.can_place(r, c, 5, "H")]
+
+            def prepare_click() -> Prepared:
+                def run():
+                    for row, col in probes:
+                        placement.on_cell_click(1, row, col)  # Places the missing 1x5 ship
+                        placement.on_cell_click(1, row, col)  # Clicking it again removes it
+                    app.update_idletasks()
+                return run, 2 * len(probes)
+            results.append(measure(names[0], prepare_click, budget))
+
+        # Full repaint: forget what each cell shows, redraw both boards, and let Tk process the changes
+        for name, grid_size, canvas in ((names[1], size, False), (names[2], 30, True)):
+            if not wanted(name):
+                continue
+            battle = _battle(app, grid_size, canvas, rng)
+
+            def prepare_render(battle=battle) -> Prepared:
+                def run():
+                    battle.own_cells.invalidate()
+                    battle.target_cells.invalidate()
+                    battle.refresh_ui()
+                    app.update_idletasks()
+                return run, 1
+            results.append(measure(name, prepare_render, budget))
+    finally:
+        app.destroy()
+    return results
+
+
+# --- baseline comparison ---
+
+def compare(results: Dict[str, dict], baseline: Dict[str, dict], threshold: float = THRESHOLD) -> Tuple[List[str], int]:
+    """Lines describing the change of each benchmark against a baseline, and how many regressed."""
+    lines, regressions = [], 0
+    for name, now in results.items():
+        before = baseline.get(name)
+        if before is None or "ops_per_sec" not in before or "ops_per_sec" not in now:
+            lines.append(f"{name:<34} (no baseline)")
+            continue
+        change = now["ops_per_sec"] / before["ops_per_sec"] - 1 if before["ops_per_sec"] else 0.0
+        flag = ""
+        if change < -threshold:
+            flag = "  REGRESSION"
+            regressions += 1
+        elif change > threshold:
+            flag = "  faster"
+        lines.append(f"{name:<34} {before['ops_per_sec']:>14,.0f} -> {now['ops_per_sec']:>14,.0f} ops/s "
+                     f"({change * 100:+6.1f}%){flag}")
+    return lines, regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Microbenchmarks for Battleship's hot paths.")
+    parser.add_argument("--size", type=int, default=GRID_SIZE, help="grid size for the benchmarks")
+    parser.add_argument("--time", type=float, default=DEFAULT_BUDGET, help="seconds per benchmark")
+    parser.add_argument("--seed", type=int, default=0, help="RNG seed for boards, fleets and shot orders")
+    parser.add_argument("--only", nargs="+", default=None, metavar="TEXT",
+                        help="run benchmarks whose name contains any of these")
+    parser.add_argument("--no-ui", action="store_true", help="skip the benchmarks that need a display")
+    parser.add_argument("--save", default=None, metavar="PATH", help="write results as JSON")
+    parser.add_argument("--compare", default=None, metavar="PATH", help="compare with a saved JSON baseline")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD * 100, metavar="PCT",
+                        help="slowdown (percent) reported as a regression")
+    args = parser.parse_args(argv)
+
+    def wanted(name: str) -> bool:
+        return args.only is None or any(text in name for text in args.only)
+
+    rng = random.Random(args.seed)
+    results: List[BenchResult] = []
+    for name, factory in GAME_BENCHMARKS.items():
+        if not wanted(name):
+            continue
+        try:
+            result = measure(name, lambda: factory(args.size, rng), args.time)
+        except ImportError as e:  # Optional dependency (NumPy) missing
+            result = BenchResult(name, skipped=str(e))
+        results.append(result)
+        print(result.line(), flush=True)
+    if not args.no_ui:
+        for result in run_ui_benchmarks(args.size, args.time, rng, wanted):
+            results.append(result)
+            print(result.line(), flush=True)
+
+    table = {r.name: r.to_dict() for r in results}
+    if args.save:
+        meta = {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "size": args.size,
+            "time": time.strftime("%Y-%m-%d %H:%M:%S"),
+        }
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump({"meta": meta, "results": table}, f, indent=2)
+        print(f"Saved {len(table)} results to {args.save}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+        lines, regressions = compare(table, baseline, args.threshold / 100)
+        print(f"\nCompared with {args.compare}:")
+        print("\n".join(lines))
+        if regressions:
+            print(f"{regressions} benchmark(s) slower than the baseline by more than {args.threshold:.0f}%")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
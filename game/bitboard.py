@@ -0,0 +1,271 @@
+# game/bitboard.py
+# Battleship Project - Bitmask board storage
+# Created: 2026-10-17
+
+'''
+This file stores boards as integer bitmasks instead of nested Python lists.
+A board of size N uses bit (row * N + col) for each cell, so one Python int holds a whole grid.
+BitBoard tracks ship occupancy (0 = empty, 1 = ship), and ShotBoard tracks shots with two masks (hits and misses).
+Setting, testing and counting cells are single integer operations, which keeps headless simulations fast.
+Both classes also support board[row][col] reads and writes, so existing UI code can treat them like the old 2D lists.
+Very large grids use the set/dict based classes in game/sparse.py instead, which offer the same methods.
+'''
+
+from functools import lru_cache
+from typing import Iterator, List, Tuple
+
+from game.placement import placement_table
+
+# Shot state constants (also exported by game.rules)
+UNKNOWN = 0   # cell has not been shot yet
+MISS = 1      # shot missed
+HIT = 2       # shot hit a ship
+
+# Coordinate type (row, column)
+Coord = Tuple[int, int]
+
+
+class _RowView:
+    """
+    Lightweight view of one board row.
+    Lets callers keep using board[row][col] (read and write) on bitmask boards.
+    """
+
+    __slots__ = ("_board", "_row")
+
+    def __init__(self, board, row: int):
+        self._board = board
+        self._row = row
+
+    def __getitem__(self, col: int) -> int:
+        return self._board.get(self._row, col)
+
+    def __setitem__(self, col: int, value: int) -> None:
+        self._board.put(self._row, col, value)
+
+    def __len__(self) -> int:
+        return self._board.size
+
+    def __iter__(self) -> Iterator[int]:
+        return (self._board.get(self._row, c) for c in range(self._board.size))
+
+
+class _GridView:
+    """
+    Shared list-of-lists compatibility layer.
+    Subclasses provide get(row, col) / put(row, col, value).
+    """
+
+    __slots__ = ()
+
+    def __getitem__(self, row: int) -> _RowView:
+        if not 0 <= row < self.size:  # Match list behaviour for out-of-range rows
+            raise IndexError("board row out of range")
+        return _RowView(self, row)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __iter__(self) -> Iterator[_RowView]:
+        return (_RowView(self, r) for r in range(self.size))
+
+    def to_lists(self) -> List[List[int]]:
+        """Return a plain nested-list copy (useful for debugging and printing)."""
+        return [[self.get(r, c) for c in range(self.size)] for r in range(self.size)]
+
+    def bit(self, row: int, col: int) -> int:
+        """Return the single-bit mask for (row, col)."""
+        return 1 << (row * self.size + col)
+
+    def coord_of(self, index: int) -> Coord:
+        """Convert a bit index back into (row, col)."""
+        return divmod(index, self.size)
+
+    def _coords(self, mask: int) -> Iterator[Coord]:
+        # Walk set bits lowest-first: isolate, convert, clear
+        while mask:
+            low = mask & -mask
+            yield self.coord_of(low.bit_length() - 1)
+            mask ^= low
+
+
+class BitBoard(_GridView):
+    """
+    Ship occupancy board.
+    bits has a 1 for every cell covered by a ship.
+    """
+
+    __slots__ = ("size", "bits")
+
+    def __init__(self, size: int, bits: int = 0):
+        self.size = size  # Board is size x size
+        self.bits = bits  # Occupancy bitmask
+
+    def get(self, row: int, col: int) -> int:
+        return (self.bits >> (row * self.size + col)) & 1  # 1 = ship, 0 = empty
+
+    def put(self, row: int, col: int, value: int) -> None:
+        if value:
+            self.bits |= 1 << (row * self.size + col)
+        else:
+            self.bits &= ~(1 << (row * self.size + col))
+
+    def test(self, row: int, col: int) -> bool:
+        return bool(self.get(row, col))
+
+    def test_mask(self, mask: int) -> bool:
+        """True if any cell in mask is occupied."""
+        return bool(self.bits & mask)
+
+    def set_mask(self, mask: int) -> None:
+        self.bits |= mask
+
+    def clear_mask(self, mask: int) -> None:
+        self.bits &= ~mask
+
+    def count(self) -> int:
+        """Number of occupied cells."""
+        return self.bits.bit_count()
+
+    def cells(self) -> Iterator[Coord]:
+        """Yield every occupied (row, col)."""
+        return self._coords(self.bits)
+
+    def is_free(self, row: int, col: int, length: int, orientation: str) -> bool:
+        """True if the ship fits on the board there without overlapping another ship."""
+        mask = placement_table(self.size).mask(row, col, length, orientation)  # 0 = off the board
+        return bool(mask) and not self.bits & mask
+
+    def occupy(self, row: int, col: int, length: int, orientation: str) -> List[Coord]:
+        """Mark a ship's cells (one mask OR) and return its coordinates; [] if it is off the board."""
+        mask = placement_table(self.size).mask(row, col, length, orientation)
+        self.bits |= mask
+        return list(self._coords(mask))
+
+    def clear(self) -> None:
+        self.bits = 0
+
+    def copy(self) -> "BitBoard":
+        return BitBoard(self.size, self.bits)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, BitBoard):
+            return self.size == other.size and self.bits == other.bits
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"BitBoard(size={self.size}, cells={self.count()})"
+
+
+class ShotBoard(_GridView):
+    """
+    Shot tracking board.
+    hits and misses are separate bitmasks; a cell in neither is UNKNOWN.
+    """
+
+    __slots__ = ("size", "hits", "misses")
+
+    def __init__(self, size: int, hits: int = 0, misses: int = 0):
+        self.size = size      # Board is size x size
+        self.hits = hits      # Cells shot that hit a ship
+        self.misses = misses  # Cells shot that missed
+
+    def get(self, row: int, col: int) -> int:
+        i = row * self.size + col
+        if (self.hits >> i) & 1:
+            return HIT
+        if (self.misses >> i) & 1:
+            return MISS
+        return UNKNOWN
+
+    def put(self, row: int, col: int, value: int) -> None:
+        b = 1 << (row * self.size + col)
+        # A cell holds exactly one state: set it in one mask and clear it from the other.
+        # The other mask is only rewritten when the bit is actually there (a fresh shot never needs it),
+        # which saves a big-int allocation per shot on the hot fire_shot path.
+        if value == HIT:
+            self.hits |= b
+            if self.misses & b:
+                self.misses ^= b
+        elif value == MISS:
+            self.misses |= b
+            if self.hits & b:
+                self.hits ^= b
+        else:
+            if self.hits & b:
+                self.hits ^= b
+            if self.misses & b:
+                self.misses ^= b
+
+    @property
+    def shots(self) -> int:
+        """Mask of every cell that has been shot."""
+        return self.hits | self.misses
+
+    def is_shot(self, row: int, col: int) -> bool:
+        return bool(((self.hits | self.misses) >> (row * self.size + col)) & 1)
+
+    def hit_count(self) -> int:
+        return self.hits.bit_count()
+
+    def miss_count(self) -> int:
+        return self.misses.bit_count()
+
+    def shot_count(self) -> int:
+        return (self.hits | self.misses).bit_count()
+
+    def hit_cells(self) -> Iterator[Coord]:
+        return self._coords(self.hits)
+
+    def miss_cells(self) -> Iterator[Coord]:
+        return self._coords(self.misses)
+
+    def open_neighbours(self) -> Iterator[Coord]:
+        """Unshot cells orthogonally next to a hit (the hunt/target "target" set)."""
+        return self._coords(neighbour_mask(self.size, self.hits) & ~(self.hits | self.misses))
+
+    def clear(self) -> None:
+        self.hits = 0
+        self.misses = 0
+
+    def copy(self) -> "ShotBoard":
+        return ShotBoard(self.size, self.hits, self.misses)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, ShotBoard):
+            return (self.size, self.hits, self.misses) == (other.size, other.hits, other.misses)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"ShotBoard(size={self.size}, hits={self.hit_count()}, misses={self.miss_count()})"
+
+
+def cells_mask(size: int, cells) -> int:
+    """Build a bitmask from an iterable of (row, col) coordinates."""
+    mask = 0
+    for r, c in cells:
+        mask |= 1 << (r * size + c)
+    return mask
+
+
+@lru_cache(maxsize=None)
+def edge_masks(size: int) -> Tuple[int, int, int]:
+    """
+    (full board, every cell except the first column, every cell except the last column).
+    Used to stop horizontal shifts from wrapping onto the next row.
+    """
+    full = (1 << (size * size)) - 1
+    first_col = cells_mask(size, ((r, 0) for r in range(size)))
+    last_col = cells_mask(size, ((r, size - 1) for r in range(size)))
+    return full, full & ~first_col, full & ~last_col
+
+
+def neighbour_mask(size: int, mask: int) -> int:
+    """Mask of every cell orthogonally adjacent to a cell in mask."""
+    full, not_first, not_last = edge_masks(size)
+    return (
+        (mask << size)                 # down
+        | (mask >> size)               # up
+        | ((mask & not_last) << 1)     # right (never wraps off the last column)
+        | ((mask & not_first) >> 1)    # left  (never wraps off the first column)
+    ) & full
@@ -3,82 +3,152 @@
 # Created: 2026-02-06
 
 '''
-This file defines a lightweight Board class that represents a 10×10 grid and provides helper methods for ship placement. 
-It knows how to check whether a ship can be placed (can_place), how to place it (place), 
-and how to compute which cells a ship would occupy based on position, length, and orientation. 
-The board itself does not know about players, turns, or hits — it strictly manages grid validity. 
+This file defines a lightweight Board class that represents a square grid (10×10 by default) and provides helper methods for ship placement.
+Small grids are stored as a BitBoard (see game/bitboard.py) whose ship masks come from a precomputed table (game/placement.py),
+so placement checks are a single mask AND instead of per-cell list lookups.
+Large grids switch to the sparse set/dict boards in game/sparse.py so memory tracks what was touched, not the board area;
+new_ship_board() and new_shot_board() choose the right storage for a grid size.
+It knows how to check whether a ship can be placed (can_place) and how to place it (place);
+the grid storage works out which cells a ship covers from its position, length, and orientation.
+Next to the grid it keeps a Fleet (game/fleet.py), whose cell -> ship-id map lets it remove the ship under a clicked cell,
+move a ship or rotate it in time proportional to the ship's length, without scanning the other ships.
+Both the placement screen and headless code (engine, tools) edit layouts through this class.
+The board itself does not know about players, turns, or hits — it strictly manages grid validity.
 This separation keeps placement logic clean and reusable.
 '''
 
-from dataclasses import dataclass, field  # dataclass auto-generates init and useful methods
-from typing import List, Tuple  # Used for type hints (2D grid and coordinate pairs)
+from dataclasses import dataclass  # dataclass auto-generates init and useful methods
+from typing import List, Optional, Tuple, Union  # Used for type hints (coordinate pairs)
 
-GRID_SIZE = 10  # Board is 10x10
+from game.bitboard import BitBoard, Coord, ShotBoard  # Bitmask grid storage
+from game.fleet import Fleet  # cell -> ship id index
+from game.sparse import SparseBoard, SparseShotBoard  # Set/dict storage for big grids
+
+GRID_SIZE = 10        # Default board is 10x10
+MIN_GRID_SIZE = 5     # Smallest board that still fits the 1x5 ship
+MAX_GRID_SIZE = 1000  # Largest supported board
+DENSE_MAX_SIZE = 32   # Grids up to this size use bitmasks; larger ones use sparse storage
+
+
+def new_ship_board(size: int = GRID_SIZE):
+    """Empty ship board for a grid size (bitmask when small, sparse set when large)."""
+    if not MIN_GRID_SIZE <= size <= MAX_GRID_SIZE:
+        raise ValueError(f"grid size must be between {MIN_GRID_SIZE} and {MAX_GRID_SIZE}, got {size}")
+    return BitBoard(size) if size <= DENSE_MAX_SIZE else SparseBoard(size)
+
+
+def new_shot_board(size: int = GRID_SIZE):
+    """Empty shot board for a grid size (bitmasks when small, sparse dict when large)."""
+    if not MIN_GRID_SIZE <= size <= MAX_GRID_SIZE:
+        raise ValueError(f"grid size must be between {MIN_GRID_SIZE} and {MAX_GRID_SIZE}, got {size}")
+    return ShotBoard(size) if size <= DENSE_MAX_SIZE else SparseShotBoard(size)
 
 
 @dataclass
 class Board:
-    # 2D grid representing the board
-    # 0 = empty cell
-    # 1 = ship occupies cell
-    grid: List[List[int]] = field(
-        default_factory=lambda: [[0] * GRID_SIZE for _ in range(GRID_SIZE)]
-    )  # Creates a fresh 10x10 grid filled with 0s
+    # Board width/height in cells
+    size: int = GRID_SIZE
+
+    # Grid storage (BitBoard or SparseBoard, both indexable as grid[r][c])
+    # grid[r][c] == 0 -> empty cell
+    # grid[r][c] == 1 -> ship occupies cell
+    grid: Optional[Union[BitBoard, SparseBoard]] = None  # Filled in by __post_init__ when not given
+
+    # Ships on the grid, in placement order (cell -> ship id, used for remove/move/rotate)
+    # Pass an existing Fleet (e.g. GameState.p1_ships) to edit it together with its grid
+    fleet: Optional[Fleet] = None
+
+    def __post_init__(self):
+        if self.grid is None:
+            self.grid = new_ship_board(self.size)  # Creates a fresh, empty grid of the right kind
+        if self.fleet is None:
+            self.fleet = Fleet()
 
     def clear(self) -> None:
         """
         Reset the board to an empty state.
         Used when starting a new game.
         """
-        self.grid = [[0] * GRID_SIZE for _ in range(GRID_SIZE)]  # Rebuild empty 10x10 grid
+        self.grid.clear()  # Drop every occupied cell
+        self.fleet.clear()
 
     def can_place(self, row: int, col: int, length: int, orientation: str) -> bool:
         """
         Check whether a ship can be placed at the given position.
         Returns True if the ship fits on the board and does not overlap.
         """
-        cells = self._cells_for_ship(row, col, length, orientation)  # Get all cells ship would occupy
-
-        if not cells:  # If helper returned empty list, placement is invalid
-            return False
-
-        return all(self.grid[r][c] == 0 for r, c in cells)  # Ensure all target cells are empty
+        return self.grid.is_free(row, col, length, orientation)  # One mask AND on bitboards
 
     def place(self, row: int, col: int, length: int, orientation: str) -> List[Tuple[int, int]]:
         """
         Place a ship on the board.
-        Marks the grid cells and returns the ship's coordinates.
+        Marks the grid cells, adds the ship to the fleet and returns the ship's coordinates.
+        Returns [] and changes nothing if the ship is off the board or overlaps another ship.
         """
-        cells = self._cells_for_ship(row, col, length, orientation)  # Calculate ship cell positions
-
-        for r, c in cells:  # Loop through each ship cell
-            self.grid[r][c] = 1  # Mark grid cell as occupied by a ship
-
-        return cells  # Return list of coordinates for that ship
+        if not self.grid.is_free(row, col, length, orientation):
+            return []
+        cells = self.grid.occupy(row, col, length, orientation)  # One mask OR on bitboards
+        self.fleet.add(cells)
+        return cells
 
-    def _cells_for_ship(self, row: int, col: int, length: int, orientation: str):
+    def add_ship(self, cells) -> int:
         """
-        Internal helper:
-        Calculates the list of board cells a ship would occupy.
-        Returns an empty list if placement is invalid.
+        Add a ship given as a coordinate list (e.g. from game.fleetgen) and return its id.
+        The caller guarantees the cells are on the board and free.
         """
+        cells = list(cells)
+        for r, c in cells:
+            self.grid.put(r, c, 1)
+        return self.fleet.add(cells)
+
+    # --- editing placed ships (all O(ship length)) ---
+
+    def ship_at(self, row: int, col: int) -> Optional[int]:
+        """Id of the ship covering (row, col), or None for open water."""
+        return self.fleet.ship_at((row, col))
+
+    def remove(self, ship_id: int) -> List[Coord]:
+        """Take a ship off the board and return its coordinates."""
+        cells = self.fleet.remove(ship_id)
+        for r, c in cells:
+            self.grid.put(r, c, 0)
+        return cells
+
+    def remove_at(self, row: int, col: int) -> Optional[List[Coord]]:
+        """Remove the ship covering (row, col); returns its coordinates, or None if the cell is empty."""
+        ship_id = self.fleet.ship_at((row, col))
+        if ship_id is None:
+            return None
+        return self.remove(ship_id)
+
+    def placement(self, ship_id: int) -> Tuple[int, int, int, str]:
+        """(row, col, length, orientation) of a placed ship; single-cell ships count as horizontal."""
+        cells = self.fleet.cells_of(ship_id)
+        row, col = cells[0]
+        orientation = "V" if len(cells) > 1 and cells[1][1] == col else "H"
+        return row, col, len(cells), orientation
+
+    def move(self, ship_id: int, row: int, col: int, orientation: Optional[str] = None) -> bool:
+        """
+        Move a ship so it starts at (row, col), optionally with a new orientation.
+        Returns False (and leaves the ship where it was) if it would go off the board or overlap another ship.
+        """
+        _, _, length, current = self.placement(ship_id)
+        orientation = orientation or current
 
-        if orientation not in ("H", "V"):  # Must be Horizontal or Vertical
-            return []
-
-        if not (0 <= row < GRID_SIZE and 0 <= col < GRID_SIZE):  # Start position must be inside board
-            return []
-
-        if length <= 0:  # Ship length must be positive
-            return []
+        old = self.fleet.cells_of(ship_id)
+        for r, c in old:  # Lift the ship so it does not block its own new position
+            self.grid.put(r, c, 0)
 
-        if orientation == "H":  # Horizontal placement
-            if col + length - 1 >= GRID_SIZE:  # Check right boundary
-                return []
-            return [(row, col + i) for i in range(length)]  # Build horizontal coordinates
+        if not self.grid.is_free(row, col, length, orientation):
+            for r, c in old:  # Put it back untouched
+                self.grid.put(r, c, 1)
+            return False
 
-        # Vertical placement
-        if row + length - 1 >= GRID_SIZE:  # Check bottom boundary
-            return []
+        self.fleet.replace(ship_id, self.grid.occupy(row, col, length, orientation))
+        return True
 
-        return [(row + i, col) for i in range(length)]  # Build vertical coordinates
+    def rotate(self, ship_id: int) -> bool:
+        """Turn a ship between H and V about its first cell; False if the turned ship does not fit."""
+        row, col, _, orientation = self.placement(ship_id)
+        return self.move(ship_id, row, col, "V" if orientation == "H" else "H")
@@ -1,16 +1,24 @@
 # utils/coords.py
 # Coordinate helpers for Battleship
 
-LETTERS = "ABCDEFGHIJ"  # String used to convert column index (0–9) into board letters A–J
+LETTERS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"  # Column letters; past Z labels continue AA, AB, ... like a spreadsheet
 
 
 def col_to_letter(col: int) -> str:
-    return LETTERS[col]  # Convert numeric column (0–9) into corresponding letter
+    if col < len(LETTERS):
+        return LETTERS[col]  # Fast path: single letter A–Z
+
+    label = ""
+    col += 1  # Bijective base-26: 1 -> A, 26 -> Z, 27 -> AA
+    while col:
+        col, rem = divmod(col - 1, 26)
+        label = LETTERS[rem] + label
+    return label
 
 
 def row_to_number(row: int) -> str:
-    return str(row + 1)  # Convert 0-based row index into human-readable 1–10 string
+    return str(row + 1)  # Convert 0-based row index into human-readable 1-based string
 
 
 def to_label(row: int, col: int) -> str:
-    return f"{LETTERS[col]}{row + 1}"  # Combine column letter and row number (ex: 0,0 → "A1")
+    return f"{col_to_letter(col)}{row + 1}"  # Combine column letter and row number (ex: 0,0 → "A1")
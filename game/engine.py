@@ -0,0 +1,206 @@
+# game/engine.py
+# Battleship Project - Headless game engine
+# Created: 2026-10-17
+
+'''
+This file runs complete Battleship games without any Tkinter code.
+Each side is driven by two pluggable callables: a placement strategy that lays out the fleet,
+and a shot strategy that picks the next target from what that player can legitimately see
+(their own shot board plus the lengths of enemy ships still afloat, which the scoreboard already shows).
+play_game() handles placement, alternating shots through game.rules.fire_shot, and win detection,
+so strategies can be evaluated at machine speed instead of waiting on the UI's turn delays.
+'''
+
+import importlib
+import random
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+from game.bitboard import ShotBoard, Coord
+from game.board import GRID_SIZE, Board, new_shot_board
+from game.fleetgen import random_fleet
+from game.record import GameRecord, ship_spec
+from game.rules import fire_shot
+from game.ships import build_ship_set
+
+# Strategy signatures
+# placement: (ship lengths, grid size, rng) -> list of ships (each a list of coordinates)
+PlacementStrategy = Callable[[List[int], int, random.Random], List[List[Coord]]]
+# shooting: (my shot board, lengths of enemy ships afloat, rng) -> (row, col) to fire at
+ShotStrategy = Callable[[ShotBoard, Sequence[int], random.Random], Coord]
+
+
+class _Side:
+    """Everything the engine tracks for one player during a headless game."""
+
+    __slots__ = ("layout", "board", "fleet", "shots", "incoming", "hits")
+
+    def __init__(self, size: int):
+        self.layout = Board(size)              # own ships: grid + fleet, edited together
+        self.board = self.layout.grid          # own ships
+        self.fleet = self.layout.fleet         # own ships, indexed by cell
+        self.shots = new_shot_board(size)      # what this player fired at the opponent
+        self.incoming = new_shot_board(size)   # what the opponent fired at this player
+        self.hits: Set[Coord] = set()    # hit coords on this player's ships
+
+
+@dataclass
+class GameResult:
+    winner: int      # 1 or 2
+    turns: int       # total shots fired by both players
+    p1_shots: int    # shots fired by Player 1
+    p2_shots: int    # shots fired by Player 2
+    record: Optional[GameRecord] = None  # full move history, when play_game(record=True)
+
+
+def random_placement(lengths: List[int], size: int, rng: random.Random) -> List[List[Coord]]:
+    """
+    Place ships at random legal positions.
+    Delegates to game.fleetgen.random_fleet, which draws from the still-free placements instead of retrying blindly.
+    """
+    return random_fleet(lengths, size, rng)
+
+
+def random_shooter(shots: ShotBoard, afloat: Sequence[int], rng: random.Random) -> Coord:
+    """Fire at a uniformly random cell that has not been shot yet."""
+    size = shots.size
+
+    # Cheap path: a few random probes almost always land on an open cell
+    for _ in range(32):
+        row, col = divmod(rng.randrange(size * size), size)
+        if not shots.is_shot(row, col):
+            return row, col
+
+    # Board is nearly full: pick from the explicit list of open cells
+    open_cells = [(r, c) for r in range(size) for c in range(size) if not shots.is_shot(r, c)]
+    return rng.choice(open_cells)
+
+
+def hunt_target_shooter(shots: ShotBoard, afloat: Sequence[int], rng: random.Random) -> Coord:
+    """
+    Classic hunt/target:
+    - target: fire next to an existing hit if any neighbour is still open
+    - hunt:   otherwise fire at a random open cell
+    """
+    target = next(shots.open_neighbours(), None)  # Open cell next to a hit (mask ops on bitboards)
+    if target is not None:
+        return target
+    return random_shooter(shots, afloat, rng)
+
+
+def parity_shooter(shots: ShotBoard, afloat: Sequence[int], rng: random.Random) -> Coord:
+    """
+    Hunt/target with a parity hunt:
+    - target: like hunt_target_shooter
+    - hunt:   fire only at open cells with (row + col) divisible by the shortest ship still afloat;
+              every ship of that length or longer covers at least one such cell, so nothing is missed
+    """
+    target = next(shots.open_neighbours(), None)
+    if target is not None:
+        return target
+
+    size = shots.size
+    step = min(afloat) if afloat else 1
+    for _ in range(32):
+        row, col = divmod(rng.randrange(size * size), size)
+        if (row + col) % step == 0 and not shots.is_shot(row, col):
+            return row, col
+
+    open_cells = [
+        (r, c) for r in range(size) for c in range(size)
+        if (r + c) % step == 0 and not shots.is_shot(r, c)
+    ]
+    if not open_cells:  # Every parity cell is shot but a damaged ship hides elsewhere
+        return random_shooter(shots, afloat, rng)
+    return rng.choice(open_cells)
+
+
+# Name -> strategy, so batch runs and CLIs can pick strategies by string
+SHOOTERS: Dict[str, ShotStrategy] = {
+    "random": random_shooter,
+    "hunt": hunt_target_shooter,
+    "parity": parity_shooter,
+}
+
+# Strategies imported only when asked for by name: name -> (module, class).
+# They stay out of SHOOTERS, so default rosters (e.g. a tournament's) do not pay for them or enter them.
+LAZY_SHOOTERS: Dict[str, Tuple[str, str]] = {}
+_lazy_loaded: Dict[str, ShotStrategy] = {}
+
+
+def shooter_names() -> List[str]:
+    """Every strategy name get_shooter() accepts: SHOOTERS first, then the lazily imported ones."""
+    return list(SHOOTERS) + [name for name in LAZY_SHOOTERS if name not in SHOOTERS]
+
+
+def get_shooter(name: str) -> ShotStrategy:
+    """The strategy registered under `name`, importing a lazy one on first use. KeyError for unknown names."""
+    if name in SHOOTERS:
+        return SHOOTERS[name]
+    if name not in _lazy_loaded:
+        module, attribute = LAZY_SHOOTERS[name]
+        _lazy_loaded[name] = getattr(importlib.import_module(module), attribute)()
+    return _lazy_loaded[name]
+
+
+def play_game(
+    shooter1: ShotStrategy,
+    shooter2: ShotStrategy,
+    num_ships: int = 5,
+    rng: Optional[random.Random] = None,
+    placer1: PlacementStrategy = random_placement,
+    placer2: PlacementStrategy = random_placement,
+    size: int = GRID_SIZE,
+    record: bool = False,
+) -> GameResult:
+    """
+    Play one full game on a size x size grid and return who won and how many shots it took.
+    Player 1 fires first, exactly like the Tk BattleScreen.
+    record=True also returns the placements and every shot as a GameRecord (game/record.py).
+    """
+    rng = rng or random.Random()
+    lengths = [ship.length for ship in build_ship_set(num_ships)]
+    log = GameRecord(size, ([], [])) if record else None
+
+    # Placement phase
+    sides = (_Side(size), _Side(size))
+    for player, (side, placer) in enumerate(zip(sides, (placer1, placer2))):
+        for cells in placer(lengths, size, rng):
+            side.layout.add_ship(cells)
+            if log is not None:
+                log.fleets[player].append(ship_spec(cells))
+
+    # Battle phase: alternate shots until one fleet is gone
+    shooters = (shooter1, shooter2)
+    fired = [0, 0]
+    turn = 0  # 0 = Player 1, 1 = Player 2
+    while True:
+        attacker = sides[turn]
+        defender = sides[1 - turn]
+
+        row, col = shooters[turn](attacker.shots, defender.fleet.afloat_lengths(), rng)
+        result = fire_shot(attacker.shots, defender.incoming, defender.fleet, defender.hits, row, col)
+        if result == "already":
+            raise ValueError(f"Player {turn + 1} strategy fired at an already-shot cell {(row, col)}")
+        fired[turn] += 1
+        if log is not None:
+            log.add_shot(row, col, result != "miss")
+
+        if defender.fleet.afloat == 0:  # Same win check as ships_remaining() == 0
+            if log is not None:
+                log.winner = turn + 1
+            return GameResult(winner=turn + 1, turns=fired[0] + fired[1],
+                              p1_shots=fired[0], p2_shots=fired[1], record=log)
+
+        turn = 1 - turn
+
+
+# The density AI needs NumPy; register it only when NumPy is installed
+try:
+    from game.ai import DensityAI
+except ImportError:  # pragma: no cover - depends on the environment
+    pass
+else:
+    SHOOTERS["density"] = DensityAI()
+    # Plays solved policies, which only exist for tiny boards (density AI everywhere else): load on request
+    LAZY_SHOOTERS["perfect"] = ("game.solver", "PerfectAI")
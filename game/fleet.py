@@ -0,0 +1,150 @@
+# game/fleet.py
+# Battleship Project - Fleet index for constant-time shot resolution
+# Created: 2026-10-17
+
+'''
+This file defines the Fleet class, an indexed collection of one player's ships.
+Each ship gets a stable integer id. The fleet keeps a coordinate -> ship-id map, a remaining-hits counter per ship,
+and a live count of ships still afloat, all updated incrementally as shots land.
+That lets game.rules answer "which ship did this shot hit?", "did it sink?" and "is the game over?" in constant time
+instead of scanning every ship's coordinate list.
+Fleet still behaves like the old list of coordinate lists (iterate, len, append, pop), so UI code keeps working.
+'''
+
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from game.bitboard import Coord
+
+
+class Fleet:
+    """
+    One player's ships, indexed by cell.
+    Ships are kept in placement order; ids never change once assigned.
+    """
+
+    __slots__ = ("_ships", "_owner", "_remaining", "afloat", "_next_id", "_afloat_lengths")
+
+    def __init__(self, ships=()):
+        self._ships: Dict[int, List[Coord]] = {}  # ship id -> coordinate list (insertion ordered)
+        self._owner: Dict[Coord, int] = {}        # cell -> ship id
+        self._remaining: Dict[int, int] = {}      # ship id -> hits still needed to sink
+        self.afloat = 0                           # number of ships with remaining > 0
+        self._next_id = 0
+        self._afloat_lengths: Optional[Tuple[int, ...]] = None  # cached, rebuilt after add/remove/sink
+
+        for cells in ships:
+            self.add(cells)
+
+    # --- building the fleet ---
+
+    def add(self, cells) -> int:
+        """Register a ship (list of coordinates) and return its id."""
+        cells = list(cells)
+        ship_id = self._next_id
+        self._next_id += 1
+
+        self._ships[ship_id] = cells
+        for cell in cells:
+            self._owner[cell] = ship_id
+        self._remaining[ship_id] = len(cells)
+        if cells:
+            self.afloat += 1
+        self._afloat_lengths = None
+        return ship_id
+
+    def remove(self, ship_id: int) -> List[Coord]:
+        """Remove a ship by id and return its coordinates."""
+        cells = self._ships.pop(ship_id)
+        for cell in cells:
+            del self._owner[cell]
+        if self._remaining.pop(ship_id) > 0:
+            self.afloat -= 1
+        self._afloat_lengths = None
+        return cells
+
+    def replace(self, ship_id: int, cells) -> None:
+        """Give a ship new coordinates (placement edits: move/rotate); keeps its id and place in the order."""
+        cells = list(cells)
+        for cell in self._ships[ship_id]:
+            del self._owner[cell]
+        for cell in cells:
+            self._owner[cell] = ship_id
+        self._ships[ship_id] = cells
+        if self._remaining[ship_id] == 0 and cells:
+            self.afloat += 1
+        self._remaining[ship_id] = len(cells)
+        self._afloat_lengths = None
+
+    def clear(self) -> None:
+        self._ships.clear()
+        self._owner.clear()
+        self._remaining.clear()
+        self.afloat = 0
+        self._afloat_lengths = None
+
+    # --- shot resolution ---
+
+    def ship_at(self, cell: Coord) -> Optional[int]:
+        """Return the id of the ship covering cell, or None for open water."""
+        return self._owner.get(cell)
+
+    def register_hit(self, ship_id: int) -> bool:
+        """
+        Record one hit on a ship.
+        Returns True if that hit sank it.
+        """
+        left = self._remaining[ship_id] - 1
+        self._remaining[ship_id] = left
+        if left == 0:
+            self.afloat -= 1
+            self._afloat_lengths = None
+            return True
+        return False
+
+    def is_sunk(self, ship_id: int) -> bool:
+        return self._remaining[ship_id] == 0
+
+    def cells_of(self, ship_id: int) -> List[Coord]:
+        return self._ships[ship_id]
+
+    def ids(self) -> List[int]:
+        """Ship ids in placement order."""
+        return list(self._ships)
+
+    def afloat_lengths(self) -> Tuple[int, ...]:
+        """Lengths of ships not yet sunk (public info: the scoreboard shows per-ship counters)."""
+        if self._afloat_lengths is None:  # Only rebuilt when a ship is added, removed or sunk
+            self._afloat_lengths = tuple(
+                len(cells)
+                for ship_id, cells in self._ships.items()
+                if self._remaining[ship_id] > 0
+            )
+        return self._afloat_lengths
+
+    def hit_counts(self) -> List[Tuple[int, int]]:
+        """(hits, length) for each ship, in placement order."""
+        return [
+            (len(cells) - self._remaining[ship_id], len(cells))
+            for ship_id, cells in self._ships.items()
+        ]
+
+    # --- list-of-ships compatibility (old GameState.pX_ships was a list) ---
+
+    def append(self, cells) -> None:
+        self.add(cells)
+
+    def pop(self, index: int = -1) -> List[Coord]:
+        ship_ids = list(self._ships)
+        return self.remove(ship_ids[index])
+
+    def __getitem__(self, index: int) -> List[Coord]:
+        return list(self._ships.values())[index]
+
+    def __iter__(self) -> Iterator[List[Coord]]:
+        return iter(list(self._ships.values()))  # Snapshot so callers may pop while iterating
+
+    def __len__(self) -> int:
+        return len(self._ships)
+
+    def __repr__(self) -> str:
+        return f"Fleet(ships={len(self._ships)}, afloat={self.afloat})"
@@ -0,0 +1,228 @@
+# game/fleetgen.py
+# Battleship Project - Random fleet generation
+# Created: 2026-10-17
+
+'''
+This file builds random, legal, non-overlapping fleets for auto-placement and headless games.
+Ships are placed longest first, and each ship is drawn uniformly from the placements that are still legal.
+A few random probes are tried first (almost always enough on a sparse ocean); if they all collide,
+the legal placements for that length are filtered against the current occupancy and one is picked from
+what is left, so no ship ever loops on blind rejection sampling.
+On bitmask-sized grids the legal placements come from the shared placement table (game/placement.py),
+so each probe is a single mask AND.
+
+random_fleets() is the batch version: it draws N fleets at once with NumPy and returns them as one compact
+int16 array of (row, col, vertical) per ship. FleetPool wraps it as an engine placement strategy so batch
+simulations set up fleets in bulk instead of one at a time.
+'''
+
+import random
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+from game.bitboard import Coord, cells_mask
+from game.board import DENSE_MAX_SIZE, GRID_SIZE
+from game.placement import placement_table
+
+PROBES = 8  # Random probes per ship before switching to an exact draw
+
+# One placement: (row, col, vertical)
+Placement = Tuple[int, int, int]
+
+
+def ship_cells(row: int, col: int, length: int, vertical: int) -> List[Coord]:
+    """Cells covered by a ship placed at (row, col)."""
+    if vertical:
+        return [(row + i, col) for i in range(length)]
+    return [(row, col + i) for i in range(length)]
+
+
+def random_fleet(
+    lengths: Sequence[int],
+    size: int = GRID_SIZE,
+    rng: Optional[random.Random] = None,
+    taken: Iterable[Coord] = (),
+) -> List[List[Coord]]:
+    """
+    Place one ship per entry of `lengths` at random and return their cells (in the order of `lengths`).
+    `taken` lists cells already covered by other ships (e.g. ships the player placed by hand).
+    Raises ValueError if the ships cannot all fit.
+    """
+    rng = rng or random.Random()
+    placements = random_placements(lengths, size, rng, taken)
+    return [ship_cells(r, c, length, v) for (r, c, v), length in zip(placements, lengths)]
+
+
+def random_placements(
+    lengths: Sequence[int],
+    size: int = GRID_SIZE,
+    rng: Optional[random.Random] = None,
+    taken: Iterable[Coord] = (),
+) -> List[Placement]:
+    """Same as random_fleet(), but returns (row, col, vertical) per ship instead of cell lists."""
+    rng = rng or random.Random()
+    for length in lengths:
+        if not 0 < length <= size:
+            raise ValueError(f"ship length {length} does not fit a {size}x{size} grid")
+
+    order = sorted(range(len(lengths)), key=lambda i: -lengths[i])  # Long ships first: hardest to fit
+    taken = list(taken)
+    place = _place_dense if size <= DENSE_MAX_SIZE else _place_sparse
+
+    # Each ship is an exact draw, so only a dead end (earlier ships boxed a later one out) can fail;
+    # that needs a nearly full board, so a handful of fresh attempts is plenty before giving up.
+    for _ in range(32):
+        placements = place(lengths, order, size, rng, taken)
+        if placements is not None:
+            return placements
+    raise ValueError(f"could not fit ships {list(lengths)} on a {size}x{size} grid")
+
+
+def _place_dense(lengths, order, size, rng, taken) -> Optional[List[Placement]]:
+    table = placement_table(size)
+    occupied = cells_mask(size, taken)
+    placements: List[Optional[Placement]] = [None] * len(lengths)
+
+    for i in order:
+        legal = table.legal(lengths[i])
+        for _ in range(PROBES):
+            mask, row, col, orient = legal[rng.randrange(len(legal))]
+            if not mask & occupied:
+                break
+        else:
+            # Probes kept colliding: draw from the placements that are actually free
+            free = [p for p in legal if not p[0] & occupied]
+            if not free:
+                return None
+            mask, row, col, orient = rng.choice(free)
+        occupied |= mask
+        placements[i] = (row, col, int(orient == "V"))
+    return placements
+
+
+def _place_sparse(lengths, order, size, rng, taken) -> Optional[List[Placement]]:
+    occupied = set(taken)
+    placements: List[Optional[Placement]] = [None] * len(lengths)
+
+    for i in order:
+        length = lengths[i]
+        placement = _draw_free(length, size, rng, occupied)
+        if placement is None:
+            return None
+        occupied.update(ship_cells(*placement[:2], length, placement[2]))
+        placements[i] = placement
+    return placements
+
+
+def _draw_free(length: int, size: int, rng: random.Random, occupied) -> Optional[Placement]:
+    """Uniform free placement for one ship, checked against a set of occupied cells."""
+    span = size - length + 1  # Start positions along the ship's axis
+    count = size * span       # Placements per orientation
+    total = count if length == 1 else 2 * count  # 1-cell ships: H and V are the same cell
+
+    for _ in range(PROBES):
+        placement = _nth_placement(rng.randrange(total), size, span, count)
+        if not any(cell in occupied for cell in ship_cells(*placement[:2], length, placement[2])):
+            return placement
+
+    # Probes kept colliding: enumerate every placement and keep the free ones
+    free = []
+    for n in range(total):
+        placement = _nth_placement(n, size, span, count)
+        if not any(cell in occupied for cell in ship_cells(*placement[:2], length, placement[2])):
+            free.append(placement)
+    return rng.choice(free) if free else None
+
+
+def _nth_placement(n: int, size: int, span: int, count: int) -> Placement:
+    # Placements are numbered horizontal first (row-major over size x span), then vertical (span x size)
+    if n < count:
+        row, col = divmod(n, span)
+        return row, col, 0
+    row, col = divmod(n - count, size)
+    return row, col, 1
+
+
+def random_fleets(n: int, lengths: Sequence[int], size: int = GRID_SIZE, seed=None):
+    """
+    Draw `n` independent random fleets in one vectorized pass (needs NumPy).
+    Returns an int16 array of shape (n, len(lengths), 3) holding (row, col, vertical) for each ship,
+    in the order of `lengths`. decode_fleet() turns one row back into cell lists.
+    """
+    import numpy as np  # Imported lazily: single fleets and the UI do not need NumPy
+
+    for length in lengths:
+        if not 0 < length <= size:
+            raise ValueError(f"ship length {length} does not fit a {size}x{size} grid")
+
+    gen = np.random.default_rng(seed)
+    out = np.zeros((n, len(lengths), 3), dtype=np.int16)
+    placed = np.full((n, sum(lengths)), -1, dtype=np.int64)  # Flat cell index of every ship cell so far
+    used = 0
+
+    for i in sorted(range(len(lengths)), key=lambda i: -lengths[i]):
+        length = lengths[i]
+        span = size - length + 1
+        count = size * span
+        total = count if length == 1 else 2 * count
+        steps = np.arange(length)
+
+        rows = np.arange(n)  # Fleets that still need this ship
+        for _ in range(PROBES):
+            pick = gen.integers(total, size=len(rows))
+            vertical = pick >= count
+            pick = np.where(vertical, pick - count, pick)
+            r, c = np.where(vertical, pick // size, pick // span), np.where(vertical, pick % size, pick % span)
+            cells = (r * size + c)[:, None] + np.where(vertical, size, 1)[:, None] * steps
+            # Collision test against the ships already in the same fleet (independent of board size)
+            clash = (cells[:, :, None] == placed[rows, None, :used]).any(axis=(1, 2))
+            ok = ~clash
+            good = rows[ok]
+            out[good, i, 0], out[good, i, 1], out[good, i, 2] = r[ok], c[ok], vertical[ok]
+            placed[good, used:used + length] = cells[ok]
+            rows = rows[clash]
+            if not len(rows):
+                break
+
+        # Rare stragglers: finish this ship with an exact draw against that fleet's cells
+        for row in rows:
+            occupied = {divmod(int(cell), size) for cell in placed[row, :used]}
+            placement = _draw_free(length, size, random.Random(int(gen.integers(1 << 62))), occupied)
+            if placement is None:
+                raise ValueError(f"could not fit ships {list(lengths)} on a {size}x{size} grid")
+            out[row, i] = placement
+            r, c, v = placement
+            placed[row, used:used + length] = [rr * size + cc for rr, cc in ship_cells(r, c, length, v)]
+
+        used += length
+    return out
+
+
+def decode_fleet(placements, lengths: Sequence[int]) -> List[List[Coord]]:
+    """Cell lists for one fleet from random_fleets() (one (k, 3) row of the batch array)."""
+    return [ship_cells(int(r), int(c), length, int(v)) for (r, c, v), length in zip(placements.tolist(), lengths)]
+
+
+class FleetPool:
+    """
+    Engine placement strategy that hands out fleets from pre-generated batches.
+    Refills itself with random_fleets() whenever it runs dry (or when the lengths / grid size change).
+    """
+
+    def __init__(self, batch: int = 1024, seed=None):
+        import numpy as np  # Fail early if NumPy is missing
+
+        self.batch = batch
+        self._gen = np.random.default_rng(seed)
+        self._key = None     # (lengths, size) of the current batch
+        self._fleets = None  # Current batch as nested lists
+        self._next = 0
+
+    def __call__(self, lengths: List[int], size: int, rng: random.Random) -> List[List[Coord]]:
+        key = (tuple(lengths), size)
+        if key != self._key or self._next >= len(self._fleets):
+            self._key = key
+            self._fleets = random_fleets(self.batch, lengths, size, self._gen).tolist()
+            self._next = 0
+        fleet = self._fleets[self._next]
+        self._next += 1
+        return [ship_cells(r, c, length, v) for (r, c, v), length in zip(fleet, lengths)]
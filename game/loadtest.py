@@ -0,0 +1,157 @@
+# game/loadtest.py
+# Battleship Project - Loopback load test for the game server
+# Created: 2026-10-17
+
+'''
+This file drives game.server with many simulated players over real TCP connections.
+Every bot connects, asks for a match, places a random fleet and fires with the hunt/target strategy from
+game/engine.py until its game ends; all sessions play at the same time. Latency is measured per move, from
+sending FIRE to receiving the server's SHOT for it. With --think bots pause before each shot like people do;
+without it every session fires flat out, which measures saturation rather than typical latency.
+Without --connect a server is started in the same process on a free loopback port, so bots and server share one
+event loop (and one core): the numbers are a conservative bound for a dedicated server process.
+Run from the project root, for example:
+
+    python -m game.loadtest --sessions 2000 --think 500
+    python -m game.loadtest --sessions 2000 --connect 127.0.0.1:8765
+'''
+
+import argparse
+import asyncio
+import random
+import time
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+
+from game.board import GRID_SIZE, new_shot_board
+from game.bitboard import HIT, MISS
+from game.engine import hunt_target_shooter
+from game.fleetgen import random_fleet
+from game.protocol import decode, encode, fleet_words
+from game.server import GameServer
+from game.ships import build_ship_set
+
+
+@dataclass
+class LoadResult:
+    sessions: int
+    games_finished: int
+    moves: int
+    seconds: float
+    latencies: List[float] = field(default_factory=list, repr=False)  # seconds per move
+    peak_matches: int = 0
+
+    def percentile(self, p: float) -> float:
+        """Latency percentile in milliseconds."""
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(p / 100 * len(ordered)))] * 1000
+
+    def summary(self) -> str:
+        rate = self.moves / self.seconds if self.seconds > 0 else 0.0
+        return (
+            f"{self.sessions} sessions ({self.peak_matches} concurrent at peak), {self.games_finished} games finished "
+            f"in {self.seconds:.2f}s | {self.moves} moves ({rate:,.0f} moves/sec) | "
+            f"latency p50 {self.percentile(50):.2f} ms, p99 {self.percentile(99):.2f} ms, "
+            f"max {self.percentile(100):.2f} ms"
+        )
+
+
+async def _bot(host: str, port: int, size: int, num_ships: int, seed: int, think: float,
+               latencies: List[float], start: asyncio.Event) -> bool:
+    """One simulated player; returns True if its game ran to the end."""
+    rng = random.Random(seed)
+    lengths = [ship.length for ship in build_ship_set(num_ships)]
+    reader, writer = await asyncio.open_connection(host, port)
+    await start.wait()  # Everyone connects first, then all sessions play at once
+    writer.write(encode("HELLO", size, num_ships))
+
+    me = 0
+    shots = new_shot_board(size)
+    fired_at = 0.0
+    try:
+        while True:
+            line = await reader.readline()
+            if not line:
+                return False
+            words = decode(line)
+            kind = words[0]
+            if kind == "START":
+                me = int(words[1])
+                writer.write(encode("PLACE", *fleet_words(random_fleet(lengths, size, rng))))
+            elif kind == "TURN" and int(words[1]) == me:
+                if think:
+                    await asyncio.sleep(rng.uniform(0, 2 * think))  # A person takes a moment to aim
+                row, col = hunt_target_shooter(shots, lengths, rng)
+                fired_at = time.perf_counter()
+                writer.write(encode("FIRE", row, col))
+            elif kind == "SHOT" and int(words[1]) == me:
+                latencies.append(time.perf_counter() - fired_at)
+                shots.put(int(words[2]), int(words[3]), MISS if words[4] == "miss" else HIT)
+            elif kind == "OVER":
+                return True
+            elif kind in ("LEFT", "ERROR"):
+                return False
+    finally:
+        writer.write(encode("QUIT"))
+        writer.close()
+
+
+async def run_load(sessions: int, size: int = GRID_SIZE, num_ships: int = 5, seed: int = 0,
+                   connect: Optional[Tuple[str, int]] = None, think: float = 0.0) -> LoadResult:
+    """
+    Play `sessions` concurrent games (2 bots each) against a server and measure them.
+    think is the mean pause in seconds before each shot (0 = fire as fast as possible, a pure stress test).
+    """
+    server = None
+    if connect is None:
+        server = GameServer("127.0.0.1", 0)
+        await server.start()
+        host, port = server.host, server.port
+    else:
+        host, port = connect
+
+    latencies: List[float] = []
+    go = asyncio.Event()
+    bots = [
+        asyncio.ensure_future(_bot(host, port, size, num_ships, seed * 1_000_003 + i, think, latencies, go))
+        for i in range(2 * sessions)
+    ]
+    while server is not None and server.connections < 2 * sessions:
+        await asyncio.sleep(0.01)  # Wait until every connection is accepted
+    begin = time.perf_counter()
+    go.set()
+    finished = await asyncio.gather(*bots)
+    elapsed = time.perf_counter() - begin
+
+    peak = 0
+    if server is not None:
+        peak = server.peak_matches
+        await server.close()
+    return LoadResult(sessions=sessions, games_finished=sum(finished) // 2, moves=len(latencies),
+                      seconds=elapsed, latencies=latencies, peak_matches=peak)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load-test the Battleship server with loopback clients.")
+    parser.add_argument("--sessions", type=int, default=1000, help="concurrent games (two clients each)")
+    parser.add_argument("--size", type=int, default=GRID_SIZE, help="grid size")
+    parser.add_argument("--ships", type=int, default=5, help="number of ships (1..N lengths)")
+    parser.add_argument("--seed", type=int, default=0, help="base RNG seed")
+    parser.add_argument("--think", type=float, default=0.0, metavar="MS",
+                        help="mean pause before each shot in ms (0 = stress test, no pause)")
+    parser.add_argument("--connect", default=None, metavar="HOST:PORT",
+                        help="use a running server instead of an in-process one")
+    args = parser.parse_args(argv)
+
+    connect = None
+    if args.connect:
+        host, port = args.connect.rsplit(":", 1)
+        connect = (host, int(port))
+    result = asyncio.run(run_load(args.sessions, args.size, args.ships, args.seed, connect, args.think / 1000))
+    print(result.summary())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+# game/placement.py
+# Battleship Project - Precomputed placement masks
+# Created: 2026-10-17
+
+'''
+This file holds a lazily built lookup table of ship placement masks for a given grid size.
+For every (length, orientation, row, col) the table stores the bitmask of the cells that ship would cover,
+or 0 when the ship would run off the board. With the table, "can this ship go here?" is one mask AND against
+a BitBoard and "place it" is one mask OR, with no coordinate lists built per query.
+Rows of the table are only built the first time a ship length is asked for, and one table is shared per grid size,
+so Board, PlacementScreen, random fleet generation and the AI all reuse the same masks.
+'''
+
+from functools import lru_cache
+from typing import Dict, List, Tuple
+
+ORIENTATIONS = ("H", "V")
+
+
+class PlacementTable:
+    """
+    Placement masks for one grid size.
+    masks(length, orientation)[row * size + col] -> cells bitmask, 0 if the ship does not fit there.
+    """
+
+    def __init__(self, size: int):
+        self.size = size
+        self._masks: Dict[Tuple[int, str], List[int]] = {}  # (length, orientation) -> flat mask list
+        self._legal: Dict[int, List[Tuple[int, int, int, str]]] = {}  # length -> legal placements
+
+    def masks(self, length: int, orientation: str) -> List[int]:
+        key = (length, orientation)
+        table = self._masks.get(key)
+        if table is None:  # First request for this length: build both orientations
+            self._build(length)
+            table = self._masks[key]
+        return table
+
+    def mask(self, row: int, col: int, length: int, orientation: str) -> int:
+        """Mask for one placement, 0 if it is off the board or otherwise invalid."""
+        size = self.size
+        if not (0 <= row < size and 0 <= col < size):
+            return 0
+        if orientation not in ORIENTATIONS or not 0 < length <= size:
+            return 0
+        return self.masks(length, orientation)[row * size + col]
+
+    def legal(self, length: int) -> List[Tuple[int, int, int, str]]:
+        """Every on-board placement of a ship length as (mask, row, col, orientation)."""
+        placements = self._legal.get(length)
+        if placements is None:
+            placements = []
+            for orientation in ORIENTATIONS if length > 1 else ("H",):  # 1-cell ships: H and V are the same cell
+                for i, m in enumerate(self.masks(length, orientation)):
+                    if m:
+                        row, col = divmod(i, self.size)
+                        placements.append((m, row, col, orientation))
+            self._legal[length] = placements
+        return placements
+
+    def _build(self, length: int) -> None:
+        size = self.size
+        run = (1 << length) - 1  # `length` consecutive bits = a horizontal ship at bit 0
+        vertical = 0             # one bit every `size` bits = a vertical ship at bit 0
+        for i in range(length):
+            vertical |= 1 << (i * size)
+
+        horizontal_masks = []
+        vertical_masks = []
+        for row in range(size):
+            for col in range(size):
+                start = row * size + col
+                horizontal_masks.append(run << start if col + length <= size else 0)
+                vertical_masks.append(vertical << start if row + length <= size else 0)
+
+        self._masks[(length, "H")] = horizontal_masks
+        self._masks[(length, "V")] = vertical_masks
+
+
+@lru_cache(maxsize=None)
+def placement_table(size: int) -> PlacementTable:
+    """Shared table for a grid size (built once, filled in lazily per ship length)."""
+    return PlacementTable(size)
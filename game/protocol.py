@@ -0,0 +1,88 @@
+# game/protocol.py
+# Battleship Project - Network protocol for online games
+# Created: 2026-10-17
+
+'''
+This file defines the small line protocol spoken between game.server and its clients (the Tk app's online mode
+and the loopback load tester). Every message is one line of ASCII words separated by spaces, ending in "\n".
+
+Client -> server:
+    HELLO <size> <ships>          ask for a match on a size x size grid with ships of length 1..<ships>
+    PLACE <row> <col> <len> <H|V> ...   the whole fleet, four words per ship (before or after START)
+    FIRE <row> <col>              shoot (only on your turn)
+    QUIT                          leave
+
+Server -> client:
+    WAIT                          queued until an opponent with the same settings arrives
+    START <player> <size> <ships> matched: you are player 1 or 2
+    READY                         your fleet was accepted, waiting for the opponent's
+    TURN <player>                 that player fires next (player 1 fires first, like the hot-seat game)
+    SHOT <player> <row> <col> <miss|hit|sink>   a shot was resolved (sent to both players)
+    OVER <winner>                 the game is finished
+    LEFT                          the opponent disconnected; the game is over
+    ERROR <text>                  the last command was rejected; the connection stays usable
+
+The helpers here only build and parse lines; all game rules stay in game.rules.
+'''
+
+from collections import Counter
+from typing import List, Sequence
+
+from game.bitboard import Coord
+from game.fleetgen import ship_cells
+from game.record import ship_spec
+
+DEFAULT_PORT = 8765
+MAX_LINE = 4096   # Longest accepted line (a 5-ship PLACE is well under 100 bytes)
+MIN_SHIPS = 1
+MAX_SHIPS = 5
+
+
+def encode(*words) -> bytes:
+    """One protocol line from its words."""
+    return (" ".join(map(str, words)) + "\n").encode("ascii")
+
+
+def decode(line: bytes) -> List[str]:
+    """Words of one received line ([] for a blank line)."""
+    return line.decode("ascii", "replace").split()
+
+
+def fleet_words(ships) -> List[str]:
+    """PLACE arguments for a fleet given as coordinate lists."""
+    words: List[str] = []
+    for cells in ships:
+        row, col, length, vertical = ship_spec(cells)
+        words += (str(row), str(col), str(length), "V" if vertical else "H")
+    return words
+
+
+def parse_fleet(words: Sequence[str], size: int, lengths: Sequence[int]) -> List[List[Coord]]:
+    """
+    Turn PLACE arguments back into ships (coordinate lists), checking that they fit on the board,
+    do not overlap, and are exactly the required ship lengths. Raises ValueError otherwise.
+    """
+    if len(words) % 4:
+        raise ValueError("PLACE needs four words per ship")
+    wanted = f"fleet must be ships of length {' '.join(map(str, sorted(lengths)))}"
+    remaining = Counter(lengths)  # Lengths still to be placed; bounds every ship before any cells are built
+    ships: List[List[Coord]] = []
+    taken = set()
+    for i in range(0, len(words), 4):
+        row, col, length, orient = int(words[i]), int(words[i + 1]), int(words[i + 2]), words[i + 3]
+        if orient not in ("H", "V") or length < 1:
+            raise ValueError(f"bad ship {' '.join(words[i:i + 4])}")
+        if remaining[length] == 0:
+            raise ValueError(wanted)
+        remaining[length] -= 1
+        end_row, end_col = (row + length - 1, col) if orient == "V" else (row, col + length - 1)
+        if not (0 <= row and 0 <= col and end_row < size and end_col < size):
+            raise ValueError(f"ship at {row} {col} is off the board")
+        cells = ship_cells(row, col, length, orient == "V")
+        if taken.intersection(cells):
+            raise ValueError(f"ship at {row} {col} overlaps another ship")
+        taken.update(cells)
+        ships.append(cells)
+    if +remaining:  # Some required ships were never placed
+        raise ValueError(wanted)
+    return ships
@@ -0,0 +1,546 @@
+# game/record.py
+# Battleship Project - Compact binary game records and replay
+# Created: 2026-10-17
+
+'''
+This file defines a compact binary format for finished (or abandoned) games, plus streaming readers/writers
+and a replay engine that rebuilds and verifies recorded games.
+
+A record file starts with a 5-byte file header (magic b"BSGR" + format version), followed by records back to back:
+
+    header   <HBBBI  grid size, P1 ship count, P2 ship count, winner (0 = unfinished), shot count
+    fleets   per ship: start cell + one byte (length << 1 | vertical), P1's ships then P2's
+    shots    one code per shot: cell << 1 | hit, Player 1 first and strictly alternating (like the game)
+
+A cell is row * size + col. Cells and shot codes are stored in the narrowest little-endian unsigned width that
+fits the grid: 1 byte up to 11x11, 2 bytes up to 181x181, 4 bytes above. A 10x10 game is typically 100-200 bytes.
+Records carry the hit flag of every shot, so hit/miss analysis needs no replay; replay() re-derives it anyway
+and checks it against the record.
+
+Verification does not step through the rules engine. check_records() decodes a whole batch of packed records
+into NumPy arrays of ship cells and shots at once. It then verifies them with set arithmetic over
+(game, player, cell) keys. A shot is a hit exactly when its key is one of the defender's ship cells. No
+attacker fires at a cell twice. A player wins on the shot that covers every cell of the other fleet, which
+must be the last shot of the record. With verify=True each game is also re-run through game.rules.fire_shot
+as a cross-check; that path is also used when NumPy is not installed.
+
+Run from the project root to replay a whole archive, for example:
+
+    python -m game.record games.bsgr --workers 8
+'''
+
+import argparse
+import os
+import struct
+import time
+from dataclasses import dataclass, field
+from multiprocessing import Pool
+from typing import BinaryIO, Iterator, List, Optional, Sequence, Tuple
+
+from game.bitboard import Coord
+from game.board import new_shot_board
+from game.fleet import Fleet
+from game.fleetgen import ship_cells
+from game.rules import HIT, MISS, fire_shot
+
+FILE_MAGIC = b"BSGR"
+FORMAT_VERSION = 1
+MAX_SHIP_LENGTH = 127  # Length shares a byte with the orientation bit
+
+_FILE_HEADER = struct.Struct("<4sB")
+_RECORD_HEADER = struct.Struct("<HBBBI")  # size, P1 ships, P2 ships, winner, shots
+
+# One ship in a record: (row, col, length, vertical)
+ShipSpec = Tuple[int, int, int, int]
+
+
+def cell_width(size: int) -> int:
+    """Bytes used per cell / shot code on a size x size grid."""
+    codes = size * size * 2  # cell << 1 | hit
+    if codes <= 1 << 8:
+        return 1
+    if codes <= 1 << 16:
+        return 2
+    return 4
+
+
+def cell_code(size: int) -> str:
+    """struct format code matching cell_width(size)."""
+    return {1: "B", 2: "H", 4: "I"}[cell_width(size)]
+
+
+def ship_spec(cells: Sequence[Coord]) -> ShipSpec:
+    """(row, col, length, vertical) of a straight ship given as a coordinate list."""
+    row, col = min(cells)
+    vertical = int(len(cells) > 1 and cells[0][1] == cells[1][1])
+    return row, col, len(cells), vertical
+
+
+@dataclass
+class GameRecord:
+    size: int
+    fleets: Tuple[List[ShipSpec], List[ShipSpec]]  # Player 1's ships, Player 2's ships
+    shots: List[int] = field(default_factory=list)  # cell << 1 | hit, alternating from Player 1
+    winner: int = 0  # 1 or 2, 0 if the game was not finished
+
+    @classmethod
+    def from_fleets(cls, size: int, p1_ships, p2_ships) -> "GameRecord":
+        """Start a record for two fleets given as coordinate lists (a Fleet works too)."""
+        return cls(size, ([ship_spec(s) for s in p1_ships], [ship_spec(s) for s in p2_ships]))
+
+    def add_shot(self, row: int, col: int, hit: bool) -> None:
+        self.shots.append((row * self.size + col) << 1 | hit)
+
+    def moves(self) -> Iterator[Tuple[int, int, int, bool]]:
+        """(player, row, col, hit) for every shot, in firing order."""
+        size = self.size
+        for i, code in enumerate(self.shots):
+            row, col = divmod(code >> 1, size)
+            yield (i & 1) + 1, row, col, bool(code & 1)
+
+    def ships(self, player: int) -> List[List[Coord]]:
+        """Player's ships as coordinate lists."""
+        return [ship_cells(row, col, length, vertical) for row, col, length, vertical in self.fleets[player - 1]]
+
+    # --- binary form ---
+
+    def to_bytes(self) -> bytes:
+        size = self.size
+        code = cell_code(size)
+        p1, p2 = self.fleets
+
+        fleet = []
+        for row, col, length, vertical in p1 + p2:
+            if not 0 < length <= MAX_SHIP_LENGTH:
+                raise ValueError(f"Ship length {length} cannot be recorded (1..{MAX_SHIP_LENGTH})")
+            fleet += (row * size + col, length << 1 | vertical)
+
+        return b"".join((
+            _RECORD_HEADER.pack(size, len(p1), len(p2), self.winner, len(self.shots)),
+            struct.pack("<" + (code + "B") * (len(p1) + len(p2)), *fleet),
+            struct.pack(f"<{len(self.shots)}{code}", *self.shots),
+        ))
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "GameRecord":
+        record, end = _decode(data, 0)
+        if end != len(data):
+            raise ValueError(f"{len(data) - end} trailing bytes after game record")
+        return record
+
+
+def _body_length(size: int, ships: int, shots: int) -> int:
+    """Bytes after the record header."""
+    width = cell_width(size)
+    return ships * (width + 1) + shots * width
+
+
+def _decode(data, offset: int) -> Tuple[GameRecord, int]:
+    """Decode the record starting at data[offset]; returns it and the offset just past it."""
+    size, n1, n2, winner, n_shots = _RECORD_HEADER.unpack_from(data, offset)
+    offset += _RECORD_HEADER.size
+    width = cell_width(size)
+    code = cell_code(size)
+
+    fleet = struct.unpack_from("<" + (code + "B") * (n1 + n2), data, offset)
+    offset += (n1 + n2) * (width + 1)
+    shots = list(struct.unpack_from(f"<{n_shots}{code}", data, offset))
+    offset += n_shots * width
+
+    specs = [(*divmod(fleet[i], size), fleet[i + 1] >> 1, fleet[i + 1] & 1) for i in range(0, len(fleet), 2)]
+    return GameRecord(size, (specs[:n1], specs[n1:]), shots, winner), offset
+
+
+# --- streaming files ---
+
+class RecordWriter:
+    """
+    Appends records to a binary stream (or a path, opened for writing).
+    Use as a context manager; the file header is written on open.
+    """
+
+    def __init__(self, target):
+        self._own = isinstance(target, (str, os.PathLike))
+        self._file: BinaryIO = open(target, "wb") if self._own else target
+        self._file.write(_FILE_HEADER.pack(FILE_MAGIC, FORMAT_VERSION))
+        self.count = 0
+
+    def write(self, record: GameRecord) -> None:
+        self._file.write(record.to_bytes())
+        self.count += 1
+
+    def write_raw(self, blob: bytes, count: int) -> None:
+        """Append already-encoded records (e.g. a batch built in a worker process)."""
+        self._file.write(blob)
+        self.count += count
+
+    def close(self) -> None:
+        if self._own:
+            self._file.close()
+        else:
+            self._file.flush()
+
+    def __enter__(self) -> "RecordWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class RecordReader:
+    """
+    Iterates the records of a binary stream (or a path), reading one record at a time.
+    raw() yields the encoded bytes instead, for handing batches to other processes cheaply.
+    """
+
+    def __init__(self, source):
+        self._own = isinstance(source, (str, os.PathLike))
+        self._file: BinaryIO = open(source, "rb") if self._own else source
+        header = self._file.read(_FILE_HEADER.size)
+        if len(header) < _FILE_HEADER.size:
+            raise ValueError("Not a game record file (too short)")
+        magic, version = _FILE_HEADER.unpack(header)
+        if magic != FILE_MAGIC:
+            raise ValueError("Not a game record file (bad magic)")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"Unsupported game record version {version}")
+
+    def raw(self) -> Iterator[bytes]:
+        for _, blob in self._records():
+            yield blob
+
+    def _records(self) -> Iterator[Tuple[Tuple[int, int, int, int, int], bytes]]:
+        # (header fields, encoded record) for each record in the stream
+        read = self._file.read
+        while True:
+            header = read(_RECORD_HEADER.size)
+            if not header:
+                return
+            if len(header) < _RECORD_HEADER.size:
+                raise ValueError("Truncated game record header")
+            fields = _RECORD_HEADER.unpack(header)
+            size, n1, n2, _, n_shots = fields
+            need = _body_length(size, n1 + n2, n_shots)
+            body = read(need)
+            if len(body) < need:
+                raise ValueError("Truncated game record")
+            yield fields, header + body
+
+    def __iter__(self) -> Iterator[GameRecord]:
+        for blob in self.raw():
+            yield _decode(blob, 0)[0]
+
+    def close(self) -> None:
+        if self._own:
+            self._file.close()
+
+    def __enter__(self) -> "RecordReader":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def decode_all(blob: bytes) -> Iterator[GameRecord]:
+    """Records packed back to back in one bytes object (no file header)."""
+    offset = 0
+    while offset < len(blob):
+        record, offset = _decode(blob, offset)
+        yield record
+
+
+# --- replay ---
+
+@dataclass
+class ReplayState:
+    """Both sides of a replayed game, as fire_shot left them."""
+    winner: int  # 1 or 2, 0 if nobody had won when the record ends
+    shots: Tuple[object, object]     # Player 1's / Player 2's shot boards
+    incoming: Tuple[object, object]  # shots received by Player 1 / Player 2
+    fleets: Tuple[Fleet, Fleet]
+
+
+def replay(record: GameRecord, verify: bool = False) -> ReplayState:
+    """
+    Rebuild a recorded game: both shot boards, both incoming boards and the fleets with their hits.
+    The record is checked with check_records() (mask arithmetic); a shot whose hit flag disagrees with the fleets,
+    a repeated shot, a shot after the game ended or a wrong winner raises ValueError.
+    verify=True also re-fires every shot through game.rules.fire_shot and requires the same outcome.
+    """
+    try:
+        winner = int(check_records(record.to_bytes())[0][0])
+    except ImportError:  # No NumPy: the rules engine does the checking
+        return _fire_replay(record)
+
+    size = record.size
+    fleets = (Fleet(record.ships(1)), Fleet(record.ships(2)))
+    shots = (new_shot_board(size), new_shot_board(size))
+    incoming = (new_shot_board(size), new_shot_board(size))
+    for i, code in enumerate(record.shots):  # Already verified: just write the marks down
+        row, col = divmod(code >> 1, size)
+        mark = HIT if code & 1 else MISS
+        shots[i & 1].put(row, col, mark)
+        incoming[1 - (i & 1)].put(row, col, mark)
+        if code & 1:
+            fleet = fleets[1 - (i & 1)]
+            fleet.register_hit(fleet.ship_at((row, col)))
+    state = ReplayState(winner, shots, incoming, fleets)
+
+    if verify:
+        fired = _fire_replay(record)
+        if fired.winner != winner or fired.shots != shots or fired.incoming != incoming:
+            raise ValueError("fire_shot replay disagrees with the mask replay")
+    return state
+
+
+def _fire_replay(record: GameRecord) -> ReplayState:
+    # Reference replay: every recorded shot through game.rules.fire_shot, checked as it goes
+    size = record.size
+    fleets = (Fleet(record.ships(1)), Fleet(record.ships(2)))
+    for player, fleet in ((1, fleets[0]), (2, fleets[1])):
+        if len({cell for cells in fleet for cell in cells}) != sum(len(cells) for cells in fleet):
+            raise ValueError(f"Player {player}'s ships overlap")
+    shots = (new_shot_board(size), new_shot_board(size))
+    incoming = (new_shot_board(size), new_shot_board(size))
+    hits = (set(), set())
+
+    # fire_shot arguments for each attacker: (own shot board, target's incoming board, target fleet, target hits)
+    sides = ((shots[0], incoming[1], fleets[1], hits[1]), (shots[1], incoming[0], fleets[0], hits[0]))
+
+    winner = 0
+    for i, code in enumerate(record.shots):
+        if winner:
+            raise ValueError(f"Shot {i} fired after Player {winner} had already won")
+        side = sides[i & 1]
+        row, col = divmod(code >> 1, size)
+        result = fire_shot(*side, row, col)
+        if result == "already" or (result != "miss") != (code & 1):
+            raise ValueError(f"Shot {i} at {(row, col)} replays as {result!r}, record disagrees")
+        if side[2].afloat == 0:
+            winner = (i & 1) + 1
+
+    if winner != record.winner:
+        raise ValueError(f"Record says winner {record.winner}, replay gives {winner}")
+    return ReplayState(winner, shots, incoming, fleets)
+
+
+# --- vectorized verification (NumPy) ---
+
+_CHECK_KEYS = 1 << 24  # (game, cell, player) keys per pass of check_records: bounds its lookup tables
+
+
+def _spans(np, counts):
+    """For items laid out as consecutive runs of `counts`: (run index, position within the run) of each item."""
+    owner = np.repeat(np.arange(len(counts), dtype=np.int32), counts)
+    starts = (np.cumsum(counts) - counts).astype(np.int32)
+    return owner, np.arange(int(counts.sum()), dtype=np.int32) - starts[owner]
+
+
+def _read_uint(np, data, positions, width: int):
+    """Little-endian unsigned integers of `width` bytes starting at each byte position."""
+    value = data[positions].astype(np.int32)
+    for b in range(1, width):
+        value |= data[positions + b].astype(np.int32) << (8 * b)
+    return value
+
+
+def _check_group(np, data, heads, size: int, errors: dict):
+    """
+    Verify records of one grid size; heads rows are (index, offset, n1, n2, winner, shots).
+    Returns the replayed winner of each record; problems are added to errors (record index -> reason).
+    Every check is a whole-batch array operation; the per-record culprits are only worked out when one fails.
+    """
+    width = cell_width(size)
+    cells = size * size
+    rec, offset, n1, n2, winner, n_shots = heads.T
+    games = len(heads)
+    keys = 2 * games * cells  # (game, cell, player) -> (game * cells + cell) * 2 + player
+
+    def fail(bad_games, reason: str) -> None:
+        for index in np.unique(rec[bad_games]).tolist():
+            errors.setdefault(index, reason)
+
+    # Ships: start cell + (length << 1 | vertical), P1's ships first
+    owner, j = _spans(np, n1 + n2)
+    at = offset[owner] + _RECORD_HEADER.size + j * (width + 1)
+    start = _read_uint(np, data, at, width)
+    packed = data[at + width].astype(np.int32)
+    length, vertical = packed >> 1, packed & 1
+    player = (j >= n1[owner]).astype(np.int32)
+    reach = np.where(vertical == 1, start // size, start % size) + length
+    off_board = (start >= cells) | (length < 1) | (reach > size)
+    if off_board.any():
+        fail(owner[off_board], "ship off the board")
+        length = np.where(off_board, 0, length)  # Keep bad ships out of the lookup tables
+
+    # Every ship cell marked in one flat table; fewer marks than cells means two ships share one
+    ship, t = _spans(np, length)
+    step = np.where(vertical[ship] == 1, size, 1).astype(np.int32)
+    fleet_keys = (owner[ship] * cells + start[ship] + t * step) * 2 + player[ship]
+    fleet = np.zeros(keys, bool)
+    fleet[fleet_keys] = True
+    if np.count_nonzero(fleet) != len(fleet_keys):
+        fail(np.flatnonzero(np.bincount(fleet_keys, minlength=keys) > 1) // (2 * cells), "ships overlap")
+    fleet_cells = np.bincount(owner[ship] * 2 + player[ship], minlength=2 * games)  # Cells per (game, player)
+
+    # Shots: cell << 1 | hit, alternating from Player 1 (each record's shots are contiguous)
+    shot_owner, i = _spans(np, n_shots)
+    base = offset + _RECORD_HEADER.size + (n1 + n2) * (width + 1)
+    code = _read_uint(np, data, base[shot_owner] + (i if width == 1 else i * width), width)
+    attacker = i & 1
+    off_board = code >= 2 * cells
+    if off_board.any():
+        fail(shot_owner[off_board], "shot off the board")
+        code = np.where(off_board, 0, code)
+
+    # The shooter's key is (game, cell, attacker); the same cell of the defender's fleet is key ^ 1
+    fired = (2 * cells * shot_owner) + ((code & ~1) | attacker)
+    hit = fleet[fired ^ 1]
+    wrong = hit != (code & 1).astype(bool)
+    if wrong.any():
+        fail(shot_owner[wrong], "a shot's hit flag disagrees with the fleets")
+
+    # Nobody fires at the same cell twice: as many distinct keys as shots
+    seen = np.zeros(keys, bool)
+    seen[fired] = True
+    if np.count_nonzero(seen) != len(fired):
+        fail(np.flatnonzero(np.bincount(fired, minlength=keys) > 1) // (2 * cells), "a cell is shot twice")
+
+    # The game ends on the hit that covers the whole opposing fleet (on the first shot if that fleet is empty).
+    # Only hits are needed: the k-th hit of an attacker in a game is its running hit count.
+    never = np.iinfo(np.int64).max
+    end = np.full(games, never)
+    hits = np.flatnonzero(hit)
+    for side in (0, 1):
+        mine = hits[attacker[hits] == side]
+        game = shot_owner[mine]
+        first = np.ones(len(game), bool)  # First hit of each game (hits are in game order)
+        first[1:] = game[1:] != game[:-1]
+        starts = np.flatnonzero(first)
+        count = np.arange(1, len(game) + 1) - np.repeat(starts, np.diff(np.append(starts, len(game))))
+        won = count == fleet_cells[game * 2 + 1 - side]
+        end[game[won]] = np.minimum(end[game[won]], i[mine][won])
+        empty = (fleet_cells[1 - side::2] == 0) & (n_shots > side)  # Nothing to sink: first shot wins
+        end[empty] = np.minimum(end[empty], side)
+
+    won_games = np.flatnonzero(end != never)
+    last = end[won_games]
+    replayed = np.zeros(games, np.int64)
+    replayed[won_games] = (last & 1) + 1
+    fail(won_games[last + 1 < n_shots[won_games]], "shots fired after the game was won")
+    fail(np.flatnonzero(replayed != winner), "the recorded winner does not match the replay")
+    return replayed
+
+
+def check_records(blob: bytes, heads: Optional[List[Tuple[int, ...]]] = None) -> Tuple["object", int]:
+    """
+    Verify every record packed back to back in blob (no file header) without replaying shot by shot.
+    heads, if the caller already walked the blob, lists (index, offset, size, P1 ships, P2 ships, winner, shots)
+    per record.
+    Returns (winner per record as a NumPy array, total shots); raises ValueError naming the first bad record.
+    Needs NumPy (ImportError otherwise).
+    """
+    import numpy as np  # Imported lazily: reading and writing records does not need NumPy
+
+    if heads is None:  # Walk the headers once to find every record; everything after this is array arithmetic
+        heads, widths = [], {}
+        unpack = _RECORD_HEADER.unpack_from
+        offset, end = 0, len(blob)
+        while offset < end:
+            if offset + _RECORD_HEADER.size > end:
+                raise ValueError("Truncated game record header")
+            size, n1, n2, winner, n_shots = unpack(blob, offset)
+            width = widths.get(size) or widths.setdefault(size, cell_width(size))
+            heads.append((len(heads), offset, size, n1, n2, winner, n_shots))
+            offset += _RECORD_HEADER.size + (n1 + n2) * (width + 1) + n_shots * width
+        if offset > end:
+            raise ValueError("Truncated game record")
+
+    data = np.frombuffer(blob, np.uint8)
+    table = np.array(heads, np.int64).reshape(-1, 7)
+    winners = np.zeros(len(table), np.int64)
+    errors: dict = {}
+    for size in np.unique(table[:, 2]).tolist():  # Key ranges depend on the grid size
+        group = table[table[:, 2] == size]
+        if size == 0:
+            errors.setdefault(int(group[0, 0]), "grid size 0")
+            continue
+        per_pass = max(1, _CHECK_KEYS // (2 * size * size))  # Games whose dense key tables fit in one pass
+        for first in range(0, len(group), per_pass):
+            part = group[first:first + per_pass]
+            winners[part[:, 0]] = _check_group(np, data, part[:, [0, 1, 3, 4, 5, 6]], size, errors)
+
+    if errors:
+        index = min(errors)
+        raise ValueError(f"Game record {index}: {errors[index]}")
+    return winners, int(table[:, 6].sum())
+
+
+def _replay_batch(args) -> Tuple[int, int, int, int]:
+    """Worker: verify a batch of encoded records (blob, headers, verify); returns (games, P1 wins, P2 wins, shots)."""
+    blob, heads, verify = args
+    try:
+        winners, shots = check_records(blob, heads)
+    except ImportError:  # No NumPy: replay every game through the rules engine
+        verify, winners, shots = True, None, 0
+    if verify:  # Cross-check each game with fire_shot
+        fired = [(_fire_replay(record).winner, len(record.shots)) for record in decode_all(blob)]
+        if winners is not None and [w for w, _ in fired] != winners.tolist():
+            raise ValueError("fire_shot replay disagrees with the mask replay")
+        winners = [w for w, _ in fired]
+        shots = sum(n for _, n in fired)
+    winners = list(winners)
+    return len(winners), winners.count(1), winners.count(2), shots
+
+
+def _batches(reader: RecordReader, batch: int) -> Iterator[Tuple[bytes, List[Tuple[int, ...]]]]:
+    # Batches of raw records plus the headers the reader already parsed (check_records then skips its own walk)
+    chunk: List[bytes] = []
+    heads: List[Tuple[int, ...]] = []
+    offset = 0
+    for header, blob in reader._records():
+        heads.append((len(heads), offset, *header))
+        chunk.append(blob)
+        offset += len(blob)
+        if len(chunk) == batch:
+            yield b"".join(chunk), heads
+            chunk, heads, offset = [], [], 0
+    if chunk:
+        yield b"".join(chunk), heads
+
+
+def replay_file(path, workers: Optional[int] = None, batch: int = 2000,
+                verify: bool = False) -> Tuple[Tuple[int, int, int, int], float]:
+    """
+    Verify every record in a file across a process pool (verify=True also re-fires each game through fire_shot).
+    The parent only splits the file into raw batches; parsing and checking happen in the workers.
+    Returns ((games, P1 wins, P2 wins, shots), seconds).
+    """
+    start = time.perf_counter()
+    with RecordReader(path) as reader:
+        tasks = ((blob, heads, verify) for blob, heads in _batches(reader, batch))
+        if workers == 1:
+            results = [_replay_batch(task) for task in tasks]
+        else:
+            with Pool(processes=workers or os.cpu_count()) as pool:
+                results = list(pool.imap_unordered(_replay_batch, tasks))
+    totals = tuple(sum(r[i] for r in results) for i in range(4))
+    return totals, time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Replay and verify a Battleship game record file.")
+    parser.add_argument("path", help="record file (written by game.simulate --record or the app)")
+    parser.add_argument("--workers", type=int, default=None, help="processes (default: all CPUs)")
+    parser.add_argument("--batch", type=int, default=2000, help="records per worker task")
+    parser.add_argument("--verify", action="store_true", help="also re-fire every shot through the rules engine")
+    args = parser.parse_args(argv)
+
+    (games, p1_wins, p2_wins, shots), seconds = replay_file(args.path, args.workers, args.batch, args.verify)
+    rate = games / seconds if seconds > 0 else 0.0
+    print(f"{games} games replayed in {seconds:.2f}s ({rate:,.0f} games/sec) | "
+          f"P1 wins: {p1_wins} | P2 wins: {p2_wins} | Shots: {shots}")
+
+
+if __name__ == "__main__":
+    main()
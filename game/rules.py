@@ -7,32 +7,34 @@
 '''
 This file contains the core Battleship rules, completely independent of the UI. 
 The fire_shot() function determines whether a shot is a hit, miss, sink, or already-fired location, 
-and updates both the attacker’s shot board and the defender’s incoming board. 
-It also tracks hits using a set so ship destruction can be detected efficiently. 
-The ships_remaining() function counts how many ships are still afloat and is used to determine when the game is over.
+and updates both the attacker’s shot board and the defender’s incoming board (ShotBoard bitmasks from game/bitboard.py). 
+Ships are looked up through a Fleet index (game/fleet.py), so finding the hit ship, detecting a sink, 
+and counting ships still afloat are all constant-time instead of scans over every ship. 
+fire_shot() can also keep both players' PlayerStats (game/stats.py) current, so scoreboards never rescan boards. 
+The ships_remaining() function reports how many ships are still afloat and is used to determine when the game is over.
 '''
 
-from typing import List, Tuple, Set
+from typing import List, Optional, Set
 
-# Shot state constants
-UNKNOWN = 0   # cell has not been shot yet
-MISS = 1      # shot missed
-HIT = 2       # shot hit a ship
-
-# Coordinate type (row, column)
-Coord = Tuple[int, int]
+# Shot state constants + coordinate type live with the board storage
+from game.bitboard import UNKNOWN, MISS, HIT, Coord, ShotBoard
+from game.fleet import Fleet
+from game.stats import PlayerStats
 
 
 def fire_shot(
-    shots_board: List[List[int]],         # attacker's shot tracking board
-    incoming_board: List[List[int]],      # defender's incoming shot board
-    defender_ships: List[List[Coord]],    # defender ships as coordinate lists
+    shots_board: ShotBoard,               # attacker's shot tracking board
+    incoming_board: ShotBoard,            # defender's incoming shot board
+    defender_ships: Fleet,                # defender ships, indexed by cell
     defender_hits: Set[Coord],            # set of hit coordinates
     row: int,
     col: int,
+    attacker_stats: Optional[PlayerStats] = None,  # running scoreboard of the shooter (optional)
+    defender_stats: Optional[PlayerStats] = None,  # running scoreboard of the target (optional)
 ) -> str:
     """
     Handle a single shot fired at (row, col).
+    When stats are passed they are updated in place (constant time per shot).
 
     Returns one of:
     - "already" → this cell was already shot
@@ -42,65 +44,56 @@ def fire_shot(
     """
 
     # Prevent firing at the same cell twice
-    if shots_board[row][col] != UNKNOWN:
+    if shots_board.is_shot(row, col):
         return "already"
 
     target = (row, col)
 
-    # Check if the shot hits any ship
-    ship_index = None
-    for i, ship in enumerate(defender_ships):
-        if target in ship:
-            ship_index = i
-            break
+    # Look up which ship (if any) covers this cell
+    ship_id = defender_ships.ship_at(target)
 
     # No ship found → MISS
-    if ship_index is None:
-        shots_board[row][col] = MISS
-        incoming_board[row][col] = MISS
+    if ship_id is None:
+        shots_board.put(row, col, MISS)
+        incoming_board.put(row, col, MISS)
+        if attacker_stats is not None:
+            attacker_stats.record_shot(hit=False, sunk=False)
         return "miss"
 
     # Ship was hit
-    shots_board[row][col] = HIT
-    incoming_board[row][col] = HIT
+    shots_board.put(row, col, HIT)
+    incoming_board.put(row, col, HIT)
     defender_hits.add(target)
 
-    # Check if the entire ship is now hit
-    ship_coords = defender_ships[ship_index]
-    if all(coord in defender_hits for coord in ship_coords):
-        return "sink"
+    # Count the hit against that ship; reaching zero means it sank
+    sunk = defender_ships.register_hit(ship_id)
+
+    if attacker_stats is not None:
+        attacker_stats.record_shot(hit=True, sunk=sunk)
+    if defender_stats is not None:
+        defender_stats.record_hit_taken(ship_id, sunk)
 
-    # Otherwise, it's just a hit
-    return "hit"
+    # "sink" if that hit finished the ship, otherwise it's just a hit
+    return "sink" if sunk else "hit"
 
 
-def ships_remaining(defender_ships: List[List[Coord]], defender_hits: Set[Coord]) -> int:
+def ships_remaining(defender_ships: Fleet, defender_hits: Set[Coord]) -> int:
     """
     Count how many ships are still afloat.
     A ship is considered sunk only if all its coordinates are hit.
+    The fleet keeps this count live, so no ship scan is needed.
     """
-    remaining = 0
-
-    for ship in defender_ships:
-        # If any part of the ship is not hit, it is still alive
-        if not all(coord in defender_hits for coord in ship):
-            remaining += 1
+    return defender_ships.afloat
 
-    return remaining
-
-def ship_hit_counters(ships_list, hits_set):
+def ship_hit_counters(ships_list: Fleet, hits_set: Set[Coord]) -> List[str]:
     """
     Returns a list like ["2/3", "0/4", ...] in the same order as ships_list.
     Each entry is: hits_on_that_ship / ship_length
     """
-    counters = []
-    for ship in ships_list:
-        hit_count = sum(1 for cell in ship if cell in hits_set)
-        counters.append(f"{hit_count}/{len(ship)}")
-    return counters
-
-def ship_hit_counters_sorted(ships_list, hits_set):
-    ships_sorted = sorted(ships_list, key=len)
-    return ship_hit_counters(ships_sorted, hits_set)
+    return [f"{hits}/{length}" for hits, length in ships_list.hit_counts()]
+
+def ship_hit_counters_sorted(ships_list: Fleet, hits_set: Set[Coord]) -> List[str]:
+    counts = sorted(ships_list.hit_counts(), key=lambda hc: hc[1])  # Shortest ship first
+    return [f"{hits}/{length}" for hits, length in counts]
 
 
@@ -0,0 +1,248 @@
+# game/server.py
+# Battleship Project - Asyncio multiplayer game server
+# Created: 2026-10-17
+
+'''
+This file hosts many independent online games in one process with asyncio.
+Each connection is one coroutine reading protocol lines (game/protocol.py); players asking for the same grid size
+and ship count are paired in arrival order. Each pair's game lives in a memory-lean game.session.Session (bitmask
+boards, ships as start/length/orientation) whose shots resolve exactly like game.rules.fire_shot.
+A move is handled entirely inside the reading coroutine (parse, Session.fire, two buffered writes), with no locks,
+threads or per-move tasks, so thousands of concurrent sessions cost little more than their sockets.
+Run from the project root, for example:
+
+    python -m game.server --port 8765
+'''
+
+import argparse
+import asyncio
+from typing import Dict, Optional, Tuple
+
+from game.board import MAX_GRID_SIZE, MIN_GRID_SIZE
+from game.protocol import DEFAULT_PORT, MAX_LINE, MAX_SHIPS, MIN_SHIPS, decode, encode, parse_fleet
+from game.session import Session
+from game.ships import build_ship_set
+
+
+class _Seat:
+    """One connected player (and, once matched, their side of the game)."""
+
+    __slots__ = ("writer", "number", "match", "key", "placed")
+
+    def __init__(self, writer: asyncio.StreamWriter):
+        self.writer = writer
+        self.number = 0                        # 1 or 2 once matched
+        self.match: Optional["Match"] = None
+        self.key: Optional[Tuple[int, int]] = None  # (size, ships) while waiting for an opponent
+        self.placed = False                    # fleet accepted (held by the match's Session, or `key` pending)
+
+    def send(self, *words) -> None:
+        self.writer.write(encode(*words))
+
+
+class Match:
+    """Two seats playing one game."""
+
+    __slots__ = ("session", "lengths", "seats", "started", "over")
+
+    def __init__(self, num_ships: int, first: _Seat, second: _Seat, session: Session):
+        self.session = session   # Both fleets and all shots; a fleet placed while waiting is already in it
+        self.lengths = [ship.length for ship in build_ship_set(num_ships)]
+        self.seats = (first, second)
+        self.started = False     # False while placing, True once both fleets are in
+        self.over = False
+
+        for number, seat in enumerate(self.seats, start=1):
+            seat.number = number
+            seat.match = self
+            seat.key = None
+
+    def opponent(self, seat: _Seat) -> _Seat:
+        return self.seats[2 - seat.number]
+
+    def broadcast(self, data: bytes) -> None:
+        """Send already-encoded line(s) to both players (one write, so one send call, per player)."""
+        for seat in self.seats:
+            seat.writer.write(data)
+
+
+class GameServer:
+    """
+    The server: accepts connections, pairs players and runs their matches.
+    Use start() inside a running event loop (or run() from the CLI); port=0 picks a free port.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = DEFAULT_PORT):
+        self.host = host
+        self.port = port
+        self._server: Optional[asyncio.AbstractServer] = None
+        # (size, ships) -> player waiting for an opponent, with the Session their match will use
+        self._waiting: Dict[Tuple[int, int], Tuple[_Seat, Session]] = {}
+
+        # Counters (handy for load tests and monitoring)
+        self.connections = 0
+        self.matches = 0        # matches in progress
+        self.peak_matches = 0
+        self.moves = 0          # shots resolved since start
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(self._serve, self.host, self.port, limit=MAX_LINE, backlog=4096)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    async def run(self) -> None:
+        await self.start()
+        print(f"Battleship server listening on {self.host}:{self.port}")
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        seat = _Seat(writer)
+        self.connections += 1
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break  # Client closed the connection
+                words = decode(line)
+                if words and words[0] == "QUIT":
+                    break
+                if words:
+                    self._handle(seat, words)
+                if writer.transport.get_write_buffer_size() > 65536:
+                    await writer.drain()  # Slow reader: stop producing for it until its buffer empties
+        except (ConnectionError, asyncio.LimitOverrunError, ValueError):
+            pass  # Dropped connection or an over-long line: treat as leaving
+        finally:
+            self.connections -= 1
+            self._leave(seat)
+            writer.close()
+
+    # --- commands ---
+
+    def _handle(self, seat: _Seat, words) -> None:
+        command, args = words[0], words[1:]
+        try:
+            if command == "HELLO":
+                self._hello(seat, args)
+            elif command == "PLACE":
+                self._place(seat, args)
+            elif command == "FIRE":
+                self._fire(seat, args)
+            else:
+                seat.send("ERROR", f"unknown command {command}")
+        except IndexError:
+            seat.send("ERROR", f"missing arguments for {command}")
+        except ValueError as e:  # Bad numbers, illegal fleet, out of turn, ...
+            seat.send("ERROR", str(e))
+
+    def _hello(self, seat: _Seat, args) -> None:
+        if seat.match is not None or seat.key is not None:
+            raise ValueError("already in a game")
+        size, ships = int(args[0]), int(args[1])
+        if not MIN_GRID_SIZE <= size <= MAX_GRID_SIZE:
+            raise ValueError(f"size must be {MIN_GRID_SIZE}..{MAX_GRID_SIZE}")
+        if not MIN_SHIPS <= ships <= min(MAX_SHIPS, size):
+            raise ValueError(f"ships must be {MIN_SHIPS}..{MAX_SHIPS}")
+
+        key = (size, ships)
+        waiting = self._waiting.pop(key, None)
+        if waiting is None:
+            seat.key = key
+            self._waiting[key] = (seat, Session(size))
+            seat.send("WAIT")
+            return
+
+        other, session = waiting
+        match = Match(ships, other, seat, session)  # First to arrive is player 1
+        self.matches += 1
+        self.peak_matches = max(self.peak_matches, self.matches)
+        for s in match.seats:
+            s.send("START", s.number, size, ships)
+        self._maybe_begin(match)  # The waiting player may already have placed
+
+    def _place(self, seat: _Seat, args) -> None:
+        # Fleets may be sent while still waiting for an opponent, or once matched (before the first shot)
+        match = seat.match
+        if seat.placed or (match is None and seat.key is None) or (match is not None and match.started):
+            raise ValueError("not placing now")
+        if match is not None:
+            session, number, lengths = match.session, seat.number, match.lengths
+        else:  # The waiting player becomes player 1 of the session they are waiting with
+            session, number = self._waiting[seat.key][1], 1
+            lengths = [ship.length for ship in build_ship_set(seat.key[1])]
+        session.place(number, parse_fleet(args, session.size, lengths))
+        seat.placed = True
+        seat.send("READY")
+        if match is not None:
+            self._maybe_begin(match)
+
+    def _maybe_begin(self, match: Match) -> None:
+        if all(s.placed for s in match.seats):
+            match.started = True
+            match.broadcast(encode("TURN", 1))
+
+    def _fire(self, seat: _Seat, args) -> None:
+        match = seat.match
+        if match is None or match.over or not match.started or match.session.turn != seat.number:
+            raise ValueError("not your turn")
+        session = match.session
+        row, col = int(args[0]), int(args[1])
+        if not (0 <= row < session.size and 0 <= col < session.size):
+            raise ValueError("shot is off the board")
+
+        result = session.fire(seat.number, row, col)  # Also passes the turn or sets the winner
+        if result == "already":
+            raise ValueError("already shot there")
+        self.moves += 1
+        shot = encode("SHOT", seat.number, row, col, result)
+
+        # The shot and what follows it go out together: one write per player per move
+        if session.winner:
+            match.over = True
+            match.broadcast(shot + encode("OVER", session.winner))
+            self._end(match)
+        else:
+            match.broadcast(shot + encode("TURN", session.turn))
+
+    # --- leaving ---
+
+    def _leave(self, seat: _Seat) -> None:
+        if seat.key is not None:  # Still waiting for an opponent
+            waiting = self._waiting.get(seat.key)
+            if waiting is not None and waiting[0] is seat:
+                del self._waiting[seat.key]
+            seat.key = None
+        match = seat.match
+        if match is not None and not match.over:
+            match.over = True
+            try:
+                match.opponent(seat).send("LEFT")
+            except RuntimeError:  # Opponent's transport already closed
+                pass
+            self._end(match)
+
+    def _end(self, match: Match) -> None:
+        self.matches -= 1
+        for seat in match.seats:
+            seat.match = None  # Drop the game (the Session goes with the Match); seats may start anew with HELLO
+            seat.placed = False
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Host online Battleship games.")
+    parser.add_argument("--host", default="127.0.0.1", help="interface to listen on (0.0.0.0 for all)")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="TCP port")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(GameServer(args.host, args.port).run())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,334 @@
+# game/session.py
+# Battleship Project - Memory-lean game session
+# Created: 2026-10-17
+
+'''
+This file defines Session, a compact stand-alone representation of one game for hosting or simulating many games
+in a single process. A GameState (app/app_models.py) keeps ship boards, four shot boards, two Fleet indexes,
+two hit sets and two PlayerStats objects alive per game; a Session keeps only what cannot be derived:
+
+    ships      per player, a tuple of (start cell, length, vertical) tuples, start = row * size + col
+    occupancy  per player, one bitmask of the cells covered by ships (turns a miss into one AND)
+    shots      per player, two bitmasks (hits, misses) of what that player fired
+    remaining  one bytearray of hits still needed to sink each ship (Player 1's ships first)
+
+Incoming boards are the opponent's shot masks, hit sets are those masks ANDed with the occupancy, and the
+scoreboard numbers are popcounts, so all of them are computed when read. The read API mirrors GameState
+(grid_size, current_turn, pX_board, pX_shots, pX_incoming, pX_ships, pX_hits, pX_stats); those properties build
+fresh board / Fleet / PlayerStats objects each time, for screens, snapshots and tests rather than hot loops.
+Shots go through Session.fire(), which gives the same results as game.rules.fire_shot.
+Bitmasks grow with the board area, so above DENSE_MAX_SIZE a session costs more than the sparse boards of
+game/sparse.py would (up to ~125 KB per mask on a 1000x1000 grid); it stays correct at every supported size.
+Run `python -m game.session` to measure bytes per game against GameState.
+'''
+
+import argparse
+import random
+import tracemalloc
+from typing import Iterable, List, Optional, Sequence, Set, Tuple
+
+from game.bitboard import BitBoard, Coord, ShotBoard
+from game.board import GRID_SIZE, MAX_GRID_SIZE, MIN_GRID_SIZE
+from game.fleet import Fleet
+from game.fleetgen import ship_cells
+from game.record import ship_spec
+from game.stats import PlayerStats
+
+# One ship in a session: (start cell, length, vertical)
+ShipTuple = Tuple[int, int, int]
+
+
+class Session:
+    """
+    One game: both fleets, both players' shots, whose turn it is and who won.
+    Players are numbered 1 and 2 as everywhere else; Player 1 fires first.
+    """
+
+    __slots__ = (
+        "size", "turn", "winner",
+        "_ships1", "_ships2",          # tuples of ShipTuple
+        "_occupied1", "_occupied2",    # ship cell masks
+        "_hits1", "_misses1",          # what Player 1 fired at Player 2
+        "_hits2", "_misses2",          # what Player 2 fired at Player 1
+        "_remaining",                  # bytearray: hits left per ship, Player 1's ships then Player 2's
+        "_afloat1", "_afloat2",
+    )
+
+    def __init__(self, size: int = GRID_SIZE):
+        if not MIN_GRID_SIZE <= size <= MAX_GRID_SIZE:
+            raise ValueError(f"grid size must be between {MIN_GRID_SIZE} and {MAX_GRID_SIZE}, got {size}")
+        self.size = size
+        self.turn = 1     # Player to fire next
+        self.winner = 0   # 0 while the game is running
+        self._ships1: Tuple[ShipTuple, ...] = ()
+        self._ships2: Tuple[ShipTuple, ...] = ()
+        self._occupied1 = self._occupied2 = 0
+        self._hits1 = self._misses1 = self._hits2 = self._misses2 = 0
+        self._remaining = bytearray()
+        self._afloat1 = self._afloat2 = 0
+
+    # --- placement ---
+
+    def place(self, player: int, ships: Iterable[Sequence[Coord]]) -> None:
+        """
+        Set a player's whole fleet from coordinate lists (as produced by the placement screen or fleetgen).
+        Raises ValueError for ships that leave the board or overlap; fleets are fixed once shots are fired.
+        """
+        if self._hits1 | self._misses1 | self._hits2 | self._misses2:
+            raise ValueError("fleets cannot change once the battle has started")
+        size = self.size
+        packed: List[ShipTuple] = []
+        occupied = 0
+        for cells in ships:
+            row, col, length, vertical = ship_spec(cells)
+            last_row, last_col = (row + length - 1, col) if vertical else (row, col + length - 1)
+            if row < 0 or col < 0 or last_row >= size or last_col >= size:
+                raise ValueError(f"ship at {row} {col} is off the board")
+            mask = self._ship_mask(row * size + col, length, vertical)
+            if occupied & mask:
+                raise ValueError(f"ship at {row} {col} overlaps another ship")
+            occupied |= mask
+            packed.append((row * size + col, length, vertical))
+
+        mine = tuple(packed)
+        if player == 1:
+            self._ships1, self._occupied1, self._afloat1 = mine, occupied, len(mine)
+        else:
+            self._ships2, self._occupied2, self._afloat2 = mine, occupied, len(mine)
+        self._remaining = bytearray(
+            length for _start, length, _vertical in (self._ships1 + self._ships2)
+        )
+
+    def _ship_mask(self, start: int, length: int, vertical: int) -> int:
+        step = self.size if vertical else 1
+        mask = 0
+        for i in range(length):
+            mask |= 1 << (start + i * step)
+        return mask
+
+    # --- battle ---
+
+    def fire(self, player: int, row: int, col: int) -> str:
+        """
+        Player `player` fires at (row, col) on the opponent's board.
+        Returns "already", "miss", "hit" or "sink", exactly like game.rules.fire_shot.
+        A valid shot passes the turn to the opponent unless it won the game (self.winner is then set).
+        """
+        size = self.size
+        bit = 1 << (row * size + col)
+        if player == 1:
+            if (self._hits1 | self._misses1) & bit:
+                return "already"
+            if not self._occupied2 & bit:
+                self._misses1 |= bit
+                self.turn = 2
+                return "miss"
+            self._hits1 |= bit
+            ships, base = self._ships2, len(self._ships1)
+        else:
+            if (self._hits2 | self._misses2) & bit:
+                return "already"
+            if not self._occupied1 & bit:
+                self._misses2 |= bit
+                self.turn = 1
+                return "miss"
+            self._hits2 |= bit
+            ships, base = self._ships1, 0
+
+        # A hit: find the ship from its (start, length, orientation), at most a handful of comparisons
+        for i, (start, length, vertical) in enumerate(ships):
+            r0, c0 = divmod(start, size)
+            if (col == c0 and r0 <= row < r0 + length) if vertical else (row == r0 and c0 <= col < c0 + length):
+                break
+        self._remaining[base + i] -= 1
+        if self._remaining[base + i]:
+            self.turn = 3 - player
+            return "hit"
+
+        if player == 1:
+            self._afloat2 -= 1
+            left = self._afloat2
+        else:
+            self._afloat1 -= 1
+            left = self._afloat1
+        if left == 0:
+            self.winner = player
+        else:
+            self.turn = 3 - player
+        return "sink"
+
+    def ships_remaining(self, player: int) -> int:
+        """Ships of `player` still afloat (constant time)."""
+        return self._afloat1 if player == 1 else self._afloat2
+
+    def afloat_lengths(self, player: int) -> Tuple[int, ...]:
+        """Lengths of `player`'s ships not yet sunk (what engine shot strategies are given)."""
+        ships, base = self._fleet(player)
+        return tuple(length for i, (_s, length, _v) in enumerate(ships) if self._remaining[base + i])
+
+    def ship_hit_counters(self, player: int) -> List[str]:
+        """["hits/length", ...] for `player`'s ships in placement order, like rules.ship_hit_counters()."""
+        ships, base = self._fleet(player)
+        return [f"{length - self._remaining[base + i]}/{length}" for i, (_s, length, _v) in enumerate(ships)]
+
+    def _fleet(self, player: int) -> Tuple[Tuple[ShipTuple, ...], int]:
+        return (self._ships1, 0) if player == 1 else (self._ships2, len(self._ships1))
+
+    # --- GameState-compatible read API (fresh objects on every read) ---
+
+    @property
+    def grid_size(self) -> int:
+        return self.size
+
+    @property
+    def current_turn(self) -> int:
+        return self.turn
+
+    @property
+    def num_ships(self) -> Optional[int]:
+        return len(self._ships1) or None
+
+    @property
+    def p1_board(self) -> BitBoard:
+        return BitBoard(self.size, self._occupied1)
+
+    @property
+    def p2_board(self) -> BitBoard:
+        return BitBoard(self.size, self._occupied2)
+
+    @property
+    def p1_shots(self) -> ShotBoard:
+        return ShotBoard(self.size, self._hits1, self._misses1)
+
+    @property
+    def p2_shots(self) -> ShotBoard:
+        return ShotBoard(self.size, self._hits2, self._misses2)
+
+    # What the opponent fired at a player is exactly the opponent's shot board
+    p1_incoming = p2_shots
+    p2_incoming = p1_shots
+
+    @property
+    def p1_ships(self) -> Fleet:
+        return self._build_fleet(1)
+
+    @property
+    def p2_ships(self) -> Fleet:
+        return self._build_fleet(2)
+
+    @property
+    def p1_hits(self) -> Set[Coord]:
+        return set(BitBoard(self.size, self._hits2).cells())
+
+    @property
+    def p2_hits(self) -> Set[Coord]:
+        return set(BitBoard(self.size, self._hits1).cells())
+
+    @property
+    def p1_stats(self) -> PlayerStats:
+        return PlayerStats.for_fleet(self._build_fleet(1), self.p1_shots, self._build_fleet(2))
+
+    @property
+    def p2_stats(self) -> PlayerStats:
+        return PlayerStats.for_fleet(self._build_fleet(2), self.p2_shots, self._build_fleet(1))
+
+    def _build_fleet(self, player: int) -> Fleet:
+        """A Fleet of `player`'s ships with every hit taken so far registered (sunk ships included)."""
+        ships, base = self._fleet(player)
+        fleet = Fleet()
+        for i, (start, length, vertical) in enumerate(ships):
+            ship_id = fleet.add(ship_cells(*divmod(start, self.size), length, vertical))
+            for _ in range(length - self._remaining[base + i]):
+                fleet.register_hit(ship_id)
+        return fleet
+
+    def __repr__(self) -> str:
+        return (f"Session(size={self.size}, turn={self.turn}, winner={self.winner}, "
+                f"afloat={self._afloat1}/{self._afloat2})")
+
+
+# --- measurement ---
+
+def _bytes_per_game(build, games: int) -> float:
+    """Average bytes allocated per game object kept alive (tracemalloc, so every nested object counts)."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = [build(i) for i in range(games)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    return (after - before) / games
+
+
+def measure(games: int = 2000, size: int = GRID_SIZE, num_ships: int = 5, shots: int = 40,
+            seed: int = 0) -> Tuple[float, float]:
+    """
+    Bytes per game for a Session and for a GameState, both mid-battle with the same fleets and `shots`
+    shots per player. GameState lives in the app package and is imported here only for the comparison.
+    """
+    from app.app_models import GameState  # Comparison only: game/ does not otherwise depend on app/
+    from game.fleetgen import random_fleet
+    from game.rules import fire_shot
+    from game.ships import build_ship_set
+
+    lengths = [ship.length for ship in build_ship_set(num_ships)]
+
+    def setup(i: int):
+        rng = random.Random(seed * 1_000_003 + i)
+        fleets = (random_fleet(lengths, size, rng), random_fleet(lengths, size, rng))
+        cells = [divmod(c, size) for c in range(size * size)]
+        volleys = (rng.sample(cells, shots), rng.sample(cells, shots))
+        return fleets, volleys
+
+    plans = [setup(i) for i in range(games)]  # Built outside the measured region
+
+    def build_session(i: int) -> Session:
+        fleets, volleys = plans[i]
+        session = Session(size)
+        session.place(1, fleets[0])
+        session.place(2, fleets[1])
+        for (r1, c1), (r2, c2) in zip(*volleys):
+            session.fire(1, r1, c1)
+            session.fire(2, r2, c2)
+        return session
+
+    def build_state(i: int) -> GameState:
+        fleets, volleys = plans[i]
+        state = GameState(grid_size=size)
+        state.reset_for_new_game()
+        state.num_ships = num_ships
+        for player, ships in ((1, fleets[0]), (2, fleets[1])):
+            board = state.p1_board if player == 1 else state.p2_board
+            fleet = state.p1_ships if player == 1 else state.p2_ships
+            for ship in ships:
+                for r, c in ship:
+                    board.put(r, c, 1)
+                fleet.append(list(ship))
+        state.p1_stats = PlayerStats.for_fleet(state.p1_ships)
+        state.p2_stats = PlayerStats.for_fleet(state.p2_ships)
+        for (r1, c1), (r2, c2) in zip(*volleys):
+            fire_shot(state.p1_shots, state.p2_incoming, state.p2_ships, state.p2_hits, r1, c1,
+                      state.p1_stats, state.p2_stats)
+            fire_shot(state.p2_shots, state.p1_incoming, state.p1_ships, state.p1_hits, r2, c2,
+                      state.p2_stats, state.p1_stats)
+        return state
+
+    return _bytes_per_game(build_session, games), _bytes_per_game(build_state, games)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure memory per game: Session vs GameState.")
+    parser.add_argument("--games", type=int, default=2000, help="games kept alive while measuring")
+    parser.add_argument("--size", type=int, default=GRID_SIZE, help="grid size")
+    parser.add_argument("--ships", type=int, default=5, help="number of ships (1..N lengths)")
+    parser.add_argument("--shots", type=int, default=40, help="shots fired by each player before measuring")
+    args = parser.parse_args(argv)
+
+    session, state = measure(args.games, args.size, args.ships, min(args.shots, args.size * args.size))
+    print(f"{args.size}x{args.size}, {args.ships} ships, {args.shots} shots each, {args.games} games:")
+    print(f"  Session   {session:8,.0f} bytes per game")
+    print(f"  GameState {state:8,.0f} bytes per game ({state / session:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,8 @@
 This file defines a simple Ship dataclass and a helper function for building a ship set based on the chosen difficulty. 
 Given a number like 3, it produces ships of length 1, 2, and 3, which directly matches your game design. 
 The ships here are configuration objects only They don’t track position or hits themselves. 
+FleetProgress follows placement against a required fleet (any list of lengths, duplicates allowed),
+so "which ship is next?" and "is the fleet complete?" are answered without rescanning the placed ships.
 This keeps ship sizing logic separate from board placement and combat logic.
 '''
 
@@ -9,8 +11,9 @@ This keeps ship sizing logic separate from board placement and combat logic.
 # Battleship Project - ship configuration helpers
 # Created: 2026-02-06
 
+import heapq
 from dataclasses import dataclass
-from typing import List
+from typing import Dict, Iterable, List, Optional
 
 
 @dataclass
@@ -30,4 +33,92 @@ def build_ship_set(num_ships: int) -> List[Ship]:
     3 -> [1,2,3]
     ...
     """
-    return [Ship(length=i) for i in range(1, num_ships + 1)]
\ No newline at end of file
+    return [Ship(length=i) for i in range(1, num_ships + 1)]
+
+
+class FleetProgress:
+    """
+    Required vs. placed ships for one player, updated one ship at a time.
+    Ship types are the distinct lengths of the required list, in the order they first appear;
+    the next ship to place is the earliest type still missing (so a 1..N fleet is placed shortest first).
+    next_length(), complete() and remaining are O(1); place() and remove() are O(log types).
+    """
+
+    __slots__ = ("lengths", "_types", "_order", "_required", "_missing", "_queue", "_queued", "_short", "_extra")
+
+    def __init__(self, lengths: Iterable[int], placed: Iterable[int] = ()):
+        self.lengths = tuple(lengths)                         # the required fleet, as given
+        self._types: List[int] = list(dict.fromkeys(self.lengths))  # distinct lengths, first-appearance order
+        self._order = {length: i for i, length in enumerate(self._types)}
+        self._required: Dict[int, int] = dict.fromkeys(self._types, 0)
+        for length in self.lengths:
+            self._required[length] += 1
+        self._missing = dict(self._required)    # length -> ships still needed (negative: more placed than required)
+        self._queue = list(range(len(self._types)))  # min-heap of type positions that may still be missing
+        self._queued = set(self._queue)
+        self._short = len(self.lengths)         # required ships not placed yet
+        self._extra = 0                         # placed ships the fleet does not call for
+
+        for length in placed:  # e.g. (len(cells) for cells in fleet) when resuming a placement
+            self.place(length)
+
+    @classmethod
+    def for_ship_count(cls, num_ships: int, placed: Iterable[int] = ()) -> "FleetProgress":
+        """Progress towards the welcome-screen fleet of ships 1..num_ships."""
+        return cls((ship.length for ship in build_ship_set(num_ships)), placed)
+
+    def place(self, length: int) -> None:
+        """Record one placed ship of this length."""
+        left = self._missing.get(length, 0)
+        if left > 0:
+            self._short -= 1
+        else:
+            self._extra += 1
+        self._missing[length] = left - 1
+        if left == 1:
+            self._drop_placed()
+
+    def remove(self, length: int) -> None:
+        """Record that a placed ship of this length was taken off the board."""
+        left = self._missing.get(length, 0)
+        if left >= self._required.get(length, 0):
+            raise ValueError(f"no ship of length {length} is placed")
+        if left >= 0:
+            self._short += 1
+            position = self._order[length]
+            if position not in self._queued:
+                self._queued.add(position)
+                heapq.heappush(self._queue, position)
+        else:
+            self._extra -= 1
+        self._missing[length] = left + 1
+
+    def _drop_placed(self) -> None:
+        # Keep the heap top a type that is really missing, so next_length() is a peek
+        while self._queue and self._missing[self._types[self._queue[0]]] <= 0:
+            self._queued.discard(heapq.heappop(self._queue))
+
+    def next_length(self) -> Optional[int]:
+        """Length of the next ship to place, or None when every required ship is on the board."""
+        return self._types[self._queue[0]] if self._queue else None
+
+    @property
+    def placed(self) -> int:
+        """How many ships have been placed (required or not)."""
+        return len(self.lengths) - self._short + self._extra
+
+    @property
+    def remaining(self) -> int:
+        """How many required ships are still to be placed."""
+        return self._short
+
+    def complete(self) -> bool:
+        """True when the placed ships are exactly the required fleet."""
+        return self._short == 0 and self._extra == 0
+
+    def missing(self) -> List[int]:
+        """Lengths still to place (with repeats), in required order."""
+        return [length for length in self._types for _ in range(max(self._missing[length], 0))]
+
+    def __repr__(self) -> str:
+        return f"FleetProgress(required={len(self.lengths)}, remaining={self._short}, next={self.next_length()})"
@@ -0,0 +1,168 @@
+# game/simulate.py
+# Battleship Project - Batch simulation runner
+# Created: 2026-10-17
+
+'''
+This file plays many headless games (see game/engine.py) across a process pool and reports throughput.
+Games are split into chunks; each worker process plays a whole chunk with its own seeded RNG
+and sends back only the aggregate counts, so inter-process traffic stays tiny.
+Fleets for a chunk are drawn in bulk by game.fleetgen.FleetPool, so setup is not paid one fleet at a time.
+With --record PATH every game is also archived as a compact binary record (game/record.py); workers send back
+their chunk already encoded and the parent streams it straight to disk.
+Run from the project root, for example:
+
+    python -m game.simulate --games 100000 --p1 hunt --p2 random --ships 5
+    python -m game.simulate --games 100000 --record games.bsgr
+'''
+
+import argparse
+import os
+import random
+import time
+from dataclasses import dataclass
+from multiprocessing import Pool
+from typing import List, Optional, Tuple
+
+from game.board import GRID_SIZE
+from game.engine import PlacementStrategy, get_shooter, play_game, random_placement, shooter_names
+from game.fleetgen import FleetPool
+from game.record import RecordWriter
+
+
+@dataclass
+class BatchResult:
+    games: int
+    p1_wins: int
+    p2_wins: int
+    total_turns: int
+    seconds: float
+
+    @property
+    def games_per_sec(self) -> float:
+        return self.games / self.seconds if self.seconds > 0 else 0.0
+
+    @property
+    def avg_turns(self) -> float:
+        return self.total_turns / self.games if self.games else 0.0
+
+    def summary(self) -> str:
+        return (
+            f"{self.games} games in {self.seconds:.2f}s ({self.games_per_sec:,.0f} games/sec) | "
+            f"P1 wins: {self.p1_wins} | P2 wins: {self.p2_wins} | "
+            f"Avg shots per game: {self.avg_turns:.1f}"
+        )
+
+
+def _play_chunk(args: Tuple[str, str, int, int, int, int, bool]) -> Tuple[int, int, int, bytes]:
+    """Worker: play `count` games and return (p1_wins, p2_wins, total_turns, encoded records or b"")."""
+    p1_name, p2_name, num_ships, size, count, seed, record = args
+    shooter1 = get_shooter(p1_name)
+    shooter2 = get_shooter(p2_name)
+    rng = random.Random(seed)
+    placer = _placer(seed)
+
+    p1_wins = p2_wins = turns = 0
+    records: List[bytes] = []
+    for _ in range(count):
+        result = play_game(shooter1, shooter2, num_ships, rng, placer, placer, size, record)
+        if result.winner == 1:
+            p1_wins += 1
+        else:
+            p2_wins += 1
+        turns += result.turns
+        if record:
+            records.append(result.record.to_bytes())
+    return p1_wins, p2_wins, turns, b"".join(records)
+
+
+def _placer(seed: int) -> PlacementStrategy:
+    # Fleets are generated in vectorized batches when NumPy is available, one at a time otherwise
+    try:
+        return FleetPool(seed=seed)
+    except ImportError:
+        return random_placement
+
+
+def _chunks(games: int, chunk_size: int) -> List[int]:
+    sizes = [chunk_size] * (games // chunk_size)
+    if games % chunk_size:
+        sizes.append(games % chunk_size)
+    return sizes
+
+
+def _collect(chunks, tasks, writer: Optional[RecordWriter]) -> List[Tuple[int, int, int]]:
+    # Stream each chunk's records to disk as it arrives, keeping only the counts in memory
+    results = []
+    for task, (p1_wins, p2_wins, turns, blob) in zip(tasks, chunks):
+        if writer is not None:
+            writer.write_raw(blob, task[4])
+        results.append((p1_wins, p2_wins, turns))
+    return results
+
+
+def run_batch(
+    games: int,
+    p1: str = "hunt",
+    p2: str = "random",
+    num_ships: int = 5,
+    workers: Optional[int] = None,
+    seed: int = 0,
+    chunk_size: int = 1000,
+    size: int = GRID_SIZE,
+    record_path: Optional[str] = None,
+) -> BatchResult:
+    """
+    Play `games` games between two named strategies (engine.shooter_names()).
+    workers=None uses every CPU; workers=1 runs in-process (handy for profiling).
+    record_path, if given, receives every game as a binary game record, in chunk order.
+    """
+    for name in (p1, p2):
+        if name not in shooter_names():
+            raise ValueError(f"Unknown strategy {name!r}. Choose from: {', '.join(shooter_names())}")
+
+    recording = record_path is not None
+    tasks = [
+        (p1, p2, num_ships, size, count, seed * 1_000_003 + i, recording)  # Distinct, reproducible seed per chunk
+        for i, count in enumerate(_chunks(games, chunk_size))
+    ]
+
+    start = time.perf_counter()
+    writer = RecordWriter(record_path) if recording else None
+    try:
+        if workers == 1:
+            results = _collect(map(_play_chunk, tasks), tasks, writer)
+        else:
+            with Pool(processes=workers or os.cpu_count()) as pool:
+                results = _collect(pool.imap(_play_chunk, tasks, chunksize=1), tasks, writer)
+    finally:
+        if writer is not None:
+            writer.close()
+    elapsed = time.perf_counter() - start
+
+    p1_wins = sum(r[0] for r in results)
+    p2_wins = sum(r[1] for r in results)
+    turns = sum(r[2] for r in results)
+    return BatchResult(games=games, p1_wins=p1_wins, p2_wins=p2_wins,
+                       total_turns=turns, seconds=elapsed)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run headless Battleship games in bulk.")
+    parser.add_argument("--games", type=int, default=10_000, help="number of games to play")
+    parser.add_argument("--p1", default="hunt", choices=sorted(shooter_names()), help="Player 1 strategy")
+    parser.add_argument("--p2", default="random", choices=sorted(shooter_names()), help="Player 2 strategy")
+    parser.add_argument("--ships", type=int, default=5, help="number of ships (1..N lengths)")
+    parser.add_argument("--size", type=int, default=GRID_SIZE, help="grid size (board is size x size)")
+    parser.add_argument("--workers", type=int, default=None, help="processes (default: all CPUs)")
+    parser.add_argument("--seed", type=int, default=0, help="base RNG seed")
+    parser.add_argument("--chunk", type=int, default=1000, help="games per worker task")
+    parser.add_argument("--record", default=None, metavar="PATH", help="archive every game to a binary record file")
+    args = parser.parse_args(argv)
+
+    result = run_batch(args.games, args.p1, args.p2, args.ships, args.workers, args.seed, args.chunk, args.size,
+                       args.record)
+    print(result.summary())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,575 @@
+# game/solver.py
+# Battleship Project - Exact optimal-play solver for small fleets
+# Created: 2026-10-17
+
+'''
+This file computes the targeting policy that minimises the expected number of shots needed to sink a whole fleet,
+by exhaustive search over what the shooter knows. Every legal fleet is assumed equally likely.
+A search state is the set of fleets still consistent with every shot so far and its outcome (miss, hit, or sink of
+a ship of some length, which the scoreboard reveals), plus the hit cells:
+
+    V(state) = 0                                               once every ship cell is hit
+    V(state) = min over open cells c of 1 + sum P(o | c) V(state after outcome o)
+
+Shots that cannot hit are never tried, a cell that every consistent fleet covers is fired at at once (it has to be
+shot eventually and only adds information), and cells that are mirror images of each other in a symmetric
+position are tried once. Branch and bound cuts a move as soon as it cannot beat the best one found: a state is
+worth at least its unhit ship cells plus the misses still expected before the next hit.
+
+Values are memoised in a transposition table keyed by a canonical 64-bit Zobrist hash of (consistent fleets, hits):
+the smallest hash over the board's 8 rotations / reflections, so mirrored positions share one entry. The table
+holds a bounded number of entries and evicts the least recently used ones, so memory stays fixed however big the
+search gets. The search state deliberately tracks the consistent fleets through the shot history rather than
+reading them off the final shot board: when a ship sank tells the shooter more than the board shows.
+
+The state space explodes quickly: a single ship is solved instantly on any board up to 8x8, two ships on boards
+around 4x4, and the grids the game offers (6x6 and up) with 2-3 ships are out of reach. Solved policies are
+written to policies/ and PerfectAI plays them; for any game without a policy it plays like the density AI.
+
+    python -m game.solver --size 5 --ships 1
+    python -m game.solver --size 4 --ships 2 --workers 8
+'''
+
+import argparse
+import os
+import random
+import struct
+import time
+from collections import Counter, OrderedDict
+from itertools import product
+from multiprocessing import Pool
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from game.bitboard import HIT, Coord
+from game.placement import placement_table
+from game.ships import build_ship_set
+
+POLICY_DIR = Path(__file__).resolve().parents[1] / "policies"
+TABLE_SIZE = 1_000_000   # Transposition table entries (roughly 200 bytes each)
+MAX_CELLS = 64           # Solver boards are at most 8x8 (masks stay machine words, and nothing bigger solves)
+
+POLICY_MAGIC = b"BSPL"
+POLICY_VERSION = 1
+_POLICY_HEADER = struct.Struct("<4sBHBdI")  # magic, version, size, ship count, expected shots, entries
+_POLICY_ENTRY = struct.Struct("<QH")        # canonical state key, canonical cell
+
+_MASK64 = (1 << 64) - 1
+_MISS = -1  # Outcome code of a miss; a hit is 0 and a sink is the length of the sunk ship
+_INF = float("inf")
+_EPS = 1e-9  # Values closer than this count as equal (float sums of the same expectation differ in the last bits)
+
+
+def _bits(mask: int):
+    """Cell indices set in a mask, lowest first."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+def _symmetries(size: int) -> List[List[int]]:
+    """The 8 rotations / reflections of a square board as cell permutations (identity first)."""
+    maps = (
+        lambda r, c: (r, c), lambda r, c: (c, size - 1 - r),
+        lambda r, c: (size - 1 - r, size - 1 - c), lambda r, c: (size - 1 - c, r),
+        lambda r, c: (r, size - 1 - c), lambda r, c: (size - 1 - r, c),
+        lambda r, c: (c, r), lambda r, c: (size - 1 - c, size - 1 - r),
+    )
+    perms = []
+    for f in maps:
+        perm = []
+        for cell in range(size * size):
+            r, c = f(*divmod(cell, size))
+            perm.append(r * size + c)
+        perms.append(perm)
+    return perms
+
+
+class TranspositionTable:
+    """
+    Bounded map of state key -> (value, exact), evicting the least recently used entry when full.
+    exact=False marks a lower bound left behind by a cut-off search.
+    """
+
+    def __init__(self, capacity: int = TABLE_SIZE):
+        self.capacity = capacity
+        self._entries: "OrderedDict[int, Tuple[float, bool]]" = OrderedDict()
+        self.hits = self.misses = self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: int) -> Optional[Tuple[float, bool]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)  # Recently used: evicted last
+        return entry
+
+    def put(self, key: int, value: float, exact: bool) -> None:
+        entries = self._entries
+        entries[key] = (value, exact)
+        entries.move_to_end(key)
+        if len(entries) > self.capacity:
+            entries.popitem(last=False)  # Coldest entry
+            self.evictions += 1
+
+
+class Solver:
+    """
+    Exact expected-shots search for one grid size and fleet (a list of ship lengths, duplicates allowed).
+    States are (fleets, hits): a list of indices into self.fleets still consistent with the shots, and the hit mask.
+    """
+
+    def __init__(self, size: int, lengths: Sequence[int], table_size: int = TABLE_SIZE, seed: int = 0):
+        if size * size > MAX_CELLS:
+            raise ValueError(f"the exact solver handles boards up to {MAX_CELLS} cells")
+        self.size = size
+        self.lengths = sorted(lengths, reverse=True)
+        self.table = TranspositionTable(table_size)
+        self.nodes = 0  # States expanded (not answered by the table)
+
+        # Every legal fleet as a tuple of ship masks, one per length
+        options = [[m for m, _r, _c, _o in placement_table(size).legal(length)] for length in self.lengths]
+        self.fleets: List[Tuple[int, ...]] = []
+        for masks in product(*options):
+            used = 0
+            for m in masks:
+                if used & m:
+                    break
+                used |= m
+            else:
+                self.fleets.append(masks)
+        if not self.fleets:
+            raise ValueError("the ships do not fit on the board")
+        self.ship_cells = sum(self.lengths)
+
+        # Zobrist keys: a random word per (ship slot, cell set) and per hit cell, seen through each symmetry
+        self.perms = _symmetries(size)
+        self.inverse = [[0] * (size * size) for _ in self.perms]
+        for t, perm in enumerate(self.perms):
+            for cell, image in enumerate(perm):
+                self.inverse[t][image] = cell
+        rng = random.Random(seed)
+        ship_keys: Dict[Tuple[int, int], int] = {}
+        cell_keys = [rng.getrandbits(64) for _ in range(size * size)]
+        self._fleet_keys: List[List[int]] = [[] for _ in self.perms]  # [symmetry][fleet]
+        self._hit_keys = [[cell_keys[perm[c]] for c in range(size * size)] for perm in self.perms]
+        for masks in self.fleets:
+            for t, perm in enumerate(self.perms):
+                key = 0
+                for slot, m in enumerate(masks):
+                    image = 0
+                    for c in _bits(m):
+                        image |= 1 << perm[c]
+                    word = ship_keys.get((self.lengths[slot], image))
+                    if word is None:  # Ships of equal length share keys, so relabelled fleets hash alike
+                        word = ship_keys[(self.lengths[slot], image)] = rng.getrandbits(64)
+                    key ^= word
+                self._fleet_keys[t].append(key)
+
+    def root(self) -> Tuple[List[int], int]:
+        """The state before any shot: every fleet, no hits."""
+        return list(range(len(self.fleets))), 0
+
+    # --- state helpers ---
+
+    def canonical(self, fleets: Sequence[int], hits: int) -> Tuple[int, int]:
+        """(key, symmetry) with the smallest key over the 8 symmetries; symmetry maps cells into that frame."""
+        best_key, best_t = _MASK64 + 1, 0
+        hit_cells = list(_bits(hits))
+        for t in range(len(self.perms)):
+            keys, cells = self._fleet_keys[t], self._hit_keys[t]
+            key = (sum(map(keys.__getitem__, fleets)) + sum(map(cells.__getitem__, hit_cells))) & _MASK64
+            if key < best_key:
+                best_key, best_t = key, t
+        return best_key, best_t
+
+    def _keys(self, fleets: Sequence[int], hits: int) -> List[int]:
+        hit_cells = list(_bits(hits))
+        return [(sum(map(keys.__getitem__, fleets)) + sum(map(cells.__getitem__, hit_cells))) & _MASK64
+                for keys, cells in zip(self._fleet_keys, self._hit_keys)]
+
+    def outcome(self, fleet: int, hits: int, cell: int) -> int:
+        """What firing at `cell` shows against one fleet: _MISS, 0 for a hit, or the length of the ship it sinks."""
+        bit = 1 << cell
+        for slot, m in enumerate(self.fleets[fleet]):
+            if m & bit:
+                return self.lengths[slot] if not m & ~(hits | bit) else 0
+        return _MISS
+
+    def split(self, fleets: Sequence[int], hits: int, cell: int) -> Dict[int, List[int]]:
+        """Consistent fleets grouped by the outcome a shot at `cell` would show."""
+        groups: Dict[int, List[int]] = {}
+        bit = 1 << cell
+        covered = hits | bit
+        for f in fleets:
+            code = _MISS
+            for slot, m in enumerate(self.fleets[f]):
+                if m & bit:
+                    code = self.lengths[slot] if not m & ~covered else 0
+                    break
+            group = groups.get(code)
+            if group is None:
+                groups[code] = [f]
+            else:
+                group.append(f)
+        return groups
+
+    def _candidates(self, fleets: Sequence[int], hits: int, keys: List[int]) -> Tuple[List[Tuple[int, int]], float]:
+        """
+        (fleets covering the cell, cell) for every open cell that can hit, likeliest first, mirror images once;
+        plus a lower bound on the state's value.
+        """
+        counts = Counter()
+        for f in fleets:
+            union = 0
+            for m in self.fleets[f]:
+                union |= m
+            counts.update(_bits(union & ~hits))
+        n = len(fleets)
+        bound = self._lower_bound(sorted(counts.values(), reverse=True), n, hits)
+        for cell, count in counts.items():
+            if count == n:  # Certain hit: fire there now
+                return [(count, cell)], bound
+
+        stabiliser = [self.perms[t] for t in range(1, len(keys)) if keys[t] == keys[0]]
+        cells = [(count, cell) for cell, count in counts.items()
+                 if all(perm[cell] >= cell for perm in stabiliser)]  # Keep one cell per mirror-image class
+        cells.sort(reverse=True)
+        return cells, bound
+
+    def _lower_bound(self, counts: List[int], n: int, hits: int) -> float:
+        # Every unhit ship cell costs a shot, plus the misses expected before the next hit:
+        # after j shots the chance of still having no hit is at least 1 - (sum of the j best hit chances)
+        bound = self.ship_cells - bin(hits).count("1")
+        reached = 0.0
+        for count in counts:  # Every open cell, not just one per mirror-image class
+            reached += count / n
+            if reached >= 1:
+                break
+            bound += 1 - reached
+        return bound
+
+    # --- search ---
+
+    def value(self, fleets: Sequence[int], hits: int, cutoff: float = _INF) -> float:
+        """
+        Expected shots to finish from a state under optimal play.
+        Exact when below `cutoff`; otherwise only a lower bound that is >= cutoff (the caller will not use it).
+        """
+        remaining = self.ship_cells - bin(hits).count("1")
+        if remaining == 0:
+            return 0.0
+        keys = self._keys(fleets, hits)
+        key = min(keys)
+        entry = self.table.get(key)
+        if entry is not None and (entry[1] or entry[0] >= cutoff):
+            return entry[0]
+
+        self.nodes += 1
+        candidates, bound = self._candidates(fleets, hits, keys)
+        if entry is not None:
+            bound = max(bound, entry[0])
+        best = _INF
+        for _count, cell in candidates:
+            limit = min(best, cutoff)
+            if bound >= limit - _EPS:  # No move can beat the best so far (or the caller's cutoff)
+                break
+            expected = self._move_value(fleets, hits, cell, limit)
+            if expected < best:
+                best = expected
+
+        if best < cutoff:
+            self.table.put(key, best, True)
+            return best
+        bound = max(bound, cutoff)
+        self.table.put(key, bound, False)
+        return bound
+
+    def _move_value(self, fleets: Sequence[int], hits: int, cell: int, limit: float = _INF) -> float:
+        """1 + expected value after firing at `cell`; anything >= limit means "no better than limit"."""
+        n = len(fleets)
+        remaining = self.ship_cells - bin(hits).count("1")
+        children = []
+        for code, group in self.split(fleets, hits, cell).items():
+            child_hits = hits if code == _MISS else hits | (1 << cell)
+            floor = remaining if code == _MISS else remaining - 1  # Unhit ship cells left: a lower bound
+            children.append((len(group), group, child_hits, floor))
+        children.sort(key=lambda child: -child[0])  # Largest outcome first: it decides most of the value
+
+        budget = (limit - 1) * n  # The weighted child values must stay below this to beat `limit`
+        rest = sum(weight * floor for weight, _g, _h, floor in children)
+        total = 0.0
+        for weight, group, child_hits, floor in children:
+            rest -= weight * floor
+            room = (budget - total - rest) / weight
+            v = self.value(group, child_hits, room)
+            total += weight * v
+            if v >= room:
+                return max(limit, 1 + total / n)
+        return 1 + total / n
+
+    def best_move(self, fleets: Sequence[int], hits: int) -> Tuple[int, float]:
+        """(cell, expected shots) of an optimal shot from a state that is not finished."""
+        keys = self._keys(fleets, hits)
+        best_cell, best = -1, _INF
+        for _count, cell in self._candidates(fleets, hits, keys)[0]:
+            expected = self._move_value(fleets, hits, cell, best)
+            if expected < best:
+                best_cell, best = cell, expected
+        return best_cell, best
+
+    def policy(self, fleets: Sequence[int], hits: int, into: Dict[int, int]) -> Dict[int, int]:
+        """Add the optimal shot of every state reachable under optimal play from a state, as canonical key -> cell."""
+        if bin(hits).count("1") == self.ship_cells:
+            return into
+        key, t = self.canonical(fleets, hits)
+        if key in into:
+            return into
+        cell, _value = self.best_move(fleets, hits)
+        into[key] = self.perms[t][cell]  # Stored in the canonical frame
+        for code, group in self.split(fleets, hits, cell).items():
+            self.policy(group, hits if code == _MISS else hits | (1 << cell), into)
+        return into
+
+    def replay(self, moves: Sequence[Tuple[int, int]]) -> Tuple[List[int], int]:
+        """State after a list of (cell, outcome code) shots from the start."""
+        fleets, hits = self.root()
+        for cell, code in moves:
+            fleets = self.split(fleets, hits, cell).get(code, [])
+            if code != _MISS:
+                hits |= 1 << cell
+        return fleets, hits
+
+
+# --- policies on disk ---
+
+class Policy:
+    """A solved game: canonical state key -> canonical cell to fire at, plus the optimal expected shot count."""
+
+    def __init__(self, size: int, lengths: Sequence[int], moves: Dict[int, int], expected: float):
+        self.size = size
+        self.lengths = sorted(lengths, reverse=True)
+        self.moves = moves
+        self.expected = expected
+
+    def save(self, path) -> None:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(_POLICY_HEADER.pack(POLICY_MAGIC, POLICY_VERSION, self.size, len(self.lengths),
+                                        self.expected, len(self.moves)))
+            f.write(bytes(self.lengths))
+            for key in sorted(self.moves):
+                f.write(_POLICY_ENTRY.pack(key, self.moves[key]))
+
+    @classmethod
+    def load(cls, path) -> "Policy":
+        data = Path(path).read_bytes()
+        magic, version, size, ships, expected, count = _POLICY_HEADER.unpack_from(data, 0)
+        if magic != POLICY_MAGIC or version != POLICY_VERSION:
+            raise ValueError(f"{path} is not a version {POLICY_VERSION} policy file")
+        offset = _POLICY_HEADER.size
+        lengths = list(data[offset:offset + ships])
+        offset += ships
+        moves = dict(_POLICY_ENTRY.iter_unpack(data[offset:offset + count * _POLICY_ENTRY.size]))
+        return cls(size, lengths, moves, expected)
+
+
+def policy_path(size: int, lengths: Sequence[int], directory=POLICY_DIR) -> Path:
+    """Where the policy for a grid size and fleet lives, e.g. policies/5x5_3-2-1.bspl."""
+    return Path(directory) / f"{size}x{size}_{'-'.join(map(str, sorted(lengths, reverse=True)))}.bspl"
+
+
+# --- solving on a process pool ---
+
+_worker: Optional[Solver] = None
+
+
+def _init_worker(size: int, lengths: Sequence[int], table_size: int) -> None:
+    global _worker
+    _worker = Solver(size, lengths, table_size)
+
+
+def _root_move_value(cell: int) -> Tuple[int, float, int]:
+    # Worker: exact value of opening at `cell`, plus the states it expanded
+    value = _worker._move_value(*_worker.root(), cell)
+    return cell, value, _worker.nodes
+
+
+def _subtree_policy(moves: Tuple[Tuple[int, int], ...]) -> Dict[int, int]:
+    # Worker: optimal-play policy below the state reached by `moves`
+    return _worker.policy(*_worker.replay(moves), {})
+
+
+def solve(size: int, lengths: Sequence[int], workers: Optional[int] = None,
+          table_size: int = TABLE_SIZE, progress=None) -> Policy:
+    """
+    Solve a game and return its optimal policy.
+    Openings (one per mirror-image class) are valued in parallel, then the policy below the best opening is
+    collected, one worker per outcome of that shot. Each worker keeps its own table of table_size entries,
+    so memory is bounded by workers x table_size. workers=1 runs in-process.
+    """
+    solver = Solver(size, lengths, table_size)
+    fleets, hits = solver.root()
+    openings = [cell for _count, cell in solver._candidates(fleets, hits, solver._keys(fleets, hits))[0]]
+    progress = progress or (lambda message: None)
+    progress(f"{len(solver.fleets):,} fleets, {len(openings)} distinct opening shots")
+
+    if workers == 1:
+        _init_worker(size, lengths, table_size)
+        values = [_root_move_value(cell) for cell in openings]
+        best = min(values, key=lambda v: v[1])
+        progress(f"best opening valued, {_worker.nodes:,} states expanded")
+        moves = _worker.policy(fleets, hits, {})
+    else:
+        with Pool(workers or os.cpu_count(), _init_worker, (size, lengths, table_size)) as pool:
+            values = []
+            for value in pool.imap_unordered(_root_move_value, openings):
+                values.append(value)
+                progress(f"opening {len(values)}/{len(openings)}: cell {value[0]} -> {value[1]:.4f} shots")
+            best = min(values, key=lambda v: (v[1], v[0]))
+            cell = best[0]
+            branches = [((cell, code),) for code in solver.split(fleets, hits, cell)]
+            key, t = solver.canonical(fleets, hits)
+            moves = {key: solver.perms[t][cell]}
+            for part in pool.imap_unordered(_subtree_policy, branches):
+                moves.update(part)
+    return Policy(size, solver.lengths, moves, best[1])
+
+
+# --- playing a policy ---
+
+class _Game:
+    """What PerfectAI tracks about one shot board: the fleet, the consistent fleets and the shot it fired last."""
+
+    __slots__ = ("lengths", "fleets", "hits", "shots", "afloat", "last")
+
+    def __init__(self, lengths: Optional[Tuple[int, ...]], afloat: Counter):
+        self.lengths = lengths        # Whole enemy fleet (None when it cannot be known: play the fallback)
+        self.fleets: Optional[List[int]] = None  # Consistent fleet indices (None until a policy is in use)
+        self.hits = 0
+        self.shots = 0                # Shots on the board when we last looked
+        self.afloat = afloat
+        self.last: Optional[int] = None
+
+
+class PerfectAI:
+    """
+    Callable shot strategy (engine.ShotStrategy) that plays a solved policy when one exists for the game
+    (policies/ by default) and falls back to DensityAI otherwise.
+    Positions missing from the policy (e.g. a resumed game, where the shot order is unknown) are solved on the spot.
+    The whole enemy fleet is read from the afloat lengths on an empty board; pass lengths to pick up a board that
+    already has shots on it (ships sunk there are no longer in afloat), otherwise such a board gets the fallback.
+    """
+
+    def __init__(self, directory=POLICY_DIR, lengths: Optional[Sequence[int]] = None):
+        self.directory = directory
+        self.lengths = None if lengths is None else tuple(sorted(lengths, reverse=True))
+        self._solved: Dict[Tuple[int, Tuple[int, ...]], Optional[Tuple[Solver, Policy]]] = {}
+        self._games: Dict[int, _Game] = {}
+        self._fallback = None
+
+    def __call__(self, shots, afloat: Sequence[int], rng: Optional[random.Random] = None) -> Coord:
+        return self.choose(shots, afloat, rng)
+
+    def choose(self, shots, afloat: Sequence[int], rng: Optional[random.Random] = None) -> Coord:
+        game = self._games.get(id(shots))
+        if game is None or shots.shot_count() == 0:  # First look at this board, or a new game started
+            if len(self._games) > 16:                # Forget boards of finished games
+                self._games.clear()
+            lengths = self.lengths
+            if lengths is None and shots.shot_count() == 0:  # Nothing sunk yet: afloat is the whole fleet
+                lengths = tuple(sorted(afloat, reverse=True))
+            game = self._games[id(shots)] = _Game(lengths, Counter(afloat))
+
+        solved = None if game.lengths is None else self._load(shots.size, game.lengths)
+        if solved is None:
+            if self._fallback is None:
+                from game.ai import DensityAI  # Only needed (with NumPy) for games without a policy
+                self._fallback = DensityAI()
+            return self._fallback(shots, afloat, rng)
+
+        solver, policy = solved
+        self._track(solver, game, shots, Counter(afloat))
+        key, t = solver.canonical(game.fleets, game.hits)
+        cell = policy.moves.get(key)
+        if cell is not None:
+            cell = solver.inverse[t][cell]  # Back from the canonical frame
+        if cell is None or shots.is_shot(*divmod(cell, solver.size)):
+            cell, _value = solver.best_move(game.fleets, game.hits)
+        game.last = cell
+        game.shots = shots.shot_count() + 1
+        return divmod(cell, solver.size)
+
+    def _load(self, size: int, lengths: Tuple[int, ...]) -> Optional[Tuple[Solver, Policy]]:
+        # Policy and solver for a game, looked up once per (size, fleet); None when it has not been solved
+        key = (size, lengths)
+        if key not in self._solved:
+            path = policy_path(size, lengths, self.directory)
+            solved = None
+            if size * size <= MAX_CELLS and path.exists():
+                solved = Solver(size, lengths), Policy.load(path)
+            self._solved[key] = solved
+        return self._solved[key]
+
+    @staticmethod
+    def _track(solver: Solver, game: _Game, shots, afloat: Counter) -> None:
+        # Narrow the consistent fleets by the outcome of our last shot, or rebuild them from the board
+        if game.fleets is None or game.last is None or shots.shot_count() != game.shots:
+            game.fleets = PerfectAI._consistent(solver, shots, afloat)
+            game.hits = shots.hits
+        else:
+            cell = game.last
+            if shots.get(*divmod(cell, solver.size)) == HIT:
+                sunk = game.afloat - afloat
+                code = next(iter(sunk)) if sunk else 0
+            else:
+                code = _MISS
+            game.fleets = [f for f in game.fleets if solver.outcome(f, game.hits, cell) == code]
+            if code != _MISS:
+                game.hits |= 1 << cell
+        game.afloat = afloat
+
+    @staticmethod
+    def _consistent(solver: Solver, shots, afloat: Counter) -> List[int]:
+        # Fleets that agree with the board alone: hits covered, misses clear, exactly the afloat ships not sunk
+        hits, misses = shots.hits, shots.misses
+        fleets = []
+        for f, masks in enumerate(solver.fleets):
+            covered = 0
+            left = Counter()
+            for length, m in zip(solver.lengths, masks):
+                covered |= m
+                if m & ~hits:
+                    left[length] += 1
+            if not (covered & misses or hits & ~covered or left != afloat):
+                fleets.append(f)
+        return fleets or list(range(len(solver.fleets)))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Solve small Battleship games exactly and save the policy.")
+    parser.add_argument("--size", type=int, default=5, help="grid size (board is size x size, at most 8)")
+    parser.add_argument("--ships", type=int, default=1, help="number of ships (1..N lengths)")
+    parser.add_argument("--lengths", type=int, nargs="+", default=None, help="explicit ship lengths instead")
+    parser.add_argument("--workers", type=int, default=None, help="processes (default: all CPUs)")
+    parser.add_argument("--table", type=int, default=TABLE_SIZE, help="transposition table entries per process")
+    parser.add_argument("--out", default=None, help="policy file (default: policies/<size>_<lengths>.bspl)")
+    args = parser.parse_args(argv)
+
+    lengths = args.lengths or [ship.length for ship in build_ship_set(args.ships)]
+    start = time.perf_counter()
+    policy = solve(args.size, lengths, args.workers, args.table, progress=print)
+    path = Path(args.out) if args.out else policy_path(args.size, lengths)
+    policy.save(path)
+    print(f"{args.size}x{args.size}, ships {policy.lengths}: {policy.expected:.4f} expected shots "
+          f"({len(policy.moves):,} policy states, {time.perf_counter() - start:.1f}s) -> {path}")
+
+
+if __name__ == "__main__":
+    main()
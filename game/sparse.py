@@ -0,0 +1,154 @@
+# game/sparse.py
+# Battleship Project - Sparse board storage for large grids
+# Created: 2026-10-17
+
+'''
+This file provides set/dict based boards for very large oceans (up to 1000×1000).
+A bitmask board always costs one bit per cell, so a huge grid pays for its whole area even when only a few
+cells are ever touched. SparseBoard keeps just the set of occupied cells and SparseShotBoard keeps a dict of
+the cells that were shot, so memory grows with ships placed and shots fired instead of with board area.
+Both classes expose the same methods as BitBoard / ShotBoard (including board[row][col] access), so rules,
+engine, AI and UI code work with either; game.board.new_ship_board/new_shot_board pick the right one by size.
+'''
+
+from typing import Dict, Iterator, List, Set
+
+from game.bitboard import _GridView, Coord, UNKNOWN, MISS, HIT
+
+
+class SparseBoard(_GridView):
+    """
+    Ship occupancy board backed by a set of occupied cells.
+    """
+
+    __slots__ = ("size", "occupied")
+
+    def __init__(self, size: int, occupied=()):
+        self.size = size                        # Board is size x size
+        self.occupied: Set[Coord] = set(occupied)  # Cells covered by a ship
+
+    def get(self, row: int, col: int) -> int:
+        return 1 if (row, col) in self.occupied else 0  # 1 = ship, 0 = empty
+
+    def put(self, row: int, col: int, value: int) -> None:
+        if value:
+            self.occupied.add((row, col))
+        else:
+            self.occupied.discard((row, col))
+
+    def test(self, row: int, col: int) -> bool:
+        return (row, col) in self.occupied
+
+    def count(self) -> int:
+        return len(self.occupied)
+
+    def cells(self) -> Iterator[Coord]:
+        return iter(sorted(self.occupied))  # Row-major, like BitBoard.cells()
+
+    def is_free(self, row: int, col: int, length: int, orientation: str) -> bool:
+        cells = self._ship_cells(row, col, length, orientation)
+        return bool(cells) and not any(cell in self.occupied for cell in cells)
+
+    def occupy(self, row: int, col: int, length: int, orientation: str) -> List[Coord]:
+        cells = self._ship_cells(row, col, length, orientation)
+        self.occupied.update(cells)
+        return cells
+
+    def _ship_cells(self, row: int, col: int, length: int, orientation: str) -> List[Coord]:
+        # Same validity rules as the placement table: [] means off the board / invalid
+        size = self.size
+        if orientation not in ("H", "V") or not 0 < length <= size:
+            return []
+        if not (0 <= row < size and 0 <= col < size):
+            return []
+        if orientation == "H":
+            if col + length > size:
+                return []
+            return [(row, col + i) for i in range(length)]
+        if row + length > size:
+            return []
+        return [(row + i, col) for i in range(length)]
+
+    def clear(self) -> None:
+        self.occupied.clear()
+
+    def copy(self) -> "SparseBoard":
+        return SparseBoard(self.size, self.occupied)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, SparseBoard):
+            return self.size == other.size and self.occupied == other.occupied
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"SparseBoard(size={self.size}, cells={self.count()})"
+
+
+class SparseShotBoard(_GridView):
+    """
+    Shot tracking board backed by a dict of shot cells -> HIT / MISS.
+    """
+
+    __slots__ = ("size", "marks", "_hits")
+
+    def __init__(self, size: int, marks=None):
+        self.size = size                             # Board is size x size
+        self.marks: Dict[Coord, int] = dict(marks or {})  # Only cells that were shot
+        self._hits = sum(1 for v in self.marks.values() if v == HIT)  # Running hit count
+
+    def get(self, row: int, col: int) -> int:
+        return self.marks.get((row, col), UNKNOWN)
+
+    def put(self, row: int, col: int, value: int) -> None:
+        cell = (row, col)
+        if self.marks.get(cell) == HIT:
+            self._hits -= 1
+        if value == UNKNOWN:
+            self.marks.pop(cell, None)
+            return
+        self.marks[cell] = value
+        if value == HIT:
+            self._hits += 1
+
+    def is_shot(self, row: int, col: int) -> bool:
+        return (row, col) in self.marks
+
+    def hit_count(self) -> int:
+        return self._hits
+
+    def miss_count(self) -> int:
+        return len(self.marks) - self._hits
+
+    def shot_count(self) -> int:
+        return len(self.marks)
+
+    def hit_cells(self) -> Iterator[Coord]:
+        return iter(sorted(cell for cell, v in self.marks.items() if v == HIT))
+
+    def miss_cells(self) -> Iterator[Coord]:
+        return iter(sorted(cell for cell, v in self.marks.items() if v == MISS))
+
+    def open_neighbours(self) -> Iterator[Coord]:
+        size = self.size
+        marks = self.marks
+        for (r, c), v in marks.items():
+            if v != HIT:
+                continue
+            for cell in ((r - 1, c), (r + 1, c), (r, c - 1), (r, c + 1)):
+                if 0 <= cell[0] < size and 0 <= cell[1] < size and cell not in marks:
+                    yield cell
+
+    def clear(self) -> None:
+        self.marks.clear()
+        self._hits = 0
+
+    def copy(self) -> "SparseShotBoard":
+        return SparseShotBoard(self.size, self.marks)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, SparseShotBoard):
+            return self.size == other.size and self.marks == other.marks
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"SparseShotBoard(size={self.size}, hits={self.hit_count()}, misses={self.miss_count()})"
@@ -0,0 +1,82 @@
+# game/stats.py
+# Battleship Project - Incremental per-player statistics
+# Created: 2026-10-17
+
+'''
+This file defines PlayerStats, a running scoreboard for one player.
+It holds that player's shooting record (shots, hits, misses, ships sunk) and the state of their own fleet
+(ships afloat and a "hits/length" counter per ship). game.rules.fire_shot updates the attacker's and defender's
+stats with a few integer additions per shot, so the battle scoreboard and the win screen read ready-made numbers
+instead of re-scanning boards and fleets on every refresh.
+'''
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from game.fleet import Fleet
+
+
+@dataclass
+class PlayerStats:
+    # Shooting record (this player firing at the opponent)
+    shots: int = 0
+    hits: int = 0
+    misses: int = 0
+    sinks: int = 0
+
+    # Own fleet (the opponent firing at this player)
+    ships_afloat: int = 0
+    ship_hits: List[int] = field(default_factory=list)     # hits taken per ship, in placement order
+    ship_lengths: List[int] = field(default_factory=list)  # length per ship, same order
+    _slot: Dict[int, int] = field(default_factory=dict, repr=False)  # fleet ship id -> list position
+
+    @classmethod
+    def for_fleet(cls, fleet: Fleet, shots_board=None, target_fleet: Optional[Fleet] = None) -> "PlayerStats":
+        """
+        Build stats for a player whose own ships are `fleet`.
+        Pass the player's shot board (and the opponent's fleet, for ships sunk) to pick up shots already fired,
+        e.g. in a resumed game; this is the only place that scans, and it runs once instead of on every refresh.
+        """
+        stats = cls()
+        for slot, (ship_id, (hits, length)) in enumerate(zip(fleet.ids(), fleet.hit_counts())):
+            stats._slot[ship_id] = slot
+            stats.ship_hits.append(hits)
+            stats.ship_lengths.append(length)
+        stats.ships_afloat = fleet.afloat
+
+        if shots_board is not None:
+            stats.hits = shots_board.hit_count()
+            stats.misses = shots_board.miss_count()
+            stats.shots = stats.hits + stats.misses
+        if target_fleet is not None:
+            stats.sinks = len(target_fleet) - target_fleet.afloat
+        return stats
+
+    # --- updates (called by game.rules.fire_shot) ---
+
+    def record_shot(self, hit: bool, sunk: bool) -> None:
+        """This player fired a shot."""
+        self.shots += 1
+        if hit:
+            self.hits += 1
+            if sunk:
+                self.sinks += 1
+        else:
+            self.misses += 1
+
+    def record_hit_taken(self, ship_id: int, sunk: bool) -> None:
+        """One of this player's ships was hit."""
+        self.ship_hits[self._slot[ship_id]] += 1
+        if sunk:
+            self.ships_afloat -= 1
+
+    # --- read side ---
+
+    @property
+    def accuracy(self) -> float:
+        """Hit percentage (0.0 before the first shot)."""
+        return self.hits / self.shots * 100 if self.shots else 0.0
+
+    def ship_counters(self) -> List[str]:
+        """["hits/length", ...] per ship in placement order, like rules.ship_hit_counters()."""
+        return [f"{hits}/{length}" for hits, length in zip(self.ship_hits, self.ship_lengths)]
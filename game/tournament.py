@@ -0,0 +1,275 @@
+# game/tournament.py
+# Battleship Project - Round-robin strategy tournament
+# Created: 2026-10-17
+
+'''
+This file plays a round-robin tournament between shot strategies registered in game.engine.SHOOTERS
+(any callable with the ShotStrategy signature can be added there) and rates them.
+Every pair of strategies plays the same number of games, half with each strategy firing first, on a process pool:
+games are cut into chunks, each worker plays a chunk with its own seeded RNG through play_game (game.rules
+underneath) and sends back a handful of counters, so a million games cost a few thousand tiny messages.
+
+For each strategy the report gives:
+    win rate         with a 95% Wilson score interval
+    shots to win     mean shots fired in the games it won, with a 95% normal interval
+    rating           Elo-scale Bradley-Terry rating fitted to all pairings, with a 95% interval
+Run from the project root, for example:
+
+    python -m game.tournament --games 1000000
+    python -m game.tournament --games 20000 --strategies hunt parity density
+'''
+
+import argparse
+import math
+import os
+import random
+import time
+from dataclasses import dataclass, field
+from itertools import combinations
+from multiprocessing import Pool
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from game.board import GRID_SIZE
+from game.engine import SHOOTERS, get_shooter, play_game, shooter_names
+from game.simulate import _chunks, _placer
+
+Z95 = 1.959964          # Two-sided 95% normal quantile
+ELO_BASE = 1500.0       # Rating given to the geometric-mean strategy
+ELO_SCALE = 400.0 / math.log(10)  # Bradley-Terry log-strength -> Elo points
+PRIOR_GAMES = 1.0       # Virtual drawn game per pairing, keeps ratings finite when one side never wins
+
+
+@dataclass
+class PairResult:
+    """All games between two strategies (a and b in tournament order)."""
+    a: str
+    b: str
+    games: int = 0
+    a_wins: int = 0
+    a_win_shots: int = 0       # shots a fired in the games a won
+    a_win_shots_sq: int = 0    # sum of squares, for the interval on the mean
+    b_win_shots: int = 0
+    b_win_shots_sq: int = 0
+
+    @property
+    def b_wins(self) -> int:
+        return self.games - self.a_wins
+
+
+@dataclass
+class StrategyResult:
+    name: str
+    games: int
+    wins: int
+    win_rate: float
+    win_rate_ci: Tuple[float, float]
+    avg_shots_to_win: float
+    shots_ci: float            # half-width of the 95% interval
+    rating: float
+    rating_ci: float           # half-width of the 95% interval
+
+
+@dataclass
+class TournamentResult:
+    strategies: List[StrategyResult]     # Best rating first
+    pairs: List[PairResult] = field(repr=False)
+    games: int = 0
+    seconds: float = 0.0
+
+    @property
+    def games_per_sec(self) -> float:
+        return self.games / self.seconds if self.seconds > 0 else 0.0
+
+    def summary(self) -> str:
+        lines = [
+            f"{self.games:,} games in {self.seconds:.1f}s ({self.games_per_sec:,.0f} games/sec)",
+            f"{'strategy':<10} {'rating':^14} {'win rate (95% CI)':^22} {'shots to win':^16}",
+        ]
+        for s in self.strategies:
+            low, high = s.win_rate_ci
+            lines.append(
+                f"{s.name:<10} {s.rating:7.0f} ± {s.rating_ci:<4.0f} "
+                f"{s.win_rate * 100:6.2f}% [{low * 100:5.2f}, {high * 100:5.2f}] "
+                f"{s.avg_shots_to_win:8.2f} ± {s.shots_ci:.2f}"
+            )
+        lines.append("head to head (row strategy's win rate):")
+        for p in self.pairs:
+            lines.append(f"  {p.a} vs {p.b}: {p.a_wins / p.games * 100:.2f}% of {p.games:,}")
+        return "\n".join(lines)
+
+
+def _play_pairing(args: Tuple[str, str, int, int, int, int]) -> Tuple[str, str, int, int, int, int, int, int]:
+    """
+    Worker: play `count` games of `first` (Player 1) against `second`.
+    Returns (first, second, first_wins, second_wins, first_win_shots, first_win_shots_sq,
+    second_win_shots, second_win_shots_sq).
+    """
+    first, second, num_ships, size, count, seed = args
+    shooter1 = get_shooter(first)
+    shooter2 = get_shooter(second)
+    rng = random.Random(seed)
+    placer = _placer(seed)
+
+    wins1 = wins2 = shots1 = sq1 = shots2 = sq2 = 0
+    for _ in range(count):
+        result = play_game(shooter1, shooter2, num_ships, rng, placer, placer, size)
+        if result.winner == 1:
+            wins1 += 1
+            shots1 += result.p1_shots
+            sq1 += result.p1_shots * result.p1_shots
+        else:
+            wins2 += 1
+            shots2 += result.p2_shots
+            sq2 += result.p2_shots * result.p2_shots
+    return first, second, wins1, wins2, shots1, sq1, shots2, sq2
+
+
+def wilson_interval(wins: int, games: int, z: float = Z95) -> Tuple[float, float]:
+    """Wilson score interval for a win rate (well behaved near 0% and 100%)."""
+    if games == 0:
+        return 0.0, 1.0
+    p = wins / games
+    denom = 1 + z * z / games
+    centre = (p + z * z / (2 * games)) / denom
+    spread = z * math.sqrt(p * (1 - p) / games + z * z / (4 * games * games)) / denom
+    return max(0.0, centre - spread), min(1.0, centre + spread)
+
+
+def fit_ratings(names: Sequence[str], pairs: Sequence[PairResult],
+                iterations: int = 1000) -> Dict[str, Tuple[float, float]]:
+    """
+    Bradley-Terry strengths fitted with Hunter's MM iteration, returned as name -> (Elo rating, 95% half-width).
+    Each pairing gets PRIOR_GAMES virtual drawn games so a strategy that never wins still gets a finite rating.
+    Intervals come from the Fisher information of each strength with the others held fixed.
+    """
+    wins = {n: 0.0 for n in names}
+    played: Dict[Tuple[str, str], float] = {}
+    for p in pairs:
+        wins[p.a] += p.a_wins + PRIOR_GAMES / 2
+        wins[p.b] += p.b_wins + PRIOR_GAMES / 2
+        played[(p.a, p.b)] = played[(p.b, p.a)] = p.games + PRIOR_GAMES
+
+    strength = {n: 1.0 for n in names}
+    for _ in range(iterations):
+        changed = 0.0
+        for n in names:
+            denom = sum(games / (strength[n] + strength[m])
+                        for (i, m), games in played.items() if i == n)
+            new = wins[n] / denom if denom else strength[n]
+            changed = max(changed, abs(math.log(new / strength[n])))
+            strength[n] = new
+        mean_log = sum(math.log(s) for s in strength.values()) / len(names)
+        strength = {n: s / math.exp(mean_log) for n, s in strength.items()}  # Geometric mean 1 = ELO_BASE
+        if changed < 1e-10:
+            break
+
+    ratings = {}
+    for n in names:
+        information = 0.0
+        for (i, m), games in played.items():
+            if i == n:
+                p = strength[n] / (strength[n] + strength[m])
+                information += games * p * (1 - p)
+        half_width = Z95 * ELO_SCALE / math.sqrt(information) if information else math.inf
+        ratings[n] = (ELO_BASE + ELO_SCALE * math.log(strength[n]), half_width)
+    return ratings
+
+
+def run_tournament(
+    games: int,
+    strategies: Optional[Sequence[str]] = None,
+    num_ships: int = 5,
+    size: int = GRID_SIZE,
+    workers: Optional[int] = None,
+    seed: int = 0,
+    chunk_size: int = 1000,
+) -> TournamentResult:
+    """
+    Play about `games` games in total, split evenly over every pairing and both seatings.
+    strategies defaults to every strategy in engine.SHOOTERS (lazily loaded ones such as perfect must be named);
+    workers=None uses every CPU, workers=1 runs in-process.
+    """
+    names = list(dict.fromkeys(strategies)) if strategies else list(SHOOTERS)  # Duplicates entered once
+    for name in names:
+        if name not in shooter_names():
+            raise ValueError(f"Unknown strategy {name!r}. Choose from: {', '.join(shooter_names())}")
+    if len(names) < 2:
+        raise ValueError("A tournament needs at least two different strategies")
+
+    pairings = list(combinations(names, 2))
+    per_seating = max(1, games // (2 * len(pairings)))
+    tasks = []
+    for a, b in pairings:
+        for first, second in ((a, b), (b, a)):
+            for count in _chunks(per_seating, chunk_size):
+                tasks.append((first, second, num_ships, size, count, seed * 1_000_003 + len(tasks)))
+
+    start = time.perf_counter()
+    if workers == 1:
+        results = _merge(pairings, map(_play_pairing, tasks))
+    else:
+        with Pool(processes=workers or os.cpu_count()) as pool:
+            results = _merge(pairings, pool.imap_unordered(_play_pairing, tasks, chunksize=1))
+    elapsed = time.perf_counter() - start
+
+    pairs = list(results.values())
+    ratings = fit_ratings(names, pairs)
+    table = []
+    for name in names:
+        played = wins = win_shots = win_sq = 0
+        for p in pairs:
+            if name == p.a:
+                played, wins = played + p.games, wins + p.a_wins
+                win_shots, win_sq = win_shots + p.a_win_shots, win_sq + p.a_win_shots_sq
+            elif name == p.b:
+                played, wins = played + p.games, wins + p.b_wins
+                win_shots, win_sq = win_shots + p.b_win_shots, win_sq + p.b_win_shots_sq
+        mean = win_shots / wins if wins else 0.0
+        variance = win_sq / wins - mean * mean if wins else 0.0
+        rating, rating_ci = ratings[name]
+        table.append(StrategyResult(
+            name=name, games=played, wins=wins,
+            win_rate=wins / played if played else 0.0, win_rate_ci=wilson_interval(wins, played),
+            avg_shots_to_win=mean, shots_ci=Z95 * math.sqrt(max(variance, 0.0) / wins) if wins else 0.0,
+            rating=rating, rating_ci=rating_ci,
+        ))
+    table.sort(key=lambda s: s.rating, reverse=True)
+    return TournamentResult(strategies=table, pairs=pairs, games=sum(p.games for p in pairs), seconds=elapsed)
+
+
+def _merge(pairings, chunks) -> Dict[Tuple[str, str], PairResult]:
+    # Fold worker counters into one PairResult per unordered pairing, as they arrive
+    results = {(a, b): PairResult(a, b) for a, b in pairings}
+    for first, second, wins1, wins2, shots1, sq1, shots2, sq2 in chunks:
+        if (first, second) in results:
+            p = results[(first, second)]
+            p.a_wins += wins1
+            p.a_win_shots, p.a_win_shots_sq = p.a_win_shots + shots1, p.a_win_shots_sq + sq1
+            p.b_win_shots, p.b_win_shots_sq = p.b_win_shots + shots2, p.b_win_shots_sq + sq2
+        else:  # Reversed seating: the second player is pairing.a
+            p = results[(second, first)]
+            p.a_wins += wins2
+            p.a_win_shots, p.a_win_shots_sq = p.a_win_shots + shots2, p.a_win_shots_sq + sq2
+            p.b_win_shots, p.b_win_shots_sq = p.b_win_shots + shots1, p.b_win_shots_sq + sq1
+        p.games += wins1 + wins2
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Round-robin tournament between Battleship shot strategies.")
+    parser.add_argument("--games", type=int, default=100_000, help="total games, split evenly over all pairings")
+    parser.add_argument("--strategies", nargs="+", default=None, choices=sorted(shooter_names()),
+                        help=f"strategies to enter (default: {' '.join(SHOOTERS)})")
+    parser.add_argument("--ships", type=int, default=5, help="number of ships (1..N lengths)")
+    parser.add_argument("--size", type=int, default=GRID_SIZE, help="grid size (board is size x size)")
+    parser.add_argument("--workers", type=int, default=None, help="processes (default: all CPUs)")
+    parser.add_argument("--seed", type=int, default=0, help="base RNG seed")
+    parser.add_argument("--chunk", type=int, default=1000, help="games per worker task")
+    args = parser.parse_args(argv)
+
+    result = run_tournament(args.games, args.strategies, args.ships, args.size, args.workers, args.seed, args.chunk)
+    print(result.summary())
+
+
+if __name__ == "__main__":
+    main()
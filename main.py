@@ -10,7 +10,6 @@ Battleship/
   game/
     __init__.py
     game_board.py
-    game_models.py
     ships.py
     rules.py        
     coords.py       
@@ -31,6 +30,11 @@ The if __name__ == "__main__" guard ensures the app only launches when this file
 #
 # Created: 2026-02-06
 
+import sys
+import time
+
+_LAUNCHED = time.perf_counter()  # Taken before the app imports, so the startup report includes them
+
 from app.ui_app import App
 
 def main():
@@ -40,8 +44,12 @@ def main():
     Creates the main App instance and starts the Tkinter
     event loop, which keeps the window running until the
     user closes the application.
+
+    Run with --startup-report to print import / first-paint timings,
+    and with --ui-timings to record UI handler durations from launch (View → Show UI Timings).
     """
-    app = App()
+    report = "--startup-report" in sys.argv[1:]
+    app = App(started=_LAUNCHED if report else None, timings="--ui-timings" in sys.argv[1:])
     app.mainloop()
 
 